@@ -12,6 +12,10 @@ Modules:
     viewport_hud: Realtime performance HUD overlay in the 3D viewport
     exporters: Export profiling results to JSON/CSV for CI
     depsgraph_tracker: Track dependency graph update frequency
+    benchmark_io: Time DNA imports with a per stage breakdown
+    benchmark_export: Time DNA exports with a per stage breakdown
+    benchmark_uv_split: Time splitting the LOD0 meshes along their UV islands
+    benchmark_blend_shapes: Compare the shape key and sparse blend shape evaluation modes
 
 Usage:
     # Run benchmarks from Blender
@@ -37,6 +41,10 @@ from __future__ import annotations
 
 # Submodule aliases for convenient access
 from . import depsgraph_tracker as depsgraph, exporters, viewport_hud as hud
+from .benchmark_blend_shapes import benchmark_blend_shape_mode
+from .benchmark_export import benchmark_export
+from .benchmark_io import benchmark_import, time_methods
+from .benchmark_uv_split import benchmark_uv_split
 from .depsgraph_tracker import (
     DepsgraphStats,
     DepsgraphTracker,
@@ -71,6 +79,10 @@ __all__ = [
     "RigEvaluationProfiler",
     "RigLogicStats",
     "TimingResult",
+    "benchmark_blend_shape_mode",
+    "benchmark_export",
+    "benchmark_import",
+    "benchmark_uv_split",
     "compare_snapshots",
     "depsgraph",
     "export_csv",
@@ -85,4 +97,5 @@ __all__ = [
     "run_profiler",
     "start_tracking",
     "stop_tracking",
+    "time_methods",
 ]
@@ -0,0 +1,180 @@
+"""
+Blend Shape Evaluation Benchmarks for MetaHuman DNA Addon.
+
+This script compares the two head blend shape evaluation modes of a rig instance:
+- shape_keys: rig logic outputs are pushed into the imported shape key blocks
+- sparse: rig logic outputs are applied to the DNA deltas as one sparse matrix-vector product
+
+For each mode it reports the memory held by the blend shape data and the per frame time
+spent pushing the rig logic outputs, and updating the dependency graph afterwards.
+
+Usage:
+    blender --background --python scripts/profiling_utils/benchmark_blend_shapes.py -- --iterations 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from meta_human_dna.rig_instance import RigInstance
+    from profiling_utils.profile_rig_evaluation import TimingResult
+
+
+# Setup paths
+SCRIPT_DIR = Path(__file__).parent
+ADDON_ROOT = SCRIPT_DIR.parent.parent
+SCRIPTS_PATH = ADDON_ROOT / "scripts"
+
+if str(SCRIPTS_PATH) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_PATH))
+
+
+def get_shape_key_memory(instance: RigInstance) -> int:
+    """Get the bytes held by the vertex positions of the head shape key blocks."""
+    total = 0
+    for mesh_object in instance.head_mesh_index_lookup.values():
+        shape_keys = mesh_object.data.shape_keys
+        if shape_keys:
+            total += sum(len(key_block.data) * 3 * 4 for key_block in shape_keys.key_blocks)
+    return total
+
+
+def get_sparse_memory(instance: RigInstance) -> int:
+    """Get the bytes held by the sparse blend shape matrices of the head."""
+    return sum(blend_shapes.nbytes for blend_shapes in instance.head_sparse_blend_shapes.values())
+
+
+def set_random_raw_controls(instance: RigInstance, rng: random.Random, active_count: int) -> None:
+    """Set a random subset of the head raw controls and run rig logic."""
+    control_count = instance.head_dna_reader.getRawControlCount()
+    for index in range(control_count):
+        instance.head_instance.setRawControl(index, 0.0)
+    for index in rng.sample(range(control_count), min(active_count, control_count)):
+        instance.head_instance.setRawControl(index, rng.random())
+    instance.head_manager.calculate(instance.head_instance)
+
+
+def benchmark_blend_shape_mode(
+    instance: RigInstance,
+    mode: str,
+    iterations: int = 100,
+    active_count: int = 30,
+    seed: int = 0,
+) -> dict[str, TimingResult]:
+    """
+    Benchmark evaluating the head blend shapes with the given mode.
+
+    Args:
+        instance: The rig instance to evaluate.
+        mode: The head shape key evaluation mode.
+        iterations: The number of frames to evaluate.
+        active_count: The number of raw controls that are set each frame.
+        seed: The seed of the random raw control values, so each mode evaluates the same frames.
+
+    Returns:
+        The timings of pushing the blend shape outputs and updating the view layer.
+    """
+    import bpy
+
+    from profiling_utils.profile_rig_evaluation import TimingResult
+
+    instance.head_shape_key_evaluation_mode = mode
+    push = TimingResult(f"{mode}_push")
+    depsgraph = TimingResult(f"{mode}_depsgraph")
+    rng = random.Random(seed)  # noqa: S311
+
+    for _ in range(iterations):
+        set_random_raw_controls(instance, rng, active_count)
+
+        start = time.perf_counter_ns()
+        instance.update_head_shape_keys()
+        push.add(time.perf_counter_ns() - start)
+
+        start = time.perf_counter_ns()
+        bpy.context.view_layer.update()
+        depsgraph.add(time.perf_counter_ns() - start)
+
+    return {push.name: push, depsgraph.name: depsgraph}
+
+
+def remove_head_shape_keys(instance: RigInstance) -> None:
+    """Remove the shape keys from the head meshes so the sparse mode evaluates all of them."""
+    for mesh_object in instance.head_mesh_index_lookup.values():
+        if mesh_object.data.shape_keys:
+            mesh_object.shape_key_clear()
+    instance.destroy()
+    instance.head_initialize()
+
+
+def print_results(results: dict[str, TimingResult], memory: dict[str, int]) -> None:
+    """Print the timing and memory results as a table."""
+    print("\n" + "=" * 64)
+    print("HEAD BLEND SHAPE EVALUATION")
+    print("=" * 64)
+    for name, size in memory.items():
+        print(f"{name:<32}{size / (1024 * 1024):>12.2f} MB")
+    print("-" * 64)
+    print(f"{'Stage':<32}{'Mean (ms)':>12}{'P95 (ms)':>10}{'Max (ms)':>10}")
+    for name, result in results.items():
+        print(f"{name:<32}{result.mean_ms:>12.3f}{result.p95_ms:>10.3f}{result.max_ms:>10.3f}")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    try:
+        idx = sys.argv.index("--")
+        args = sys.argv[idx + 1 :]
+    except ValueError:
+        args = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description="Blend Shape Evaluation Benchmarks")
+    parser.add_argument("--iterations", type=int, default=100, help="Number of frames to evaluate per mode")
+    parser.add_argument("--active-controls", type=int, default=30, help="Number of raw controls set per frame")
+    parser.add_argument(
+        "--dna-file",
+        type=str,
+        default="tests/test_files/dna/ada/head.dna",
+        help="Path to the DNA file to benchmark (relative to the repo root)",
+    )
+    return parser.parse_args(args)
+
+
+def main() -> int:
+    from profiling_utils.ci_benchmark import load_dna_file, setup_environment
+    from profiling_utils.profile_rig_evaluation import get_active_rig_instance
+
+    args = parse_args()
+    if not setup_environment():
+        return 1
+
+    if not load_dna_file(args.dna_file, import_shape_keys=True):
+        return 1
+
+    instance = get_active_rig_instance()
+    if not instance:
+        print("ERROR: No rig instance found")
+        return 1
+    instance.head_initialize()
+
+    results = {}
+    memory = {"shape_keys": get_shape_key_memory(instance)}
+    results.update(benchmark_blend_shape_mode(instance, "shape_keys", args.iterations, args.active_controls))
+
+    remove_head_shape_keys(instance)
+    memory["sparse"] = get_sparse_memory(instance)
+    results.update(benchmark_blend_shape_mode(instance, "sparse", args.iterations, args.active_controls))
+
+    print_results(results, memory)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""
+DNA Export Benchmarks for MetaHuman DNA Addon.
+
+This script imports a head DNA file, then times exporting it back to DNA end to end,
+along with a per stage breakdown of the DNAExporter methods, so changes to mesh
+extraction can be compared before and after on the same machine.
+
+Usage:
+    # Benchmark exporting the full head
+    blender --background --python scripts/profiling_utils/benchmark_export.py -- --iterations 5
+
+    # Benchmark a different DNA file
+    blender --background --python scripts/profiling_utils/benchmark_export.py -- --dna-file path/to/head.dna
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from meta_human_dna.rig_instance import RigInstance
+    from profiling_utils.profile_rig_evaluation import TimingResult
+
+
+# Setup paths
+SCRIPT_DIR = Path(__file__).parent
+ADDON_ROOT = SCRIPT_DIR.parent.parent
+SCRIPTS_PATH = ADDON_ROOT / "scripts"
+
+if str(SCRIPTS_PATH) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_PATH))
+
+# The DNAExporter methods that are timed individually during an export
+EXPORT_STAGES = [
+    "get_split_mesh_export_data",
+    "get_mesh_export_data",
+    "get_bone_transforms",
+    "set_dna_vertex_positions",
+    "set_dna_faces",
+    "set_dna_normals",
+    "set_dna_uvs",
+    "set_dna_vertex_colors",
+    "set_dna_vertex_groups",
+    "get_mesh_skin_weights",
+    "set_dna_skin_weights",
+    "save_images",
+    "copy_images",
+    "save_vertex_colors",
+]
+
+
+def benchmark_export(
+    instance: RigInstance,
+    output_folder: Path,
+    iterations: int = 3,
+) -> dict[str, TimingResult]:
+    """
+    Benchmark exporting the head of a rig instance to DNA.
+
+    Args:
+        instance: The rig instance to export.
+        output_folder: The folder the DNA file is exported to.
+        iterations: The number of times to export the head.
+
+    Returns:
+        The total export timing followed by the timing of each export stage.
+    """
+    from meta_human_dna import utilities
+    from meta_human_dna.dna_io import DNAExporter
+    from profiling_utils.benchmark_io import time_methods
+    from profiling_utils.profile_rig_evaluation import TimingResult
+
+    head = utilities.get_active_head()
+    total = TimingResult("export_dna")
+    instance.output_folder_path = str(output_folder)
+
+    with time_methods(DNAExporter, EXPORT_STAGES) as stage_results:
+        for _ in range(iterations):
+            start = time.perf_counter_ns()
+            exporter = DNAExporter(
+                instance=instance,
+                linear_modifier=head.linear_modifier,  # type: ignore[union-attr]
+                file_name="head.dna",
+                component_type="head",
+                textures=False,
+            )
+            valid, title, message, _ = exporter.run()
+            total.add(time.perf_counter_ns() - start)
+            if not valid:
+                print(f"ERROR: {title}: {message}")
+                break
+
+    return {"export_dna": total, **stage_results}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    try:
+        idx = sys.argv.index("--")
+        args = sys.argv[idx + 1 :]
+    except ValueError:
+        args = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description="DNA Export Benchmarks")
+    parser.add_argument("--iterations", type=int, default=3, help="Number of benchmark iterations")
+    parser.add_argument(
+        "--dna-file",
+        type=str,
+        default="tests/test_files/dna/ada/head.dna",
+        help="Path to the DNA file to benchmark (relative to the repo root)",
+    )
+    return parser.parse_args(args)
+
+
+def main() -> int:
+    from profiling_utils.benchmark_io import print_results
+    from profiling_utils.ci_benchmark import load_dna_file, setup_environment
+    from profiling_utils.profile_rig_evaluation import get_active_rig_instance
+
+    args = parse_args()
+    if not setup_environment():
+        return 1
+
+    if not load_dna_file(args.dna_file):
+        return 1
+
+    instance = get_active_rig_instance()
+    if not instance:
+        print("ERROR: No rig instance found")
+        return 1
+
+    with tempfile.TemporaryDirectory() as output_folder:
+        results = benchmark_export(instance=instance, output_folder=Path(output_folder), iterations=args.iterations)
+    print_results(f"Export {Path(args.dna_file).name} ({args.iterations} iterations)", results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
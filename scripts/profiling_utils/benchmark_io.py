@@ -0,0 +1,193 @@
+"""
+DNA Import Benchmarks for MetaHuman DNA Addon.
+
+This script times the DNA import pipeline end to end, along with a per stage
+breakdown of the DNAImporter methods, so changes to mesh construction can be
+compared before and after on the same machine.
+
+Usage:
+    # Benchmark importing all 8 head LODs
+    blender --background --python scripts/profiling_utils/benchmark_io.py -- --iterations 5
+
+    # Benchmark a different DNA file with only LOD0
+    blender --background --python scripts/profiling_utils/benchmark_io.py -- --dna-file path/to/head.dna --lods 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from profiling_utils.profile_rig_evaluation import TimingResult
+
+
+# Setup paths
+SCRIPT_DIR = Path(__file__).parent
+ADDON_ROOT = SCRIPT_DIR.parent.parent
+SCRIPTS_PATH = ADDON_ROOT / "scripts"
+
+if str(SCRIPTS_PATH) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_PATH))
+
+# The DNAImporter methods that are timed individually during an import
+IMPORT_STAGES = [
+    "load_mesh",
+    "decode_mesh",
+    "get_dna_skin_weights",
+    "import_bones",
+    "create_mesh_object",
+    "set_mesh_vertex_positions",
+    "set_mesh_face_layout",
+    "set_mesh_uvs",
+    "set_mesh_normals",
+    "set_vertex_colors",
+    "set_vertex_groups",
+]
+
+
+@contextmanager
+def time_methods(cls: type, method_names: list[str]) -> Generator[dict[str, TimingResult], None, None]:
+    """
+    Temporarily wraps the given methods of a class with timers.
+
+    Args:
+        cls: The class to patch.
+        method_names: The names of the methods to time.
+
+    Yields:
+        A dictionary of timing results keyed by method name.
+    """
+    from profiling_utils.profile_rig_evaluation import TimingResult
+
+    results = {name: TimingResult(name) for name in method_names}
+    originals = {name: getattr(cls, name) for name in method_names if hasattr(cls, name)}
+
+    def make_wrapper(name: str, original):  # noqa: ANN001, ANN202
+        def wrapper(*args, **kwargs):  # noqa: ANN002, ANN003, ANN202
+            start = time.perf_counter_ns()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                results[name].add(time.perf_counter_ns() - start)
+
+        return wrapper
+
+    for name, original in originals.items():
+        setattr(cls, name, make_wrapper(name, original))
+    try:
+        yield results
+    finally:
+        for name, original in originals.items():
+            setattr(cls, name, original)
+
+
+def clear_scene() -> None:
+    """Reset to an empty scene, keeping the enabled addons."""
+    import bpy
+
+    bpy.ops.wm.read_homefile(use_empty=True)
+
+
+def benchmark_import(
+    dna_path: Path,
+    iterations: int = 3,
+    lod_count: int = 8,
+    include_body: bool = False,
+) -> dict[str, TimingResult]:
+    """
+    Benchmark importing a DNA file.
+
+    Args:
+        dna_path: The path to the DNA file to import.
+        iterations: The number of times to import the file.
+        lod_count: The number of LODs to import, starting from LOD0.
+        include_body: Whether to import the body.dna next to the head as well.
+
+    Returns:
+        The total import timing followed by the timing of each import stage.
+    """
+    import bpy
+
+    from meta_human_dna.dna_io import DNAImporter
+    from profiling_utils.profile_rig_evaluation import TimingResult
+
+    total = TimingResult("import_dna")
+    lod_options = {f"import_lod{i}": i < lod_count for i in range(8)}
+
+    with time_methods(DNAImporter, IMPORT_STAGES) as stage_results:
+        for _ in range(iterations):
+            clear_scene()
+            start = time.perf_counter_ns()
+            bpy.ops.meta_human_dna.import_dna(filepath=str(dna_path), include_body=include_body, **lod_options)
+            total.add(time.perf_counter_ns() - start)
+
+    return {"import_dna": total, **stage_results}
+
+
+def print_results(title: str, results: dict[str, TimingResult]) -> None:
+    """Print the timing results as a table."""
+    print("\n" + "=" * 72)
+    print(title)
+    print("=" * 72)
+    print(f"{'Stage':<32}{'Calls':>8}{'Mean (ms)':>12}{'Total (ms)':>12}{'P95 (ms)':>8}")
+    print("-" * 72)
+    for name, result in results.items():
+        if not result.count:
+            continue
+        total_ms = sum(result.times_ns) / 1e6
+        print(f"{name:<32}{result.count:>8}{result.mean_ms:>12.3f}{total_ms:>12.3f}{result.p95_ms:>8.1f}")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    try:
+        idx = sys.argv.index("--")
+        args = sys.argv[idx + 1 :]
+    except ValueError:
+        args = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description="DNA Import Benchmarks")
+    parser.add_argument("--iterations", type=int, default=3, help="Number of benchmark iterations")
+    parser.add_argument(
+        "--dna-file",
+        type=str,
+        default="tests/test_files/dna/ada/head.dna",
+        help="Path to the DNA file to benchmark (relative to the repo root)",
+    )
+    parser.add_argument("--lods", type=int, default=8, help="Number of head LODs to import")
+    parser.add_argument("--include-body", action="store_true", help="Import the body.dna as well")
+    return parser.parse_args(args)
+
+
+def main() -> int:
+    from profiling_utils.ci_benchmark import setup_environment
+
+    args = parse_args()
+    if not setup_environment():
+        return 1
+
+    dna_path = ADDON_ROOT / args.dna_file
+    if not dna_path.exists():
+        print(f"ERROR: DNA file not found: {dna_path}")
+        return 1
+
+    results = benchmark_import(
+        dna_path=dna_path,
+        iterations=args.iterations,
+        lod_count=args.lods,
+        include_body=args.include_body,
+    )
+    print_results(f"Import {dna_path.name} ({args.lods} LODs, {args.iterations} iterations)", results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
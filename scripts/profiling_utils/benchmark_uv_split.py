@@ -0,0 +1,177 @@
+"""
+UV Seam Splitting Benchmarks for MetaHuman DNA Addon.
+
+This script times splitting the head and body LOD0 meshes along their UV islands, which
+is done for every mesh during a DNA export. The hashed implementation in the addon is
+compared against the previous list based implementation, and the split lookups of both
+are checked to be identical.
+
+Usage:
+    blender --background --python scripts/profiling_utils/benchmark_uv_split.py -- --iterations 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    import bmesh
+    import bpy
+
+    from profiling_utils.profile_rig_evaluation import TimingResult
+
+
+# Setup paths
+SCRIPT_DIR = Path(__file__).parent
+ADDON_ROOT = SCRIPT_DIR.parent.parent
+SCRIPTS_PATH = ADDON_ROOT / "scripts"
+
+if str(SCRIPTS_PATH) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_PATH))
+
+
+def legacy_split_mesh_along_uv_islands(bmesh_object: bmesh.types.BMesh) -> dict[int, int]:
+    """The previous implementation of split_mesh_along_uv_islands, which is quadratic in the number of seam verts."""
+    import bmesh
+
+    from bpy_extras.bmesh_utils import bmesh_linked_uv_islands
+
+    uv_layer = bmesh_object.loops.layers.uv.active
+    _uv_border_verts = []
+
+    if not uv_layer:
+        return {}
+
+    for island_faces in bmesh_linked_uv_islands(bmesh_object, uv_layer):
+        island_loops = [loop for face in island_faces for loop in face.loops]
+        for loop in island_loops:
+            loops = (loop, loop.link_loop_radial_next)
+            if (
+                loops[0] == loops[1]
+                or loops[1].face not in island_faces
+                or loops[0][uv_layer].uv != loops[1].link_loop_next[uv_layer].uv
+                or loops[1][uv_layer].uv != loops[0].link_loop_next[uv_layer].uv
+            ):
+                _uv_border_verts.append(loop.vert)
+
+    uv_border_edges = []
+    uv_border_verts = []
+    for edge in bmesh_object.edges:
+        if not edge.is_boundary and all(vert in _uv_border_verts for vert in edge.verts):
+            uv_border_edges.append(edge)
+            uv_border_verts.extend(list(edge.verts))
+
+    split = bmesh.ops.split_edges(bmesh_object, edges=uv_border_edges)
+
+    bmesh_object.verts.index_update()
+    bmesh_object.faces.index_update()
+    bmesh_object.verts.ensure_lookup_table()
+    bmesh_object.faces.ensure_lookup_table()
+
+    split_to_original_vert_lookup = {}
+    for edge in split["edges"]:
+        for vert in edge.verts:
+            for _vert in uv_border_verts:
+                if vert.co == _vert.co:
+                    split_to_original_vert_lookup[vert.index] = _vert.index
+
+    return split_to_original_vert_lookup
+
+
+def benchmark_uv_split(
+    mesh_object: bpy.types.Object,
+    iterations: int = 3,
+    include_legacy: bool = True,
+) -> dict[str, TimingResult]:
+    """
+    Benchmark splitting a mesh along its UV islands.
+
+    Args:
+        mesh_object: The mesh object to split. A new BMesh is split each iteration, so the mesh is not modified.
+        iterations: The number of times to split the mesh.
+        include_legacy: Whether to time the previous implementation and check that its output is identical.
+
+    Returns:
+        The timings of each implementation.
+    """
+    from meta_human_dna import utilities
+    from meta_human_dna.dna_io import DNAExporter
+    from profiling_utils.profile_rig_evaluation import TimingResult
+
+    implementations = {f"{mesh_object.name}_hashed": utilities.split_mesh_along_uv_islands}
+    if include_legacy:
+        implementations[f"{mesh_object.name}_legacy"] = legacy_split_mesh_along_uv_islands
+
+    results = {}
+    lookups = []
+    for name, split_mesh_along_uv_islands in implementations.items():
+        result = TimingResult(name)
+        for _ in range(iterations):
+            bmesh_object = DNAExporter.get_bmesh(mesh_object, rotation=0)
+            start = time.perf_counter_ns()
+            lookup = split_mesh_along_uv_islands(bmesh_object)
+            result.add(time.perf_counter_ns() - start)
+            bmesh_object.free()
+        results[name] = result
+        lookups.append(lookup)
+
+    if include_legacy and lookups[0] != lookups[1]:
+        print(f"ERROR: The split lookups of {mesh_object.name} do not match the legacy implementation")
+
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    try:
+        idx = sys.argv.index("--")
+        args = sys.argv[idx + 1 :]
+    except ValueError:
+        args = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description="UV Seam Splitting Benchmarks")
+    parser.add_argument("--iterations", type=int, default=3, help="Number of benchmark iterations")
+    parser.add_argument(
+        "--dna-file",
+        type=str,
+        default="tests/test_files/dna/ada/head.dna",
+        help="Path to the DNA file to benchmark (relative to the repo root)",
+    )
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the current implementation")
+    return parser.parse_args(args)
+
+
+def main() -> int:
+    from profiling_utils.benchmark_io import print_results
+    from profiling_utils.ci_benchmark import load_dna_file, setup_environment
+    from profiling_utils.profile_rig_evaluation import get_active_rig_instance
+
+    args = parse_args()
+    if not setup_environment():
+        return 1
+
+    if not load_dna_file(args.dna_file):
+        return 1
+
+    instance = get_active_rig_instance()
+    if not instance:
+        print("ERROR: No rig instance found")
+        return 1
+
+    results = {}
+    for mesh_object in (instance.head_mesh, instance.body_mesh):
+        if mesh_object:
+            results.update(benchmark_uv_split(mesh_object, args.iterations, include_legacy=not args.skip_legacy))
+
+    print_results(f"Split LOD0 meshes along UV islands ({args.iterations} iterations)", results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -87,6 +87,7 @@ classes = [
     operators.ImportComponentAnimation,
     operators.BakeFaceBoardAnimation,
     operators.BakeComponentAnimation,
+    operators.BakeAnimationQueue,
     operators.ImportShapeKeys,
     operators.TestSentry,
     operators.MigrateLegacyData,
@@ -622,25 +622,36 @@ class MetaHumanComponentBase(metaclass=ABCMeta):
 
         return mesh_object
 
-    def write_export_manifest(self):
+    def get_export_manifest(self) -> tuple[Path, dict[str, str]]:
         """
-        Writes the export manifest to a JSON file like MetaHuman Creator does for a DCC export.
+        Gets the file path and contents of the export manifest like MetaHuman Creator writes for a DCC export.
+
+        Returns:
+            tuple[Path, dict[str, str]]: The file path and the contents of the manifest.
         """
         from .. import bl_info
 
         file_path = Path(bpy.path.abspath(str(self.rig_instance.output_folder_path))) / "ExportManifest.json"
+        return file_path, {
+            "metaHumanName": self.name,
+            "exportBlenderAddonVersion": ".".join([str(i) for i in bl_info.get("version", [])]),
+            "exportPluginVersion": self.metadata.get("exportPluginVersion", "1.0.0"),
+            "exportEngineVersion": self.metadata.get("exportEngineVersion", "5.6.0-0+UE5"),
+            "exportedAt": datetime.now(tz=UTC).strftime("%Y.%m.%d-%H.%M.%S"),
+        }
+
+    @staticmethod
+    def save_export_manifest(file_path: Path, manifest: dict[str, str]):
+        """
+        Saves the export manifest to a JSON file. This does not access any blender data, so it can be run on a
+        worker thread.
+
+        Args:
+            file_path (Path): The file path of the manifest.
+            manifest (dict[str, str]): The contents of the manifest.
+        """
         with file_path.open("w") as file:
-            json.dump(
-                {
-                    "metaHumanName": self.name,
-                    "exportBlenderAddonVersion": ".".join([str(i) for i in bl_info.get("version", [])]),
-                    "exportPluginVersion": self.metadata.get("exportPluginVersion", "1.0.0"),
-                    "exportEngineVersion": self.metadata.get("exportEngineVersion", "5.6.0-0+UE5"),
-                    "exportedAt": datetime.now(tz=UTC).strftime("%Y.%m.%d-%H.%M.%S"),
-                },
-                file,
-                indent=4,
-            )
+            json.dump(manifest, file, indent=4)
 
     @preserve_context
     def constrain_head_to_body(self):
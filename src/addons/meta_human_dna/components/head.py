@@ -18,9 +18,10 @@ from ..constants import (
     EXTRA_BONES,
     HEAD_TOPOLOGY_VERTEX_GROUPS_FILE_PATH,
     IS_BLENDER_5,
+    SHAPE_KEY_IMPORT_BATCH_SIZE,
     TOPO_GROUP_PREFIX,
 )
-from ..dna_io import DNAExporter, create_shape_key
+from ..dna_io import DNAExporter, create_shape_keys
 from ..utilities import exclude_rig_instance_evaluation, preserve_context
 from .base import MetaHumanComponentBase
 
@@ -406,12 +407,24 @@ class MetaHumanComponentHead(MetaHumanComponentBase):
                         edit_bone.matrix = bone_matrix
 
     @utilities.exclude_rig_instance_evaluation
-    def import_shape_keys(self, commands_queue: queue.Queue) -> list:
+    def import_shape_keys(self, commands_queue: queue.Queue, channel_indices: set[int] | None = None) -> list:
         if not self.head_mesh_object:
             raise ValueError("Head mesh object not found!")
 
         commands = []
 
+        # the blend shape target indices to import for each mesh
+        mesh_target_indices = {}
+        for mesh_index in range(self.dna_reader.getMeshCount()):
+            target_indices = [
+                target_index
+                for target_index in range(self.dna_reader.getBlendShapeTargetCount(mesh_index))
+                if channel_indices is None
+                or self.dna_reader.getBlendShapeChannelIndex(mesh_index, target_index) in channel_indices
+            ]
+            if target_indices:
+                mesh_target_indices[mesh_index] = target_indices
+
         def get_initialize_kwargs(_: int, mesh_index: int) -> dict:
             mesh_dna_name = self.dna_reader.getMeshName(mesh_index)
             mesh_object = bpy.data.objects.get(f"{self.name}_{mesh_dna_name}")
@@ -420,42 +433,39 @@ class MetaHumanComponentHead(MetaHumanComponentBase):
             }
 
         def get_create_kwargs(index: int, mesh_index: int) -> dict:
-            channel_index = self.dna_reader.getBlendShapeChannelIndex(mesh_index, index)
-            shape_key_name = self.dna_reader.getBlendShapeChannelName(channel_index)
             mesh_dna_name = self.dna_reader.getMeshName(mesh_index)
             mesh_object = bpy.data.objects.get(f"{self.name}_{mesh_dna_name}")
             return {
-                "index": index,
+                "target_indices": mesh_target_indices[mesh_index][index : index + SHAPE_KEY_IMPORT_BATCH_SIZE],
                 "mesh_index": mesh_index,
                 "mesh_object": mesh_object,
                 "reader": self.dna_reader,
-                "name": shape_key_name,
                 "prefix": f"{mesh_dna_name}__",
                 "is_neutral": self.rig_instance.generate_neutral_shapes,
                 "linear_modifier": self.linear_modifier,
             }
 
-        for mesh_index in range(self.dna_reader.getMeshCount()):
-            count = self.dna_reader.getBlendShapeTargetCount(mesh_index)
-            if count > 0:
-                commands_queue.put(
-                    (
-                        0,
-                        mesh_index,
-                        "Initializing basis shape...",
-                        get_initialize_kwargs,
-                        lambda **kwargs: utilities.initialize_basis_shape_key(**kwargs),
-                    )
+        for mesh_index, target_indices in mesh_target_indices.items():
+            count = len(target_indices)
+            commands_queue.put(
+                (
+                    0,
+                    mesh_index,
+                    "Initializing basis shape...",
+                    get_initialize_kwargs,
+                    lambda **kwargs: utilities.initialize_basis_shape_key(**kwargs),
                 )
+            )
 
-            for index in range(count):
+            # create the shape keys in batches, so that the progress is still updated between them
+            for index in range(0, count, SHAPE_KEY_IMPORT_BATCH_SIZE):
                 commands_queue.put(
                     (
                         index,
                         mesh_index,
-                        f"{index}/{count}" + " {name} ...",
+                        f"{min(index + SHAPE_KEY_IMPORT_BATCH_SIZE, count)}/{count}" + " {prefix}...",
                         get_create_kwargs,
-                        lambda **kwargs: create_shape_key(**kwargs),
+                        lambda **kwargs: create_shape_keys(**kwargs),
                     )
                 )
 
@@ -1,4 +1,5 @@
 import math
+import os
 import tempfile
 
 from pathlib import Path
@@ -45,6 +46,8 @@ SHAPE_KEY_NAME_MAX_LENGTH = 63
 SHAPE_KEY_DELTA_THRESHOLD = 1e-6
 BONE_DELTA_THRESHOLD = 1e-3
 SHAPE_KEY_BASIS_NAME = "Basis"
+# the shape key that holds the result of the sparse head blend shape evaluation
+SPARSE_BLEND_SHAPES_SHAPE_KEY_NAME = "sparse_blend_shapes"
 BONE_TAIL_OFFSET = 1 / (SCALE_FACTOR * SCALE_FACTOR * 10)
 CUSTOM_BONE_SHAPE_SCALE = Vector([0.15] * 3)
 CUSTOM_BONE_SHAPE_NAME = "sphere_control"
@@ -55,9 +58,21 @@ BODY_TEXTURE_LOGIC_NODE_LABEL = "Body Texture Logic"
 UV_MAP_NAME = "DiffuseUV"
 VERTEX_COLOR_ATTRIBUTE_NAME = "Color"
 MESH_VERTEX_COLORS_FILE_NAME = "head_vertex_colors.json"
+MESH_VERTEX_COLORS_BINARY_FILE_NAME = "head_vertex_colors.npz"
 FLOATING_POINT_PRECISION = 0.0001
 DEFAULT_UV_TOLERANCE = 0.001
 DEFAULT_HEAD_MESH_VERTEX_POSITION_COUNT = 24408
+IMPORT_DECODE_THREAD_COUNT = min(8, os.cpu_count() or 1)
+EXPORT_THREAD_COUNT = min(4, os.cpu_count() or 1)
+SHAPE_KEY_IMPORT_BATCH_SIZE = 25
+# the default milliseconds of queued work that is run per timer tick, and how many times a second the UI redraws
+PROGRESS_QUEUE_TIME_BUDGET = 30
+PROGRESS_QUEUE_REDRAW_RATE = 10
+# the default megabytes of decoded DNA meshes kept on disk, and the version of their cache format
+IMPORT_CACHE_MAX_SIZE = 1024
+IMPORT_CACHE_VERSION = 2
+# the version of the fingerprints file kept for each exported DNA file
+EXPORT_FINGERPRINT_VERSION = 1
 RBF_SOLVER_POSTFIX = "_UERBFSolver"
 
 HEAD_MESH_SHADER_MAPPING = {
@@ -86,6 +101,8 @@ BASE_DNA_FOLDER = RESOURCES_FOLDER / "dna"
 UI_FOLDER = RESOURCES_FOLDER / "ui"
 
 DEFAULT_BACKUPS_FOLDER = TEMP_FOLDER / "backups"
+IMPORT_CACHE_FOLDER = TEMP_FOLDER / "import_cache"
+EXPORT_FINGERPRINTS_FOLDER = TEMP_FOLDER / "export_fingerprints"
 
 HEAD_TOPOLOGY_VERTEX_GROUPS_FILE_PATH = MAPPINGS_FOLDER / "head_topology_vertex_groups.json"
 
@@ -94,6 +111,7 @@ BODY_TOPOLOGY_VERTEX_GROUPS_FILE_PATH = MAPPINGS_FOLDER / "body_topology_vertex_
 HEAD_TO_BODY_EDGE_LOOP_FILE_PATH = MAPPINGS_FOLDER / "head_to_body_edge_loop.json"
 
 MESH_VERTEX_COLORS_FILE_PATH = MAPPINGS_FOLDER / MESH_VERTEX_COLORS_FILE_NAME
+MESH_VERTEX_COLORS_BINARY_FILE_PATH = MAPPINGS_FOLDER / MESH_VERTEX_COLORS_BINARY_FILE_NAME
 
 MASKS_TEXTURE_FILE_PATH = IMAGES_FOLDER / MASKS_TEXTURE
 
@@ -1,7 +1,25 @@
 from .calibrator import DNACalibrator
-from .exporter import DNAExporter
+from .exporter import BoneTransformsCache, DNAExporter
 from .importer import DNAImporter
-from .misc import create_shape_key, get_dna_reader, get_dna_writer
+from .misc import (
+    create_shape_key,
+    create_shape_keys,
+    get_dna_reader,
+    get_dna_writer,
+    load_vertex_colors,
+    save_vertex_colors,
+)
 
 
-__all__ = ["DNACalibrator", "DNAExporter", "DNAImporter", "create_shape_key", "get_dna_reader", "get_dna_writer"]
+__all__ = [
+    "BoneTransformsCache",
+    "DNACalibrator",
+    "DNAExporter",
+    "DNAImporter",
+    "create_shape_key",
+    "create_shape_keys",
+    "get_dna_reader",
+    "get_dna_writer",
+    "load_vertex_colors",
+    "save_vertex_colors",
+]
@@ -2,10 +2,14 @@
 import logging
 import math
 
+from collections import deque
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 
 # third party imports
 import bpy
+import numpy as np
 
 from mathutils import Matrix, Vector
 
@@ -14,6 +18,7 @@ from .. import utilities
 from ..bindings import riglogic  # pyright: ignore[reportAttributeAccessIssue]
 from ..constants import (
     BONE_DELTA_THRESHOLD,
+    EXPORT_THREAD_COUNT,
     HEAD_TO_BODY_LOD_MAPPING,
     SHAPE_KEY_BASIS_NAME,
     SHAPE_KEY_DELTA_THRESHOLD,
@@ -25,8 +30,41 @@ from .importer import DNAImporter
 
 logger = logging.getLogger(__name__)
 
+# the rotation from blender's Z-up to the DNA's Y-up. It is built once on import, so the shape key deltas
+# can be calculated on worker threads without touching mathutils
+Y_UP_ROTATION_MATRIX = np.array(Matrix.Rotation(math.radians(-90), 3, "X"), dtype=np.float32)  # type: ignore[arg-type]
+
+
+@dataclass
+class CalibrationContext:
+    """The lookup tables shared by every calibration stage, built once per run from the source DNA."""
+
+    # DNA joint name -> DNA joint index
+    joint_index_lookup: dict[str, int]
+    # DNA mesh name -> DNA mesh index
+    mesh_index_lookup: dict[str, int]
+    # DNA mesh index -> DNA mesh name
+    mesh_names: list[str]
+    # head LOD index -> head vertex index -> body vertex index, for the vertices on the neck seam
+    head_to_body_edge_loop_mapping: dict[str, dict[int, int]]
+    # body LOD index -> body vertex positions in the DNA's Y-up space, read the first time they are needed
+    body_vertex_positions: dict[int, np.ndarray] = field(default_factory=dict)
+
 
 class DNACalibrator(DNAExporter, DNAImporter):
+    _calibration_context: CalibrationContext
+
+    def get_calibration_context(self) -> CalibrationContext:
+        mesh_names = [self._dna_reader.getMeshName(index) for index in range(self._dna_reader.getMeshCount())]
+        return CalibrationContext(
+            joint_index_lookup={
+                self._dna_reader.getJointName(index): index for index in range(self._dna_reader.getJointCount())
+            },
+            mesh_index_lookup={mesh_name: index for index, mesh_name in enumerate(mesh_names)},
+            mesh_names=mesh_names,
+            head_to_body_edge_loop_mapping=utilities.get_head_to_body_edge_loop_mapping(),
+        )
+
     def _get_body_bone_lookups(self) -> tuple[dict, dict, dict, dict]:
         dna_body_bone_translation_lookup = {}
         dna_body_bone_rotation_lookup = {}
@@ -54,22 +92,26 @@ class DNACalibrator(DNAExporter, DNAImporter):
             body_dna_x_rotations = self._instance.body_dna_reader.getNeutralJointRotationXs()
             body_dna_y_rotations = self._instance.body_dna_reader.getNeutralJointRotationYs()
             body_dna_z_rotations = self._instance.body_dna_reader.getNeutralJointRotationZs()
+            body_joint_names = [
+                self._instance.body_dna_reader.getJointName(index)
+                for index in range(self._instance.body_dna_reader.getJointCount())
+            ]
             dna_body_bone_translation_lookup = {
-                self._instance.body_dna_reader.getJointName(index): Vector(
+                joint_name: Vector(
                     (body_dna_x_translations[index], body_dna_y_translations[index], body_dna_z_translations[index])
                 )
-                for index in range(self._instance.body_dna_reader.getJointCount())
+                for index, joint_name in enumerate(body_joint_names)
             }
             dna_body_bone_rotation_lookup = {
-                self._instance.body_dna_reader.getJointName(index): Vector(
+                joint_name: Vector(
                     (body_dna_x_rotations[index], body_dna_y_rotations[index], body_dna_z_rotations[index])
                 )
-                for index in range(self._instance.body_dna_reader.getJointCount())
+                for index, joint_name in enumerate(body_joint_names)
             }
 
             # Extract the body bone transforms from the scene
             indices, bone_names, _, _, translations, rotations = self.get_bone_transforms(
-                self._instance.body_rig, extra_bones=[]
+                self._instance.body_rig, extra_bones=[], cache=self._bone_transforms_cache
             )
 
             body_bone_translation_lookup = {
@@ -87,14 +129,14 @@ class DNACalibrator(DNAExporter, DNAImporter):
             body_bone_rotation_lookup,
         )
 
-    def _get_body_mesh_lookup(
-        self, lod_index: int, mesh_name: str, head_to_body_edge_loop_mapping: dict[str, dict[int, int]]
-    ) -> dict[int, Vector]:
+    def _get_body_mesh_lookup(self, lod_index: int, mesh_name: str) -> tuple[np.ndarray, np.ndarray]:
         # If this is the head, and the align head and body option is on, then we want to use the
         # exact same vertex positions for the body and head vertices where they overlap. This needs to
-        # be precised to the exact floating point value.
+        # be precised to the exact floating point value. The head vertex indices and their matching
+        # body vertex positions are returned as arrays so they can be applied with fancy indexing.
+        empty = (np.empty(0, dtype=np.int64), np.empty((0, 3), dtype=np.float64))
         if mesh_name != f"{self._instance.name}_head_lod{lod_index}_mesh":
-            return {}
+            return empty
 
         body_lod_index = HEAD_TO_BODY_LOD_MAPPING.get(lod_index)
         body_mesh_name = f"{self._instance.name}_body_lod{body_lod_index}_mesh"
@@ -105,44 +147,41 @@ class DNACalibrator(DNAExporter, DNAImporter):
             and self._instance.output_align_head_and_body
             and body_mesh_lod
         ):
-            bmesh_object = self.get_bmesh(body_mesh_lod)
-            vertex_indices, vertex_positions = self.get_mesh_vertex_positions(bmesh_object)
-            bmesh_object.free()
-            vert_lookup = dict(zip(vertex_indices, vertex_positions, strict=False))
-
-            try:
-                return {
-                    int(head_vertex_index): Vector(vert_lookup[body_vertex_index])
-                    for head_vertex_index, body_vertex_index in head_to_body_edge_loop_mapping.get(
-                        str(lod_index), {}
-                    ).items()
-                }
-            except KeyError as error:
+            # head LODs that share a body LOD reuse its positions
+            body_positions = self._calibration_context.body_vertex_positions.get(body_lod_index)  # type: ignore[arg-type]
+            if body_positions is None:
+                body_positions = self.get_mesh_vertex_position_array(body_mesh_lod.data)  # type: ignore[arg-type]
+                self._calibration_context.body_vertex_positions[body_lod_index] = body_positions  # type: ignore[index]
+            mapping = self._calibration_context.head_to_body_edge_loop_mapping.get(str(lod_index), {})
+            head_vertex_indices = np.fromiter((int(index) for index in mapping), dtype=np.int64)
+            body_vertex_indices = np.fromiter((int(index) for index in mapping.values()), dtype=np.int64)
+
+            missing = body_vertex_indices >= len(body_positions)
+            if missing.any():
                 logger.warning(
-                    f"Head to body vertex mapping not found for LOD {lod_index}: {error}. A vertex on "
+                    f"Head to body vertex mapping not found for LOD {lod_index}: "
+                    f"{body_vertex_indices[missing].tolist()}. A vertex on "
                     f"mesh {mesh_name} or {body_mesh_name} may have been deleted."
                 )
-        return {}
+                return empty
+
+            order = np.argsort(head_vertex_indices)
+            return head_vertex_indices[order], body_positions[body_vertex_indices[order]]
+        return empty
 
     def calibrate_vertex_positions(self):
         additional_meshes_by_lod = {}
-        mesh_index_lookup = {
-            self._dna_reader.getMeshName(index): index for index in range(self._dna_reader.getMeshCount())
-        }
-        head_to_body_edge_loop_mapping = utilities.get_head_to_body_edge_loop_mapping()
 
         for lod_index, mesh_objects in self._export_lods.items():
             logger.info(f"Calibrating LOD {lod_index} vertex positions...")
             for mesh_object, _ in mesh_objects:
-                body_mesh_lookup = self._get_body_mesh_lookup(
-                    lod_index=lod_index,
-                    mesh_name=mesh_object.name,
-                    head_to_body_edge_loop_mapping=head_to_body_edge_loop_mapping,
+                body_vertex_indices, body_vertex_positions = self._get_body_mesh_lookup(
+                    lod_index=lod_index, mesh_name=mesh_object.name
                 )
 
                 real_name = mesh_object.name.replace(f"{self._instance.name}_", "")
                 logger.info(f'Calibrating "{real_name}" vertex positions...')
-                mesh_index = mesh_index_lookup.get(real_name)
+                mesh_index = self._calibration_context.mesh_index_lookup.get(real_name)
 
                 # If the mesh index is not found, we assume that the mesh is not part of the DNA
                 # And we can add it to the additional meshes for this LOD
@@ -152,34 +191,131 @@ class DNACalibrator(DNAExporter, DNAImporter):
                     logger.warning(f'Mesh "{real_name}" not found in DNA. This mesh will not be calibrated...')
                     continue
 
-                bmesh_object = self.get_bmesh(mesh_object)
-                vertex_indices, vertex_positions = self.get_mesh_vertex_positions(bmesh_object)
-                bmesh_object.free()
-
-                # Read these from the DNA file and modify these arrays so that they match the vertex indices match
-                x_values = self._dna_reader.getVertexPositionXs(mesh_index)
-                y_values = self._dna_reader.getVertexPositionYs(mesh_index)
-                z_values = self._dna_reader.getVertexPositionZs(mesh_index)
-
-                for vertex_index in vertex_indices:
-                    # See if we can get the vertex position from the body mesh lookup first,
-                    # so that we have an exact match
-                    vertex_position = body_mesh_lookup.get(int(vertex_index), Vector(vertex_positions[vertex_index]))
-                    dna_vertex_position = Vector(
-                        (x_values[vertex_index], y_values[vertex_index], z_values[vertex_index])
+                mesh_fingerprint = self.get_mesh_fingerprint(mesh_object, body_vertex_indices, body_vertex_positions)
+                if self._fingerprints.is_unchanged("vertex_positions", mesh_object.name, mesh_fingerprint):
+                    logger.info(f'"{real_name}" vertex positions are unchanged since the last export. Skipping...')
+                    continue
+
+                vertex_positions = self.get_mesh_vertex_position_array(mesh_object.data)  # type: ignore[arg-type]
+                dna_vertex_positions = np.column_stack(
+                    (
+                        np.asarray(self._dna_reader.getVertexPositionXs(mesh_index), dtype=np.float64),
+                        np.asarray(self._dna_reader.getVertexPositionYs(mesh_index), dtype=np.float64),
+                        np.asarray(self._dna_reader.getVertexPositionZs(mesh_index), dtype=np.float64),
                     )
-                    delta = vertex_position - dna_vertex_position
-                    # This ensures that we only modify the vertex positions that are different to
-                    # avoid floating value drift
-                    if delta.length > 1e-6:
-                        x_values[vertex_index] = vertex_position.x
-                        y_values[vertex_index] = vertex_position.y
-                        z_values[vertex_index] = vertex_position.z
-
-                self._dna_writer.setVertexPositions(
-                    meshIndex=mesh_index,
-                    positions=[[x, y, z] for x, y, z in zip(x_values, y_values, z_values, strict=False)],
                 )
+                vertex_count = len(vertex_positions)
+                if vertex_count > len(dna_vertex_positions):
+                    logger.error(
+                        f'"{real_name}" has {vertex_count} vertices, but the DNA only has '
+                        f"{len(dna_vertex_positions)}. Its vertex positions will not be calibrated..."
+                    )
+                    continue
+
+                # Use the vertex positions from the body mesh where the head and body overlap,
+                # so that we have an exact match
+                in_range = body_vertex_indices < vertex_count
+                vertex_positions[body_vertex_indices[in_range]] = body_vertex_positions[in_range]
+
+                # This ensures that we only modify the vertex positions that are different to
+                # avoid floating value drift
+                deltas = vertex_positions - dna_vertex_positions[:vertex_count]
+                changed = np.einsum("ij,ij->i", deltas, deltas) > 1e-6**2
+                dna_vertex_positions[:vertex_count][changed] = vertex_positions[changed]
+                logger.debug(f'Calibrated {int(changed.sum())} of {vertex_count} "{real_name}" vertex positions')
+
+                self._dna_writer.setVertexPositions(meshIndex=mesh_index, positions=dna_vertex_positions.tolist())
+
+    @staticmethod
+    def get_shape_key_deltas(
+        shape_key_positions: np.ndarray,
+        basis_positions: np.ndarray,
+        linear_modifier: float,
+        rotation_matrix: np.ndarray = Y_UP_ROTATION_MATRIX,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the DNA blend shape target deltas of a shape key. This only uses numpy, so it is safe to call
+        from worker threads.
+
+        Args:
+            shape_key_positions (np.ndarray): The flat vertex positions of the shape key read with foreach_get.
+            basis_positions (np.ndarray): The flat vertex positions of the basis shape key read with foreach_get.
+            linear_modifier (float): The linear modifier for the scene units the deltas are converted from.
+            rotation_matrix (np.ndarray): The (3, 3) rotation matrix that converts the deltas to the DNA's Y-up.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The indices of the vertices that moved, and their (n, 3) deltas.
+        """
+        # DNA is Y-up, Blender is Z-up, so we need to rotate the deltas
+        deltas = (shape_key_positions.reshape(-1, 3) - basis_positions.reshape(-1, 3)) @ rotation_matrix.T
+
+        # Only modify the vertex positions that are different to avoid floating value drift
+        vertex_indices = np.flatnonzero(np.linalg.norm(deltas, axis=1) > SHAPE_KEY_DELTA_THRESHOLD)
+
+        # Apply the linear modifier for the scene units to the deltas
+        return vertex_indices, deltas[vertex_indices] / np.float32(linear_modifier)
+
+    @staticmethod
+    def get_changed_shape_key_deltas(
+        shape_key_positions: np.ndarray,
+        basis_positions: np.ndarray,
+        dna_vertex_indices: np.ndarray,
+        dna_deltas: np.ndarray,
+        linear_modifier: float,
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        Gets the DNA blend shape target deltas of a shape key, if they differ from the target already in the DNA.
+
+        Args:
+            shape_key_positions (np.ndarray): The flat vertex positions of the shape key read with foreach_get.
+            basis_positions (np.ndarray): The flat vertex positions of the basis shape key read with foreach_get.
+            dna_vertex_indices (np.ndarray): The vertex indices of the DNA blend shape target.
+            dna_deltas (np.ndarray): The (n, 3) deltas of the DNA blend shape target.
+            linear_modifier (float): The linear modifier for the scene units the deltas are converted from.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray] | None: The indices of the vertices that moved and their deltas,
+            or None if no delta differs from the DNA target by more than the shape key delta threshold.
+        """
+        vertex_indices, deltas = DNACalibrator.get_shape_key_deltas(
+            shape_key_positions, basis_positions, linear_modifier
+        )
+        vertex_count = len(basis_positions) // 3
+
+        # The DNA target can't be compared if it has deltas on vertices that were deleted from the mesh
+        if dna_vertex_indices.size and dna_vertex_indices.max() >= vertex_count:
+            return vertex_indices, deltas
+
+        # Scatter both sparse targets over every vertex, so a vertex whose delta is only just over the
+        # threshold on one side is compared by value rather than by whether it is in both index arrays
+        difference = np.zeros((vertex_count, 3), dtype=np.float32)
+        difference[vertex_indices] = deltas
+        difference[dna_vertex_indices] -= dna_deltas
+        if np.linalg.norm(difference, axis=1).max(initial=0) * linear_modifier > SHAPE_KEY_DELTA_THRESHOLD:
+            return vertex_indices, deltas
+        return None
+
+    def _write_shape_key_target(
+        self, mesh_index: int, target_index: int, future: Future[tuple[np.ndarray, np.ndarray] | None]
+    ) -> int | None:
+        changed_deltas = future.result()
+        # targets that match the DNA are left as they are, so they are not rewritten
+        if changed_deltas is None:
+            return None
+        return self.set_dna_shape_key_deltas(mesh_index, target_index, *changed_deltas)
+
+    def set_dna_shape_key_deltas(
+        self, mesh_index: int, target_index: int, vertex_indices: np.ndarray, deltas: np.ndarray
+    ) -> int:
+        # Set the vertex indices for the delta values array for the shape key
+        self._dna_writer.setBlendShapeTargetVertexIndices(
+            meshIndex=mesh_index, blendShapeTargetIndex=target_index, vertexIndices=vertex_indices.tolist()
+        )
+        # Set the actual delta value array for the shape key
+        self._dna_writer.setBlendShapeTargetDeltas(
+            meshIndex=mesh_index, blendShapeTargetIndex=target_index, deltas=deltas.tolist()
+        )
+        return len(vertex_indices)
 
     def calibrate_shape_keys(self):
         if self._component_type != "head":
@@ -187,6 +323,7 @@ class DNACalibrator(DNAExporter, DNAImporter):
             # currently, we only calibrate shape keys for the head component
             return
 
+        modified_count = 0
         for lod_index in range(self._dna_reader.getLODCount()):
             # Skip LODs without blend shape channels
             if len(self._dna_reader.getBlendShapeChannelIndicesForLOD(lod_index)) == 0:
@@ -195,7 +332,7 @@ class DNACalibrator(DNAExporter, DNAImporter):
             logger.info(f"Calibrating shape keys for {self._component_type} component LOD {lod_index}...")
 
             for mesh_index in self._dna_reader.getMeshIndicesForLOD(lod_index):
-                mesh_name = self._dna_reader.getMeshName(mesh_index)
+                mesh_name = self._calibration_context.mesh_names[mesh_index]
                 real_mesh_name = f"{self._prefix}_{mesh_name}"
                 mesh_object = bpy.data.objects.get(real_mesh_name)
                 if not mesh_object:
@@ -220,71 +357,92 @@ class DNACalibrator(DNAExporter, DNAImporter):
                         "This is needed for calibration!"
                     )
 
-                # helps to track the largest delta count for the shape keys
-                largest_delta_count = 0
-
-                # Get the vertex positions for the mesh object
-                bmesh_object = self.get_bmesh(mesh_object)
-                vertex_indices, _ = self.get_mesh_vertex_positions(bmesh_object)
-                bmesh_object.free()
+                # the delta count of each target that was checked, or None if it matched the DNA
+                delta_counts: list[int | None] = []
+                target_count = self._dna_reader.getBlendShapeTargetCount(mesh_index)
 
-                # DNA is Y-up, Blender is Z-up, so we need to rotate the deltas
-                rotation_matrix = Matrix.Rotation(math.radians(-90), 4, "X")  # type: ignore[arg-type]
-
-                for index in range(self._dna_reader.getBlendShapeTargetCount(mesh_index)):
-                    channel_index = self._dna_reader.getBlendShapeChannelIndex(mesh_index, index)
-                    shape_key_name = self._dna_reader.getBlendShapeChannelName(channel_index)
-
-                    # Currently, Blender has a limit of 63 characters for shape key names
-                    if len(f"{mesh_name}__{shape_key_name}") > SHAPE_KEY_NAME_MAX_LENGTH:
-                        continue
+                # the deltas of every shape key depend on the basis, so its fingerprint is part of theirs
+                vertex_count = len(shape_key_basis.data)
+                basis_positions = np.empty(vertex_count * 3, dtype=np.float32)
+                shape_key_basis.data.foreach_get("co", basis_positions)
+                basis_fingerprint = self._fingerprints.get_fingerprint(
+                    basis_positions, np.arange(vertex_count, dtype=np.int64)
+                )
 
-                    shape_key_block = mesh_object.data.shape_keys.key_blocks.get(f"{mesh_name}__{shape_key_name}")
-                    if not shape_key_block:
-                        logger.error(
-                            f"Shape key '{shape_key_name}' not found for mesh '{real_mesh_name}'. "
-                            "Skipping calibration..."
+                # The shape key data can only be read on the main thread, so the deltas of each target are
+                # computed by the workers while the next targets are read, then written in order. Only a few
+                # targets are kept in flight so the whole mesh's shape keys are never held in memory at once.
+                pending_targets: deque[tuple[int, Future[tuple[np.ndarray, np.ndarray] | None]]] = deque()
+                with ThreadPoolExecutor(max_workers=EXPORT_THREAD_COUNT) as executor:
+                    for index in range(target_count):
+                        channel_index = self._dna_reader.getBlendShapeChannelIndex(mesh_index, index)
+                        shape_key_name = self._dna_reader.getBlendShapeChannelName(channel_index)
+
+                        # Currently, Blender has a limit of 63 characters for shape key names
+                        if len(f"{mesh_name}__{shape_key_name}") > SHAPE_KEY_NAME_MAX_LENGTH:
+                            continue
+
+                        shape_key_block = mesh_object.data.shape_keys.key_blocks.get(f"{mesh_name}__{shape_key_name}")
+                        if not shape_key_block:
+                            logger.error(
+                                f"Shape key '{shape_key_name}' not found for mesh '{real_mesh_name}'. "
+                                "Skipping calibration..."
+                            )
+                            continue
+
+                        shape_key_positions = np.empty(vertex_count * 3, dtype=np.float32)
+                        shape_key_block.data.foreach_get("co", shape_key_positions)
+                        shape_key_fingerprint = self._fingerprints.get_fingerprint(
+                            shape_key_positions, basis_fingerprint
                         )
-                        continue
-
-                    dna_delta_vertex_indices = []
-                    dna_delta_values = []
+                        if self._fingerprints.is_unchanged("shape_keys", shape_key_block.name, shape_key_fingerprint):
+                            continue
 
-                    # the new shape key is the dna shape key with the deltas from the blender shape key applied
-                    for vertex_index in vertex_indices:
-                        # get the positions of the points
-                        # Get the delta between the current shape key and the basis (rest) shape key
-                        new_delta = rotation_matrix @ (
-                            shape_key_block.data[vertex_index].co.copy() - shape_key_basis.data[vertex_index].co  # type: ignore[attr-defined]
+                        dna_vertex_indices = np.asarray(
+                            self._dna_reader.getBlendShapeTargetVertexIndices(mesh_index, index), dtype=np.int64
                         )
+                        dna_deltas = np.column_stack(
+                            (
+                                np.asarray(self._dna_reader.getBlendShapeTargetDeltaXs(mesh_index, index), np.float32),
+                                np.asarray(self._dna_reader.getBlendShapeTargetDeltaYs(mesh_index, index), np.float32),
+                                np.asarray(self._dna_reader.getBlendShapeTargetDeltaZs(mesh_index, index), np.float32),
+                            )
+                        )
+                        pending_targets.append(
+                            (
+                                index,
+                                executor.submit(
+                                    self.get_changed_shape_key_deltas,
+                                    shape_key_positions,
+                                    basis_positions,
+                                    dna_vertex_indices,
+                                    dna_deltas,
+                                    self._linear_modifier,
+                                ),
+                            )
+                        )
+                        while len(pending_targets) > EXPORT_THREAD_COUNT * 2:
+                            delta_counts.append(self._write_shape_key_target(mesh_index, *pending_targets.popleft()))
 
-                        # Only modify the vertex positions that are different to avoid floating value drift
-                        if new_delta.length > SHAPE_KEY_DELTA_THRESHOLD:
-                            # Apply the coordinate system conversion and linear modifier for the
-                            # scene units to the delta
-                            converted_delta = new_delta / self._linear_modifier
-                            dna_delta_vertex_indices.append(vertex_index)
-                            dna_delta_values.append((converted_delta.x, converted_delta.y, converted_delta.z))
-
-                    largest_delta_count = max(largest_delta_count, len(dna_delta_vertex_indices))
-
-                    # Set the vertex indices for the delta values array for the shape key
-                    self._dna_writer.setBlendShapeTargetVertexIndices(
-                        meshIndex=mesh_index, blendShapeTargetIndex=index, vertexIndices=dna_delta_vertex_indices
-                    )
-                    # Set the actual delta value array for the shape key
-                    self._dna_writer.setBlendShapeTargetDeltas(
-                        meshIndex=mesh_index, blendShapeTargetIndex=index, deltas=dna_delta_values
-                    )
+                    while pending_targets:
+                        delta_counts.append(self._write_shape_key_target(mesh_index, *pending_targets.popleft()))
 
+                written_delta_counts = [count for count in delta_counts if count is not None]
+                largest_delta_count = max(written_delta_counts, default=0)
+                modified_count += len(written_delta_counts)
+                logger.info(
+                    f"Modified {len(written_delta_counts)} of {target_count} shape keys for mesh {real_mesh_name}"
+                )
                 logger.debug(f"Largest Shape Key delta count for mesh {real_mesh_name} is {largest_delta_count}")
 
+        logger.info(f"Modified {modified_count} shape keys for {self._component_type} component")
+
     def calibrate_vertex_groups(self):
         for lod_index in range(self._dna_reader.getLODCount()):
             logger.info(f"Calibrating vertex groups for {self._component_type} component LOD {lod_index}...")
 
             for mesh_index in self._dna_reader.getMeshIndicesForLOD(lod_index):
-                mesh_name = self._dna_reader.getMeshName(mesh_index)
+                mesh_name = self._calibration_context.mesh_names[mesh_index]
                 real_mesh_name = f"{self._prefix}_{mesh_name}"
                 mesh_object = bpy.data.objects.get(real_mesh_name)
                 if not mesh_object:
@@ -299,40 +457,32 @@ class DNACalibrator(DNAExporter, DNAImporter):
                     )
                     continue
 
+                offsets, joint_indices, weights = self.get_mesh_skin_weights(
+                    mesh_object, joint_index_lookup=self._calibration_context.joint_index_lookup
+                )
+                skin_weights_fingerprint = self._fingerprints.get_fingerprint(offsets, joint_indices, weights)
+                if self._fingerprints.is_unchanged("skin_weights", mesh_object.name, skin_weights_fingerprint):
+                    logger.info(f'"{mesh_name}" vertex groups are unchanged since the last export. Skipping...')
+                    continue
+
                 self._dna_writer.clearSkinWeights(meshIndex=mesh_index)
-                # Create a lookup table for the vertex group names by their index
-                vertex_group_lookup = {
-                    vertex_group.index: vertex_group.name for vertex_group in mesh_object.vertex_groups
-                }
-                # Create a lookup for bone indices by their names
-                bone_index_lookup = {
-                    self._dna_reader.getJointName(index): index for index in range(self._dna_reader.getJointCount())
-                }
-
-                # Loop through the vertices and get the vertex group names and the vertex and weights
-                for vertex in mesh_object.data.vertices:
-                    vertex_group_names = [vertex_group_lookup.get(group.group, "") for group in vertex.groups]
-                    bone_indices = []
-                    weights = []
-
-                    for vertex_group_name in vertex_group_names:
-                        bone_index = bone_index_lookup.get(vertex_group_name)
-                        vertex_group = mesh_object.vertex_groups.get(vertex_group_name)
-                        if bone_index is not None and vertex_group:
-                            weight = vertex_group.weight(vertex.index)
-                            bone_indices.append(bone_index)
-                            weights.append(weight)
-
-                    self._dna_writer.setSkinWeightsJointIndices(
-                        meshIndex=mesh_index, vertexIndex=vertex.index, jointIndices=bone_indices
-                    )
-                    self._dna_writer.setSkinWeightsValues(
-                        meshIndex=mesh_index, vertexIndex=vertex.index, weights=weights
-                    )
+                self.set_dna_skin_weights(mesh_index, offsets, joint_indices, weights)
 
     def calibrate_bone_transforms(self):
         ignored_bone_names = [i for i, _ in self._extra_bones]
 
+        # If the head is aligned to the body, the body bones are part of the head's calibration too
+        joints_fingerprint = self._fingerprints.get_fingerprint(
+            self.get_armature_fingerprint(self._rig_object), ignored_bone_names
+        )
+        if self._component_type == "head" and self._instance.output_align_head_and_body and self._instance.body_rig:
+            joints_fingerprint = self._fingerprints.get_fingerprint(
+                joints_fingerprint, self.get_armature_fingerprint(self._instance.body_rig)
+            )
+        if self._fingerprints.is_unchanged("joints", self._rig_object.name, joints_fingerprint):
+            logger.info("Bones are unchanged since the last export. Skipping...")
+            return
+
         logger.info("Calibrating bones...")
         dna_x_translations = self._dna_reader.getNeutralJointTranslationXs()
         dna_y_translations = self._dna_reader.getNeutralJointTranslationYs()
@@ -347,12 +497,8 @@ class DNACalibrator(DNAExporter, DNAImporter):
             self._get_body_bone_lookups()
         )
 
-        self._bone_index_lookup = {
-            self._dna_reader.getJointName(index): index for index in range(self._dna_reader.getJointCount())
-        }
-
         _, bone_names, _, _, translations, rotations = self.get_bone_transforms(
-            self._rig_object, extra_bones=self._extra_bones
+            self._rig_object, extra_bones=self._extra_bones, cache=self._bone_transforms_cache
         )
         for bone_name, bone_translation, bone_rotation in zip(bone_names, translations, rotations, strict=False):
             if bone_name in ignored_bone_names:
@@ -362,7 +508,7 @@ class DNACalibrator(DNAExporter, DNAImporter):
             _bone_translation = body_translation_lookup.get(bone_name, Vector(bone_translation))
             _bone_rotation = body_rotation_lookup.get(bone_name, Vector(bone_rotation))
 
-            dna_bone_index = self._bone_index_lookup.get(bone_name)
+            dna_bone_index = self._calibration_context.joint_index_lookup.get(bone_name)
             if dna_bone_index is not None:
                 # first check for the matching body bone, and use that instead if it exists
                 dna_bone_translation = dna_body_translation_lookup.get(
@@ -414,13 +560,28 @@ class DNACalibrator(DNAExporter, DNAImporter):
             [[x, y, z] for x, y, z in zip(dna_x_rotations, dna_y_rotations, dna_z_rotations, strict=False)]
         )
 
-    def run(self) -> tuple[bool, str, str, Callable | None]:
+    def save(self):
+        logger.info(f'Saving DNA to: "{self._target_dna_file}"...')
+        self._dna_writer.write()
+
+        if not riglogic.Status.isOk():
+            status = riglogic.Status.get()
+            raise RuntimeError(f"Error saving DNA: {status.message}")
+        logger.info(f'DNA calibrated successfully to: "{self._target_dna_file}"')
+
+        self.copy_images()
+        if self._incremental:
+            self._fingerprints.save()
+
+    def extract(self) -> tuple[bool, str, str, Callable | None]:
         self.initialize_scene_data()
         if self._instance.output_run_validations:
             valid, title, message, fix = self.validate()
             if not valid:
                 return False, title, message, fix
 
+        self.initialize_fingerprints()
+        self._calibration_context = self.get_calibration_context()
         if self._include_meshes:
             self.calibrate_vertex_positions()
         if self._include_shape_keys:
@@ -430,14 +591,4 @@ class DNACalibrator(DNAExporter, DNAImporter):
         if self._include_bones:
             self.calibrate_bone_transforms()
 
-        logger.info(f'Saving DNA to: "{self._target_dna_file}"...')
-        self._dna_writer.write()
-
-        if not riglogic.Status.isOk():
-            status = riglogic.Status.get()
-            raise RuntimeError(f"Error saving DNA: {status.message}")
-        logger.info(f'DNA calibrated successfully to: "{self._target_dna_file}"')
-
-        self.save_images()
-
         return True, "Success", f"Calibration of {self._component_type} successful.", None
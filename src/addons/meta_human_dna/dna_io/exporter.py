@@ -1,30 +1,191 @@
 # standard library imports
+import copy
+import hashlib
 import json
 import logging
 import math
+import shutil
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 # third party imports
 import bmesh
 import bpy
+import numpy as np
 
 from mathutils import Matrix, Vector
 
 # local imports
 from .. import utilities
 from ..bindings import riglogic  # pyright: ignore[reportAttributeAccessIssue]
-from ..constants import EXTRA_BONES, SCALE_FACTOR, TOPO_GROUP_PREFIX, ComponentType
+from ..constants import (
+    EXPORT_FINGERPRINT_VERSION,
+    EXPORT_FINGERPRINTS_FOLDER,
+    EXPORT_THREAD_COUNT,
+    EXTRA_BONES,
+    MESH_VERTEX_COLORS_BINARY_FILE_NAME,
+    SCALE_FACTOR,
+    TOPO_GROUP_PREFIX,
+    ComponentType,
+)
 from ..exceptions import InvalidComponentTypeError
 from ..typing import *  # noqa: F403
-from ..utilities import preserve_context
-from .misc import get_dna_reader, get_dna_writer
+from .misc import get_dna_reader, get_dna_writer, load_vertex_colors, save_vertex_colors
 
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class MeshExportData:
+    """The vertex data of a mesh split along its UV islands, read into flat arrays in the DNA's Y-up space."""
+
+    # the DNA position index of each vertex
+    vertex_indices: np.ndarray
+    # vertex positions scaled to DNA units
+    positions: np.ndarray
+    # vertex normals
+    normals: np.ndarray
+    # the loop index that holds the UV of each vertex
+    uv_indices: np.ndarray
+    # UVs in loop order
+    uvs: np.ndarray
+    # the vertex index of each loop
+    loop_vertex_indices: np.ndarray
+    # the first loop index of each face
+    loop_starts: np.ndarray
+    # the loop index that holds the color of each vertex, and the RGBA colors in loop order
+    color_indices: np.ndarray | None = None
+    colors: np.ndarray | None = None
+
+
+class DNAExportFingerprints:
+    """
+    The content fingerprints of the meshes, shape keys, skin weights and joints written by the last successful export
+    of a DNA file, saved in a JSON file in the temp folder that is keyed by the DNA file path. When the export settings
+    and the exported file are unchanged, the next export starts from the previously exported DNA and skips rewriting
+    the parts whose fingerprint matches.
+    """
+
+    def __init__(self, dna_file_path: Path, settings: dict, folder: Path = EXPORT_FINGERPRINTS_FOLDER):
+        self.dna_file_path = dna_file_path
+        path_hash = hashlib.blake2b(str(dna_file_path.resolve()).encode(), digest_size=16).hexdigest()
+        self.file_path = folder / f"{path_hash}.json"
+        self.settings = {"version": EXPORT_FINGERPRINT_VERSION, **settings}
+        self.is_incremental = False
+        self.previous: dict[str, dict[str, str]] = {}
+        self.current: dict[str, dict[str, str]] = {}
+        self.changed_count = 0
+        self.unchanged_count = 0
+
+    @staticmethod
+    def get_fingerprint(*values: np.ndarray | str | float) -> str:
+        """
+        Gets a fingerprint of the given arrays and values.
+
+        Returns:
+            str: The hex digest of the values.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for value in values:
+            if isinstance(value, np.ndarray):
+                digest.update(f"{value.dtype}{value.shape}".encode())
+                digest.update(np.ascontiguousarray(value).tobytes())
+            else:
+                digest.update(repr(value).encode())
+        return digest.hexdigest()
+
+    def get_file_stamp(self) -> list[int]:
+        stat = self.dna_file_path.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def load(self) -> bool:
+        """
+        Loads the fingerprints of the previous export, if its settings match and its DNA file was not changed since.
+
+        Returns:
+            bool: Whether the previous export can be reused.
+        """
+        if not self.file_path.exists() or not self.dna_file_path.exists():
+            return False
+
+        try:
+            data = json.loads(self.file_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as error:
+            logger.warning(f'Failed to load the export fingerprints "{self.file_path}": {error}')
+            return False
+
+        if data.get("settings") != self.settings or data.get("dna_file") != self.get_file_stamp():
+            return False
+
+        self.previous = data.get("fingerprints", {})
+        self.is_incremental = True
+        return True
+
+    def reset(self):
+        """Discards the fingerprints of the previous export, so every part is written."""
+        self.previous = {}
+        self.is_incremental = False
+
+    def is_unchanged(self, category: str, name: str, fingerprint: str) -> bool:
+        """
+        Records the fingerprint of a part of the export, and checks if it matches the previous export.
+
+        Args:
+            category (str): The kind of part, i.e. "meshes" or "shape_keys".
+            name (str): The name of the part.
+            fingerprint (str): The fingerprint of the part's current data.
+
+        Returns:
+            bool: Whether the part is unchanged since the previous export, so it doesn't need to be written.
+        """
+        self.current.setdefault(category, {})[name] = fingerprint
+        if self.previous.get(category, {}).get(name) == fingerprint:
+            self.unchanged_count += 1
+            return True
+        self.changed_count += 1
+        return False
+
+    def save(self):
+        """Saves the fingerprints of this export to the temp folder. This must be called after the DNA is written."""
+        logger.info(
+            f"{self.changed_count} of {self.changed_count + self.unchanged_count} parts changed since the last export"
+        )
+        try:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            self.file_path.write_text(
+                json.dumps(
+                    {"settings": self.settings, "dna_file": self.get_file_stamp(), "fingerprints": self.current}
+                ),
+                encoding="utf-8",
+            )
+        except OSError as error:
+            logger.warning(f'Failed to save the export fingerprints "{self.file_path}": {error}')
+
+
+class BoneTransformsCache:
+    """
+    Memoizes the bone transforms of each armature per revision. An operator that exports or calibrates several
+    components owns one and passes it to each exporter it builds, so the same rig isn't extracted more than once.
+    """
+
+    def __init__(self):
+        # armature name -> (revision, bone transforms)
+        self._transforms: dict[str, tuple[str, tuple]] = {}
+
+    def get(self, armature_name: str, revision: str) -> tuple | None:
+        cached = self._transforms.get(armature_name)
+        if cached and cached[0] == revision:
+            return copy.deepcopy(cached[1])
+        return None
+
+    def set(self, armature_name: str, revision: str, transforms: tuple):
+        self._transforms[armature_name] = (revision, copy.deepcopy(transforms))
+
+
 class DNAExporter:
     def __init__(
         self,
@@ -39,8 +200,11 @@ class DNAExporter:
         file_name: str | None = None,
         component_type: ComponentType | None = None,
         reader: "riglogic.BinaryStreamReader | None" = None,
+        *,
+        bone_transforms_cache: BoneTransformsCache | None = None,
     ):
         self._instance = instance
+        self._bone_transforms_cache = bone_transforms_cache
         self._linear_modifier = linear_modifier
         self._prefix = instance.name
 
@@ -51,6 +215,7 @@ class DNAExporter:
         self._include_textures = textures
         self._include_vertex_colors = vertex_colors
         self._component_type = component_type or instance.output_component
+        self._incremental = instance.output_incremental
 
         self._output_folder = Path(bpy.path.abspath(instance.output_folder_path))
 
@@ -65,11 +230,31 @@ class DNAExporter:
             file_name or f"{instance.name}.dna"
         )
 
-        # Open a read to the source DNA file if an existing reader is not provided
-        if not reader:
-            self._dna_reader = get_dna_reader(file_path=self.source_dna_file)
-        else:
+        source_dna_file_stamp = [str(self.source_dna_file)]
+        if self.source_dna_file.exists():
+            source_stat = self.source_dna_file.stat()
+            source_dna_file_stamp.extend([source_stat.st_size, source_stat.st_mtime_ns])
+        self._fingerprints = DNAExportFingerprints(
+            dna_file_path=self._target_dna_file,
+            settings={
+                "exporter": type(self).__name__,
+                "source_dna_file": source_dna_file_stamp,
+                "component_type": self._component_type,
+                "linear_modifier": linear_modifier,
+                "output_format": self._instance.output_format,
+                "include": [meshes, shape_keys, bones, vertex_colors, vertex_groups],
+            },
+        )
+
+        # Open a read to the source DNA file if an existing reader is not provided. If the previous export can be
+        # reused, it is read instead, so the parts that didn't change keep their previously exported data
+        if reader:
             self._dna_reader = reader
+        elif self._incremental and self._fingerprints.load():
+            logger.info(f'Reusing the unchanged data of the previous export "{self._target_dna_file}"')
+            self._dna_reader = get_dna_reader(file_path=self._target_dna_file, file_format=self._instance.output_format)
+        else:
+            self._dna_reader = get_dna_reader(file_path=self.source_dna_file)
 
         self._dna_writer = get_dna_writer(file_path=self._target_dna_file, file_format=self._instance.output_format)
         # Populate the writer with the data from the reader
@@ -90,6 +275,7 @@ class DNAExporter:
         self._mesh_indices = [0]
         self._non_lod_mesh_objects = []
         self._images = []
+        self._image_copies = []
         self._bone_index_lookup = {}
         self._vertex_color_data = []
 
@@ -139,11 +325,8 @@ class DNAExporter:
 
         # Initialize the vertex color data array
         self._vertex_color_data = [
-            {
-                "indices": [],
-                "values": [],
-            }
-        ] * len(self._mesh_indices)
+            (np.empty(0, dtype=np.int32), np.empty((0, 4), dtype=np.float32)) for _ in self._mesh_indices
+        ]
 
     def validate(self) -> tuple[bool, str, str, Callable | None]:
         if not self._rig_object:
@@ -194,6 +377,87 @@ class DNAExporter:
         # TODO: Add more validations
         return (True, "Success", "All validations passed.", None)
 
+    def initialize_fingerprints(self):
+        """Falls back to a full export if the exported meshes changed since the previous export."""
+        layout = [
+            [lod_index, mesh_object.name, mesh_index]
+            for lod_index, mesh_objects in self._export_lods.items()
+            for mesh_object, mesh_index in mesh_objects
+        ]
+        if not self._fingerprints.is_unchanged("layout", "meshes", self._fingerprints.get_fingerprint(layout)):
+            self._fingerprints.reset()
+
+    def load_previous_vertex_colors(self) -> bool:
+        """
+        Loads the vertex colors of the previous export, so they are kept for the meshes that are not rewritten.
+
+        Returns:
+            bool: Whether the previous vertex colors could be loaded, or are not needed.
+        """
+        if not self._include_vertex_colors or self._component_type != "head":
+            return True
+
+        vertex_colors_file = self._target_dna_file.parent / f"{self._prefix}_{MESH_VERTEX_COLORS_BINARY_FILE_NAME}"
+        if not vertex_colors_file.exists():
+            return False
+
+        for mesh_index, vertex_color_data in enumerate(load_vertex_colors(vertex_colors_file)):
+            if mesh_index < len(self._vertex_color_data):
+                self._vertex_color_data[mesh_index] = vertex_color_data
+        return True
+
+    @staticmethod
+    def get_armature_fingerprint(armature_object: bpy.types.Object) -> str:
+        """
+        Gets a fingerprint of the rest pose and hierarchy of an armature's bones.
+
+        Args:
+            armature_object (bpy.types.Object): The armature object.
+
+        Returns:
+            str: The fingerprint of the bones.
+        """
+        bones = armature_object.data.bones  # type: ignore[attr-defined]
+        matrices = np.empty(len(bones) * 16, dtype=np.float32)
+        bones.foreach_get("matrix_local", matrices)
+        hierarchy = [(bone.name, bone.parent.name if bone.parent else "") for bone in bones]
+        return DNAExportFingerprints.get_fingerprint(matrices, hierarchy)
+
+    @staticmethod
+    def get_mesh_fingerprint(mesh_object: bpy.types.Object, *values: np.ndarray | str | float) -> str:
+        """
+        Gets a fingerprint of the positions, topology, UVs and colors of a mesh, along with any other given values.
+
+        Args:
+            mesh_object (bpy.types.Object): The mesh object.
+            *values (np.ndarray | str | float): Other data that is written with the mesh.
+
+        Returns:
+            str: The fingerprint of the mesh.
+        """
+        mesh = mesh_object.data
+        positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)  # type: ignore[attr-defined]
+        mesh.vertices.foreach_get("co", positions)  # type: ignore[attr-defined]
+        loop_vertex_indices = np.empty(len(mesh.loops), dtype=np.int32)  # type: ignore[attr-defined]
+        mesh.loops.foreach_get("vertex_index", loop_vertex_indices)  # type: ignore[attr-defined]
+        loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)  # type: ignore[attr-defined]
+        mesh.polygons.foreach_get("loop_start", loop_starts)  # type: ignore[attr-defined]
+        arrays = [positions, loop_vertex_indices, loop_starts]
+
+        uv_layer = mesh.uv_layers.active  # type: ignore[attr-defined]
+        if uv_layer:
+            uvs = np.empty(len(uv_layer.data) * 2, dtype=np.float32)
+            uv_layer.data.foreach_get("uv", uvs)
+            arrays.append(uvs)
+
+        color_attribute = mesh.color_attributes.get(mesh.color_attributes.active_color_name or "")  # type: ignore[attr-defined]
+        if color_attribute:
+            colors = np.empty(len(color_attribute.data) * 4, dtype=np.float32)
+            color_attribute.data.foreach_get("color_srgb", colors)
+            arrays.append(colors)
+
+        return DNAExportFingerprints.get_fingerprint(*arrays, *values)
+
     @staticmethod
     def get_bmesh(mesh_object: bpy.types.Object, rotation: float = -90) -> bmesh.types.BMesh:
         # create an empty BMesh and fill it in from the mesh data
@@ -212,73 +476,263 @@ class DNAExporter:
         return bmesh_object
 
     @staticmethod
-    def get_mesh_faces(bmesh_object: bmesh.types.BMesh) -> list[tuple[int, list[int]]]:
-        bmesh_object.faces.ensure_lookup_table()
-        return [(face.index, [vert.index for vert in face.verts]) for face in bmesh_object.faces]
+    def get_xyz_euler_rotations(rotation_matrices: np.ndarray) -> np.ndarray:
+        """
+        Converts rotation matrices to XYZ euler angles the same way as blender's Matrix.to_euler("XYZ"),
+        picking whichever of the two possible solutions has the smallest angles.
+
+        Args:
+            rotation_matrices (np.ndarray): A (n, 3, 3) array of normalized rotation matrices.
+
+        Returns:
+            np.ndarray: A (n, 3) array of the euler angles in radians.
+        """
+        m = rotation_matrices
+        cy = np.hypot(m[:, 0, 0], m[:, 1, 0])
+        euler_1 = np.column_stack(
+            (np.arctan2(m[:, 2, 1], m[:, 2, 2]), np.arctan2(-m[:, 2, 0], cy), np.arctan2(m[:, 1, 0], m[:, 0, 0]))
+        )
+        euler_2 = np.column_stack(
+            (np.arctan2(-m[:, 2, 1], -m[:, 2, 2]), np.arctan2(-m[:, 2, 0], -cy), np.arctan2(-m[:, 1, 0], -m[:, 0, 0]))
+        )
+
+        # When the Y rotation is +/- 90 degrees there is only one solution, with no Z rotation
+        gimbal_lock = cy <= 16 * np.finfo(np.float32).eps
+        euler_1[gimbal_lock] = np.column_stack(
+            (
+                np.arctan2(-m[gimbal_lock, 1, 2], m[gimbal_lock, 1, 1]),
+                np.arctan2(-m[gimbal_lock, 2, 0], cy[gimbal_lock]),
+                np.zeros(np.count_nonzero(gimbal_lock)),
+            )
+        )
+        euler_2[gimbal_lock] = euler_1[gimbal_lock]
+
+        use_euler_2 = np.abs(euler_1).sum(axis=1) > np.abs(euler_2).sum(axis=1)
+        return np.where(use_euler_2[:, None], euler_2, euler_1)
 
     @staticmethod
-    @preserve_context
     def get_bone_transforms(
         armature_object: bpy.types.Object,
         extra_bones: list[tuple[str, dict]] = EXTRA_BONES,
+        cache: BoneTransformsCache | None = None,
     ) -> tuple[list[int], list[str], list[int], list[bool], list[list[float]], list[list[float]]]:
-        indices = []
-        bone_names = []
-        hierarchy = []
-        is_leaf = []
-        translations = []
-        rotations = []
+        armature = armature_object.data
+        # The rest matrices are read from the edit bones if the armature is being edited, since its bones
+        # are only updated when leaving edit mode. Both are listed parents first in the same order.
+        if armature.is_editmode:  # type: ignore[attr-defined]
+            bones, matrix_attribute = armature.edit_bones, "matrix"  # type: ignore[attr-defined]
+        else:
+            bones, matrix_attribute = armature.bones, "matrix_local"  # type: ignore[attr-defined]
 
-        hierarchy_lookup = {}
+        matrices = np.empty(len(bones) * 16, dtype=np.float32)
+        bones.foreach_get(matrix_attribute, matrices)
+        bone_names = [bone.name for bone in bones]
+        parent_names = [bone.parent.name if bone.parent else "" for bone in bones]
+
+        # Remove the extra bones from the list of bones
+        ignored_bone_names = [i for i, _ in extra_bones]
+        revision = DNAExportFingerprints.get_fingerprint(matrices, bone_names, parent_names, ignored_bone_names)
+        if cache is not None:
+            cached = cache.get(armature_object.name, revision)
+            if cached is not None:
+                return cached
+
+        # blender stores matrices column major, so transpose them to row major
+        matrices = matrices.reshape(-1, 4, 4).transpose(0, 2, 1).astype(np.float64)
+        bone_indices = [index for index, bone_name in enumerate(bone_names) if bone_name not in ignored_bone_names]
+        all_bone_indices = {bone_name: index for index, bone_name in enumerate(bone_names)}
+        parent_indices = np.array(
+            [all_bone_indices.get(parent_names[index], -1) for index in bone_indices], dtype=np.int64
+        )
+        has_parent = parent_indices >= 0
+        # the first bone is always relative to the armature, even if it has a parent
+        has_parent[0:1] = False
 
         # Change the rotation of the bones since DNA expects Y-up
-        rotation_x = Matrix.Rotation(math.radians(-90), 4, "X")  # type: ignore[arg-type]
-        global_matrix = rotation_x.to_4x4()
+        global_matrix = np.array(Matrix.Rotation(math.radians(-90), 4, "X"), dtype=np.float64)  # type: ignore[arg-type]
+        local_matrices = global_matrix @ matrices[bone_indices]
+
+        # get translation and rotation of relative to it's parent. Bone rest matrices have no scale,
+        # so their inverse is the transposed rotation and they are never singular
+        parent_matrices = matrices[parent_indices[has_parent]]
+        inverse_parent_matrices = np.zeros_like(parent_matrices)
+        inverse_parent_matrices[:, :3, :3] = parent_matrices[:, :3, :3].transpose(0, 2, 1)
+        inverse_parent_matrices[:, :3, 3] = np.einsum(
+            "nij,nj->ni", -inverse_parent_matrices[:, :3, :3], parent_matrices[:, :3, 3]
+        )
+        inverse_parent_matrices[:, 3, 3] = 1
+        local_matrices[has_parent] = inverse_parent_matrices @ matrices[bone_indices][has_parent]
+
+        # Convert translation from blender meters to centimeters
+        translations = local_matrices[:, :3, 3] * SCALE_FACTOR
+        # Convert rotation to euler, then from radians to degrees
+        rotation_matrices = local_matrices[:, :3, :3] / np.linalg.norm(local_matrices[:, :3, :3], axis=1)[:, None, :]
+        rotations = np.degrees(DNAExporter.get_xyz_euler_rotations(rotation_matrices))
+
+        # We don't want to include the extra bones as parents.
+        index_lookup = {bone_names[bone_index]: index for index, bone_index in enumerate(bone_indices)}
+        hierarchy = [index_lookup.get(parent_names[bone_index], index) for index, bone_index in enumerate(bone_indices)]
+        bone_parent_names = set(parent_names)
+        result = (
+            list(range(len(bone_indices))),
+            [bone_names[index] for index in bone_indices],
+            hierarchy,
+            [bone_names[index] not in bone_parent_names for index in bone_indices],
+            translations.tolist(),
+            rotations.tolist(),
+        )
 
-        # Switch to edit mode so we can get edit bone data
-        armature_object.hide_set(False)
-        utilities.switch_to_bone_edit_mode(armature_object)
-        armature_object_evaluated = armature_object.evaluated_get(bpy.context.evaluated_depsgraph_get())
+        if cache is not None:
+            cache.set(armature_object.name, revision, result)
+        return result
 
-        # Remove the extra bones from the list of bones
-        ignored_bone_names = [i for i, _ in extra_bones]
-        edit_bones = [i for i in armature_object_evaluated.data.edit_bones if i.name not in ignored_bone_names]  # type: ignore[attr-defined]
-        for index, edit_bone in enumerate(edit_bones):
-            if index == 0:
-                # get translation and rotation of the bone globally
-                translation, rotation, _ = (global_matrix @ edit_bone.matrix).decompose()
-            elif edit_bone.parent:
-                # get translation and rotation of relative to it's parent
-                # Use inverted_safe() to handle singular matrices gracefully
-                local_matrix = edit_bone.parent.matrix.inverted_safe() @ edit_bone.matrix
-                translation, rotation, _ = local_matrix.decompose()
-
-            indices.append(index)
-            bone_names.append(edit_bone.name)
-            is_leaf.append(not edit_bone.children)
-
-            hierarchy_index = index
-            # If the bone has a parent, get the index of the parent bone.
-            # We don't want to include the extra bones as parents.
-            if edit_bone.parent and edit_bone.parent.name not in ignored_bone_names:
-                hierarchy_index = hierarchy_lookup[edit_bone.parent.name]
-
-            hierarchy.append(hierarchy_index)
-            # Store the index of the bone in the hierarchy lookup so we can find parent indices later
-            hierarchy_lookup[edit_bone.name] = index
-
-            # Convert translation from blender meters to centimeters
-            translations.append(
-                [translation.x * SCALE_FACTOR, translation.y * SCALE_FACTOR, translation.z * SCALE_FACTOR]
-            )
-            # Convert rotation from quaternion to euler
-            euler_rotation = rotation.to_euler("XYZ")
-            # Convert rotation from radians to degrees
-            rotations.append(
-                [math.degrees(euler_rotation.x), math.degrees(euler_rotation.y), math.degrees(euler_rotation.z)]
+    @staticmethod
+    def get_last_loop_indices(loop_vertex_indices: np.ndarray, vertex_count: int) -> np.ndarray:
+        """
+        Gets the index of the last loop that uses each vertex. Vertices that no loop uses keep their own index.
+
+        Args:
+            loop_vertex_indices (np.ndarray): The vertex index of each loop.
+            vertex_count (int): The number of vertices in the mesh.
+
+        Returns:
+            np.ndarray: The loop index of each vertex.
+        """
+        indices = np.arange(vertex_count, dtype=np.int64)
+        # The first occurrence in the reversed loops is the last occurrence in the mesh
+        vertex_indices, reversed_loop_indices = np.unique(loop_vertex_indices[::-1], return_index=True)
+        indices[vertex_indices] = len(loop_vertex_indices) - 1 - reversed_loop_indices
+        return indices
+
+    @staticmethod
+    def get_mesh_vertex_position_array(mesh: bpy.types.Mesh, rotation: float = -90) -> np.ndarray:
+        """
+        Reads the vertex positions of a mesh with foreach_get, and converts them to the DNA's Y-up space.
+
+        Args:
+            mesh (bpy.types.Mesh): The mesh to read.
+            rotation (float): The rotation in degrees around the X axis that is applied to the positions.
+
+        Returns:
+            np.ndarray: A (vertex_count, 3) float64 array of the scaled vertex positions.
+        """
+        rotation_matrix = np.array(Matrix.Rotation(math.radians(rotation), 3, "X"), dtype=np.float64)  # type: ignore[arg-type]
+        positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", positions)
+        return (positions.reshape(-1, 3).astype(np.float64) @ rotation_matrix.T) * SCALE_FACTOR
+
+    @staticmethod
+    def get_mesh_export_data(
+        mesh: bpy.types.Mesh,
+        duplicate_lookup: dict[int, int] | None = None,
+        uv_layer_name: str = "",
+        color_attribute_name: str = "",
+        normal_mesh: bpy.types.Mesh | None = None,
+        rotation: float = -90,
+    ) -> MeshExportData:
+        """
+        Reads the vertex data of a mesh with foreach_get, and converts it to the DNA's Y-up space.
+
+        Args:
+            mesh (bpy.types.Mesh): The mesh to read. This is expected to already be split along its UV islands.
+            duplicate_lookup (dict[int, int] | None): A lookup of split vertex indices to their original index.
+            uv_layer_name (str): The UV layer to read. Defaults to the active UV layer.
+            color_attribute_name (str): The color attribute to read. No colors are read if it is not found.
+            normal_mesh (bpy.types.Mesh | None): The unsplit mesh to read the vertex normals from, so the vertices
+                on a UV seam keep the normal of all their faces. Defaults to the given mesh.
+            rotation (float): The rotation in degrees around the X axis that is applied to the positions and normals.
+
+        Returns:
+            MeshExportData: The vertex data of the mesh.
+        """
+        vertex_count = len(mesh.vertices)
+        loop_count = len(mesh.loops)
+        rotation_matrix = np.array(Matrix.Rotation(math.radians(rotation), 3, "X"), dtype=np.float32)  # type: ignore[arg-type]
+
+        positions = DNAExporter.get_mesh_vertex_position_array(mesh, rotation=rotation)
+
+        loop_vertex_indices = np.empty(loop_count, dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_vertex_indices)
+        loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_start", loop_starts)
+        loop_indices = DNAExporter.get_last_loop_indices(loop_vertex_indices, vertex_count)
+
+        # Get the original vertex index if the vertex is a duplicate, otherwise use the current index
+        vertex_indices = np.arange(vertex_count, dtype=np.int64)
+        if duplicate_lookup:
+            vertex_indices[np.fromiter(duplicate_lookup.keys(), dtype=np.int64)] = np.fromiter(
+                duplicate_lookup.values(), dtype=np.int64
             )
 
-        return indices, bone_names, hierarchy, is_leaf, translations, rotations
+        # TODO: Use split normals instead. Also check if these are stored as triangles?
+        normal_mesh = normal_mesh or mesh
+        normals = np.empty(len(normal_mesh.vertices) * 3, dtype=np.float32)
+        normal_mesh.vertex_normals.foreach_get("vector", normals)
+        normals = (normals.reshape(-1, 3)[vertex_indices] @ rotation_matrix.T) * SCALE_FACTOR
+
+        uv_indices = np.arange(vertex_count, dtype=np.int64)
+        uvs = np.empty((0, 2), dtype=np.float32)
+        uv_layer = mesh.uv_layers.get(uv_layer_name) or mesh.uv_layers.active
+        if uv_layer:
+            uv_indices = loop_indices
+            uvs = np.empty(loop_count * 2, dtype=np.float32)
+            uv_layer.data.foreach_get("uv", uvs)
+            uvs = uvs.reshape(-1, 2)
+
+        mesh_data = MeshExportData(
+            vertex_indices=vertex_indices,
+            positions=positions,
+            normals=normals,
+            uv_indices=uv_indices,
+            uvs=uvs,
+            loop_vertex_indices=loop_vertex_indices,
+            loop_starts=loop_starts,
+        )
+
+        color_attribute = mesh.color_attributes.get(color_attribute_name)
+        if color_attribute:
+            colors = np.empty(len(color_attribute.data) * 4, dtype=np.float32)
+            color_attribute.data.foreach_get("color_srgb", colors)  # type: ignore[attr-defined]
+            colors = colors.reshape(-1, 4)
+            # Point colors are expanded to loop order, so they are stored the same way as corner colors
+            if color_attribute.domain == "POINT":
+                colors = colors[loop_vertex_indices]
+            mesh_data.color_indices = loop_indices
+            mesh_data.colors = colors
+
+        return mesh_data
+
+    @staticmethod
+    def get_split_mesh_export_data(mesh_object: bpy.types.Object) -> MeshExportData:
+        """
+        Splits a copy of the mesh along its UV islands and reads its vertex data.
+
+        Args:
+            mesh_object (bpy.types.Object): The mesh object to read.
+
+        Returns:
+            MeshExportData: The vertex data of the split mesh.
+        """
+        bmesh_object = DNAExporter.get_bmesh(mesh_object, rotation=0)
+        # Split the mesh along UV islands so that we have all the UV loop indices needed for each vertex index
+        split_to_original_vert_lookup = utilities.split_mesh_along_uv_islands(bmesh_object=bmesh_object)
+
+        # Write the split mesh to a temporary mesh so its data can be read as flat arrays
+        split_mesh = bpy.data.meshes.new(f"{mesh_object.name}_export")
+        try:
+            bmesh_object.to_mesh(split_mesh)
+            uv_layer = mesh_object.data.uv_layers.active  # type: ignore[attr-defined]
+            return DNAExporter.get_mesh_export_data(
+                mesh=split_mesh,
+                duplicate_lookup=split_to_original_vert_lookup,
+                uv_layer_name=uv_layer.name if uv_layer else "",
+                color_attribute_name=mesh_object.data.color_attributes.active_color_name,  # type: ignore[attr-defined]
+                normal_mesh=mesh_object.data,  # type: ignore[arg-type]
+            )
+        finally:
+            # Free the BMesh from memory without applying the changes back to the mesh
+            bmesh_object.free()
+            bpy.data.meshes.remove(split_mesh)
 
     @staticmethod
     def get_mesh_vertex_positions(
@@ -297,39 +751,76 @@ class DNAExporter:
         return indices, positions
 
     @staticmethod
-    def get_mesh_vertex_normals(bmesh_object: bmesh.types.BMesh) -> tuple[list[int], list[list[float]]]:
-        indices = []
-        normals = []
-        # TODO: Use split_normals from Mesh instead. Also check if these are stored as triangles?
-        # https://docs.blender.org/api/current/bpy.types.MeshLoopTriangle.html
+    def get_mesh_skin_weights(
+        mesh_object: bpy.types.Object,
+        joint_index_lookup: dict[str, int],
+        min_weight: float | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Reads the vertex group weights of every vertex in a single pass into CSR style arrays. The weights of
+        vertex i are stored in joint_indices[offsets[i]:offsets[i + 1]] and weights[offsets[i]:offsets[i + 1]].
+
+        Args:
+            mesh_object (bpy.types.Object): The mesh object to read the vertex groups from.
+            joint_index_lookup (dict[str, int]): The joint index of each vertex group name. Vertex groups that
+                are not in the lookup are skipped.
+            min_weight (float | None): If set, only weights greater than this are kept.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The offsets, joint indices, and weights.
+        """
+        vertices = mesh_object.data.vertices  # type: ignore[attr-defined]
+        vertex_counts = np.zeros(len(vertices), dtype=np.int64)
+        group_indices = []
+        weights = []
+        for vertex in vertices:
+            vertex_counts[vertex.index] = len(vertex.groups)
+            for group in vertex.groups:
+                group_indices.append(group.group)
+                weights.append(group.weight)
+
+        group_indices = np.asarray(group_indices, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float32)
+
+        # Map each vertex group index to its joint index, or -1 if the vertex group is not a joint
+        joint_table = np.full(
+            max(len(mesh_object.vertex_groups), group_indices.max(initial=-1) + 1), -1, dtype=np.int64
+        )
+        for vertex_group in mesh_object.vertex_groups:
+            joint_table[vertex_group.index] = joint_index_lookup.get(vertex_group.name, -1)
+        joint_indices = joint_table[group_indices]
 
-        for vert in bmesh_object.verts:
-            normals.append([vert.normal.x * SCALE_FACTOR, vert.normal.y * SCALE_FACTOR, vert.normal.z * SCALE_FACTOR])
-            indices.append(vert.index)
-        return indices, normals
+        mask = joint_indices >= 0
+        if min_weight is not None:
+            mask &= weights > min_weight
+
+        vertex_indices = np.repeat(np.arange(len(vertices)), vertex_counts)[mask]
+        offsets = np.zeros(len(vertices) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(vertex_indices, minlength=len(vertices)), out=offsets[1:])
+        return offsets, joint_indices[mask], weights[mask]
 
     @staticmethod
     def get_mesh_vertex_groups(mesh_object: bpy.types.Object) -> dict[str, list[tuple[int, float]]]:
         if not mesh_object.data or not isinstance(mesh_object.data, bpy.types.Mesh):
             return {}
-        # Create a lookup table for the vertex group names by their index
-        vertex_group_lookup = {vertex_group.index: vertex_group.name for vertex_group in mesh_object.vertex_groups}
-        # Initialize the vertex groups dictionary
-        vertex_groups = {vertex_group.name: [] for vertex_group in mesh_object.vertex_groups}
-
-        # Loop through the vertices and get the vertex group names and the vertex and weights
-        for vertex in mesh_object.data.vertices:
-            vertex_group_names = [vertex_group_lookup.get(group.group, "") for group in vertex.groups]
-            for vertex_group_name in vertex_group_names:
-                # Skip the topology vertex groups
-                if vertex_group_name.startswith(TOPO_GROUP_PREFIX):
-                    continue
+        # Skip the topology vertex groups
+        vertex_group_names = [
+            vertex_group.name
+            for vertex_group in mesh_object.vertex_groups
+            if not vertex_group.name.startswith(TOPO_GROUP_PREFIX)
+        ]
+        offsets, group_indices, weights = DNAExporter.get_mesh_skin_weights(
+            mesh_object,
+            joint_index_lookup={name: index for index, name in enumerate(vertex_group_names)},
+            min_weight=0,
+        )
+        vertex_indices = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
 
-                vertex_group = mesh_object.vertex_groups.get(vertex_group_name)
-                if vertex_group:
-                    weight = vertex_group.weight(vertex.index)
-                    if weight > 0:
-                        vertex_groups[vertex_group_name].append((vertex.index, weight))
+        vertex_groups = {name: [] for name in vertex_group_names}
+        for vertex_index, group_index, weight in zip(
+            vertex_indices.tolist(), group_indices.tolist(), weights.tolist(), strict=True
+        ):
+            vertex_groups[vertex_group_names[group_index]].append((vertex_index, weight))
 
         return vertex_groups
 
@@ -349,18 +840,12 @@ class DNAExporter:
 
         return uv_indices, uv_positions
 
-    def set_dna_vertex_colors(self, mesh_index: int, bmesh_object: bmesh.types.BMesh):
-        vertex_color_indices = list(range(len(bmesh_object.verts)))
-        vertex_color_values = []
-        color_layer = bmesh_object.loops.layers.color.active
-        if color_layer:
-            for face in bmesh_object.faces:
-                for loop in face.loops:
-                    vertex_color_indices[loop.vert.index] = loop.index
-                    vertex_color_values.append(list(loop[color_layer][:]))
-
-            self._vertex_color_data[mesh_index]["indices"] = vertex_color_indices
-            self._vertex_color_data[mesh_index]["values"] = vertex_color_values
+    def set_dna_vertex_colors(self, mesh_index: int, mesh_data: MeshExportData):
+        if mesh_data.color_indices is not None and mesh_data.colors is not None:
+            self._vertex_color_data[mesh_index] = (
+                mesh_data.color_indices.astype(np.int32),
+                mesh_data.colors.astype(np.float32),
+            )
 
     def set_dna_vertex_positions(
         self,
@@ -381,34 +866,38 @@ class DNAExporter:
     def set_dna_uvs(self, mesh_index: int, uvs: list[list[float]]):
         self._dna_writer.setVertexTextureCoordinates(meshIndex=mesh_index, textureCoordinates=uvs)
 
-    def set_dna_vertex_groups(self, mesh_index: int, mesh_object: bpy.types.Object):
+    def set_dna_vertex_groups(
+        self,
+        mesh_index: int,
+        mesh_object: bpy.types.Object,
+        skin_weights: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None,
+    ):
         if not mesh_object.data or not isinstance(mesh_object.data, bpy.types.Mesh):
             logger.warning(
                 f"Object '{mesh_object.name}' has no mesh data in the blender scene. Skipping vertex group export..."
             )
             return
-        # Create a lookup table for the vertex group names by their index
-        vertex_group_lookup = {vertex_group.index: vertex_group.name for vertex_group in mesh_object.vertex_groups}
-
-        # Loop through the vertices and get the vertex group names and the vertex and weights
-        for vertex in mesh_object.data.vertices:
-            vertex_group_names = [vertex_group_lookup.get(group.group, "") for group in vertex.groups]
-            bone_indices = []
-            weights = []
-
-            for vertex_group_name in vertex_group_names:
-                bone_index = self._bone_index_lookup.get(vertex_group_name)
-                vertex_group = mesh_object.vertex_groups.get(vertex_group_name)
-                if bone_index and vertex_group:
-                    weight = vertex_group.weight(vertex.index)
-                    if weight > 0:
-                        bone_indices.append(bone_index)
-                        weights.append(weight)
+        if skin_weights is None:
+            skin_weights = self.get_mesh_skin_weights(
+                mesh_object, joint_index_lookup=self._bone_index_lookup, min_weight=0
+            )
+        self.set_dna_skin_weights(mesh_index, *skin_weights)
 
+    def set_dna_skin_weights(
+        self, mesh_index: int, offsets: np.ndarray, joint_indices: np.ndarray, weights: np.ndarray
+    ):
+        # Convert to lists once, so each vertex only slices python lists
+        offsets_list = offsets.tolist()
+        joint_indices_list = joint_indices.tolist()
+        weights_list = weights.tolist()
+        for vertex_index in range(len(offsets_list) - 1):
+            start, end = offsets_list[vertex_index], offsets_list[vertex_index + 1]
             self._dna_writer.setSkinWeightsJointIndices(
-                meshIndex=mesh_index, vertexIndex=vertex.index, jointIndices=bone_indices
+                meshIndex=mesh_index, vertexIndex=vertex_index, jointIndices=joint_indices_list[start:end]
+            )
+            self._dna_writer.setSkinWeightsValues(
+                meshIndex=mesh_index, vertexIndex=vertex_index, weights=weights_list[start:end]
             )
-            self._dna_writer.setSkinWeightsValues(meshIndex=mesh_index, vertexIndex=vertex.index, weights=weights)
 
     def set_dna_bones(
         self,
@@ -436,10 +925,55 @@ class DNAExporter:
             [[x, y, z] for x, y, z in zip(dna_x_rotations, dna_y_rotations, dna_z_rotations, strict=False)]
         )
 
+    @staticmethod
+    def get_image_source_path(image: bpy.types.Image) -> Path | None:
+        """
+        Gets the file of an image, if the image is unmodified since it was loaded from it.
+
+        Args:
+            image (bpy.types.Image): The image.
+
+        Returns:
+            Path | None: The image file, or None if the image is packed, generated, or has unsaved changes.
+        """
+        if image.packed_file or image.is_dirty or image.source != "FILE" or not image.filepath:
+            return None
+
+        source_path = Path(bpy.path.abspath(image.filepath, library=image.library))
+        if not source_path.is_file():
+            return None
+        return source_path
+
+    @staticmethod
+    def copy_image_file(source_path: Path, target_path: Path):
+        """
+        Copies an image file to the target path.
+
+        Args:
+            source_path (Path): The image file.
+            target_path (Path): The exported image file.
+        """
+        try:
+            if target_path.exists():
+                if target_path.resolve() == source_path.resolve():
+                    return
+                # Unlink the old file first, so a hard link left by an earlier export is not written through
+                target_path.unlink()
+            shutil.copy2(source_path, target_path)
+        except OSError as error:
+            logger.error(f'Failed to copy image "{source_path}" to "{target_path}": {error}')
+            return
+        logger.info(f'Image "{source_path.name}" exported successfully to: {target_path}')
+
     def save_images(self):
+        """
+        Saves the images to the Maps folder. Images that are unmodified files on disk in the same format are queued
+        to be copied by copy_images, so only the packed, generated and edited images are encoded by blender.
+        """
         if not self._include_textures:
             return
 
+        self._image_copies = []
         for image, file_name in self._images:
             new_image_path = self._target_dna_file.parent / "Maps" / file_name
             new_image_path.parent.mkdir(parents=True, exist_ok=True)
@@ -447,6 +981,17 @@ class DNAExporter:
                 logger.warning(f"Image {image.name} is not packed or saved. Skipping export.")
                 continue
 
+            source_path = self.get_image_source_path(image)
+            if source_path and source_path.suffix.lower() == new_image_path.suffix.lower():
+                self._image_copies.append((source_path, new_image_path))
+                continue
+
+            # Unlink the old file first, so a hard link to the source texture left by an earlier export is
+            # replaced rather than written through, unless the image was loaded from this file
+            image_path = Path(bpy.path.abspath(image.filepath, library=image.library)) if image.filepath else None
+            if new_image_path.exists() and (not image_path or new_image_path.resolve() != image_path.resolve()):
+                new_image_path.unlink()
+
             try:
                 image.save(filepath=str(new_image_path))
             except Exception:
@@ -456,48 +1001,105 @@ class DNAExporter:
                     logger.error(f"Failed to export image {image.name}: {error}")
             logger.info(f"Image {image.name} exported successfully to: {new_image_path}")
 
+    def copy_images(self):
+        """
+        Copies the image files queued by save_images in parallel. This does not access any blender data, so it can be
+        run on a worker thread.
+        """
+        with ThreadPoolExecutor(max_workers=EXPORT_THREAD_COUNT) as executor:
+            for source_path, target_path in self._image_copies:
+                executor.submit(self.copy_image_file, source_path, target_path)
+        self._image_copies = []
+
     def save_vertex_colors(self):
-        if self._include_vertex_colors:
-            vertex_colors_file = self._target_dna_file.parent / f"{self._prefix}_vertex_colors.json"
-            with vertex_colors_file.open("w") as f:
-                json.dump(self._vertex_color_data, f)
-                logger.info(f'Vertex colors exported successfully to: "{vertex_colors_file}"')
+        # Only the head has a vertex colors file, so the body export doesn't overwrite it
+        if self._include_vertex_colors and self._component_type == "head":
+            vertex_colors_file = self._target_dna_file.parent / f"{self._prefix}_{MESH_VERTEX_COLORS_BINARY_FILE_NAME}"
+            save_vertex_colors(vertex_colors_file, self._vertex_color_data)
+            logger.info(f'Vertex colors exported successfully to: "{vertex_colors_file}"')
+
+    def save(self):
+        """
+        Writes the DNA file and the vertex colors to disk, and copies the images queued by save_images. This does
+        not access any blender data, so it can be run on a worker thread once the scene data has been extracted.
+        """
+        logger.info(f'Saving DNA to: "{self._target_dna_file}"...')
+        self._dna_writer.write()
+        if not riglogic.Status.isOk():
+            status = riglogic.Status.get()
+            raise RuntimeError(f"Error saving DNA: {status.message}")
+        logger.info(f'DNA exported successfully to: "{self._target_dna_file}"')
+
+        self.save_vertex_colors()
+        self.copy_images()
+        if self._incremental:
+            self._fingerprints.save()
 
     def run(self) -> tuple[bool, str, str, Callable | None]:
+        valid, title, message, fix = self.extract()
+        if not valid:
+            return valid, title, message, fix
+
+        self.save_images()
+        self.save()
+        return valid, title, message, fix
+
+    def extract(self) -> tuple[bool, str, str, Callable | None]:
+        """
+        Reads the scene data into the DNA writer. This must be run on the main thread.
+
+        Returns:
+            tuple[bool, str, str, Callable | None]: Whether the extraction succeeded, the title and message to
+            report, and an optional callable that fixes a failed validation.
+        """
         self.initialize_scene_data()
         if self._instance.output_run_validations:
             valid, title, message, fix = self.validate()
             if not valid:
                 return False, title, message, fix
 
-        # Clear the mesh data
-        self._dna_writer.clearMeshNames()
-        self._dna_writer.clearMeshIndices()
-        self._dna_writer.clearLODMeshMappings()
-        self._dna_writer.clearMeshes()
+        self.initialize_fingerprints()
+        if self._fingerprints.is_incremental and not self.load_previous_vertex_colors():
+            self._fingerprints.reset()
 
-        # Clear the bone data
-        self._dna_writer.clearJointNames()
-        self._dna_writer.clearJointIndices()
-        self._dna_writer.clearLODJointMappings()
+        # An incremental export keeps the previously exported meshes, and only rewrites the ones that changed
+        if not self._fingerprints.is_incremental:
+            # Clear the mesh data
+            self._dna_writer.clearMeshNames()
+            self._dna_writer.clearMeshIndices()
+            self._dna_writer.clearLODMeshMappings()
+            self._dna_writer.clearMeshes()
 
         # init the lod indices
         # TODO: Currently can't change this without messing up the joint behavior.
         # Default dna has 8 lods
         # self._dna_writer.setLODCount(len(self._export_lods.keys()))  # noqa: ERA001
 
-        bone_indices, bone_names, hierarchy, _is_leaf, translations, rotations = self.get_bone_transforms(
-            armature_object=self._rig_object, extra_bones=self._extra_bones
+        joints_fingerprint = self._fingerprints.get_fingerprint(
+            self.get_armature_fingerprint(self._rig_object), [name for name, _ in self._extra_bones]
         )
+        if self._fingerprints.is_unchanged("joints", self._rig_object.name, joints_fingerprint):
+            logger.info("Bones are unchanged since the last export. Skipping...")
+            bone_indices = list(range(self._dna_reader.getJointCount()))
+            self._bone_index_lookup = {self._dna_reader.getJointName(index): index for index in bone_indices}
+        else:
+            # Clear the bone data
+            self._dna_writer.clearJointNames()
+            self._dna_writer.clearJointIndices()
+            self._dna_writer.clearLODJointMappings()
 
-        # Set the bone data
-        self.set_dna_bones(
-            indices=bone_indices,
-            bone_names=bone_names,
-            hierarchy=hierarchy,
-            translations=translations,
-            rotations=rotations,
-        )
+            bone_indices, bone_names, hierarchy, _is_leaf, translations, rotations = self.get_bone_transforms(
+                armature_object=self._rig_object, extra_bones=self._extra_bones, cache=self._bone_transforms_cache
+            )
+
+            # Set the bone data
+            self.set_dna_bones(
+                indices=bone_indices,
+                bone_names=bone_names,
+                hierarchy=hierarchy,
+                translations=translations,
+                rotations=rotations,
+            )
 
         for lod_index, mesh_objects in self._export_lods.items():
             # Set the joint indices
@@ -521,51 +1123,46 @@ class DNAExporter:
             for mesh_object, mesh_index in mesh_objects:
                 real_name = mesh_object.name.replace(f"{self._prefix}_", "")
 
+                # Set the mesh name
+                self._dna_writer.setMeshName(index=mesh_index, name=real_name)
+
+                skin_weights = None
+                if isinstance(mesh_object.data, bpy.types.Mesh):
+                    skin_weights = self.get_mesh_skin_weights(
+                        mesh_object, joint_index_lookup=self._bone_index_lookup, min_weight=0
+                    )
+                mesh_fingerprint = self.get_mesh_fingerprint(mesh_object, *(skin_weights or ()))
+                if self._fingerprints.is_unchanged("meshes", mesh_object.name, mesh_fingerprint):
+                    logger.info(f'Mesh "{mesh_object.name}" is unchanged since the last export. Skipping...')
+                    continue
+
                 logger.info(f'Exporting mesh: "{mesh_object.name}" to DNA as "{real_name}"...')
                 self._dna_writer.clearFaceVertexLayoutIndices(meshIndex=mesh_index)
                 self._dna_writer.clearSkinWeights(meshIndex=mesh_index)
                 self._dna_writer.clearBlendShapeTargets(meshIndex=mesh_index)
 
-                # Set the mesh name
-                self._dna_writer.setMeshName(index=mesh_index, name=real_name)
-                bmesh_object = self.get_bmesh(mesh_object)
-                # Split the mesh along UV islands so that we have all the UV loop indices needed for each vertex index
-                split_to_original_vert_lookup = utilities.split_mesh_along_uv_islands(bmesh_object=bmesh_object)
-
-                vertex_indices, vertex_positions = self.get_mesh_vertex_positions(
-                    bmesh_object=bmesh_object, duplicate_lookup=split_to_original_vert_lookup
-                )
-                normal_indices, normals = self.get_mesh_vertex_normals(bmesh_object=bmesh_object)
-                uv_indices, uvs = self.get_mesh_vertex_uvs(bmesh_object=bmesh_object)
-                faces = self.get_mesh_faces(bmesh_object=bmesh_object)
+                mesh_data = self.get_split_mesh_export_data(mesh_object)
 
-                # Set the vertex color data so it can be saved to JSON later
+                # Set the vertex color data so it can be saved later
                 if self._include_vertex_colors:
-                    self.set_dna_vertex_colors(mesh_index=mesh_index, bmesh_object=bmesh_object)
+                    self.set_dna_vertex_colors(mesh_index=mesh_index, mesh_data=mesh_data)
 
                 # Set the vertex layout so DNA knows how to read the vertex,
                 # normal, and uv data from their respective arrays
                 self._dna_writer.setVertexLayouts(
                     meshIndex=mesh_index,
-                    layouts=[list(item) for item in zip(vertex_indices, uv_indices, normal_indices, strict=False)],
+                    layouts=np.column_stack(
+                        (mesh_data.vertex_indices, mesh_data.uv_indices, np.arange(len(mesh_data.vertex_indices)))
+                    ).tolist(),
                 )
 
-                self.set_dna_vertex_positions(mesh_index, vertex_positions)
-                self.set_dna_faces(mesh_index, faces)
-                self.set_dna_normals(mesh_index, normals)
-                self.set_dna_uvs(mesh_index, uvs)
-                self.set_dna_vertex_groups(mesh_index, mesh_object)
-
-                # Now free the BMesh from memory without applying the changes back to the mesh
-                bmesh_object.free()
-
-        self._dna_writer.write()
-        if not riglogic.Status.isOk():
-            status = riglogic.Status.get()
-            raise RuntimeError(f"Error saving DNA: {status.message}")
-        logger.info(f'DNA exported successfully to: "{self._target_dna_file}"')
-
-        self.save_images()
-        self.save_vertex_colors()
+                face_vertex_indices = np.split(mesh_data.loop_vertex_indices, mesh_data.loop_starts[1:])
+                self.set_dna_vertex_positions(mesh_index, mesh_data.positions.tolist())
+                self.set_dna_faces(
+                    mesh_index, [(index, indices.tolist()) for index, indices in enumerate(face_vertex_indices)]
+                )
+                self.set_dna_normals(mesh_index, mesh_data.normals.tolist())
+                self.set_dna_uvs(mesh_index, mesh_data.uvs.tolist())
+                self.set_dna_vertex_groups(mesh_index, mesh_object, skin_weights)
 
         return True, "Success", "Export successful.", None
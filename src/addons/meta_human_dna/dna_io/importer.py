@@ -1,13 +1,19 @@
 # standard library imports
+import hashlib
+import itertools
 import json
 import logging
 import math
+import os
+import shutil
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 # third party imports
-import bmesh
 import bpy
+import numpy as np
 
 from mathutils import Euler, Matrix, Vector
 
@@ -18,20 +24,186 @@ from ..constants import (
     CUSTOM_BONE_SHAPE_SCALE,
     EXTRA_BONES,
     FIRST_BONE_Y_LOCATION,
+    IMPORT_CACHE_FOLDER,
+    IMPORT_CACHE_MAX_SIZE,
+    IMPORT_CACHE_VERSION,
+    IMPORT_DECODE_THREAD_COUNT,
+    MESH_VERTEX_COLORS_BINARY_FILE_NAME,
+    MESH_VERTEX_COLORS_BINARY_FILE_PATH,
     MESH_VERTEX_COLORS_FILE_NAME,
     MESH_VERTEX_COLORS_FILE_PATH,
     NUMBER_OF_HEAD_LODS,
     SHAPE_KEY_BASIS_NAME,
     UV_MAP_NAME,
+    VERTEX_COLOR_ATTRIBUTE_NAME,
     ComponentType,
 )
 from ..typing import *  # noqa: F403
-from .misc import get_dna_reader
+from .misc import get_dna_reader, load_vertex_colors
 
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class DecodedMesh:
+    """The DNA arrays of a mesh, converted into flat buffers that are written directly to a blender mesh."""
+
+    mesh_index: int
+    # flat vertex positions in DNA position order
+    positions: np.ndarray
+    # the DNA position index of each vertex in the mesh
+    position_indices: np.ndarray
+    # the vertex index of each loop
+    loop_vertex_indices: np.ndarray
+    # the DNA vertex layout index of each loop
+    loop_layout_indices: np.ndarray
+    # the first loop index of each face
+    loop_starts: np.ndarray
+    # flat UVs in loop order
+    uvs: np.ndarray
+    # custom split normals in loop order
+    normals: np.ndarray
+    # vertex group name -> list of (weight, vertex indices)
+    skin_weights: dict[str, list[tuple[float, list[int]]]]
+
+
+class DNAImportCache:
+    """
+    A disk cache of decoded meshes, keyed by the content hash of a DNA file and the import options that change
+    how its meshes are decoded. Each mesh is stored as an uncompressed .npz file of its flat buffers, in a folder
+    per cache key. The least recently used folders are removed once the cache is larger than its max size.
+    """
+
+    def __init__(self, dna_file_path: Path, options: dict, max_size: int, folder: Path = IMPORT_CACHE_FOLDER):
+        self.folder = folder
+        self.max_size = max_size
+
+        content_hash = hashlib.sha256()
+        with dna_file_path.open("rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                content_hash.update(chunk)
+        content_hash.update(json.dumps({"version": IMPORT_CACHE_VERSION, **options}, sort_keys=True).encode())
+        self.key = content_hash.hexdigest()
+
+    @property
+    def entry_folder(self) -> Path:
+        return self.folder / self.key
+
+    def get_file_path(self, mesh_index: int) -> Path:
+        return self.entry_folder / f"mesh_{mesh_index}.npz"
+
+    def load(self, mesh_index: int) -> DecodedMesh | None:
+        """
+        Loads a decoded mesh from the cache.
+
+        Args:
+            mesh_index (int): The index of the mesh in the DNA file.
+
+        Returns:
+            DecodedMesh | None: The decoded mesh, or None if it is not cached.
+        """
+        file_path = self.get_file_path(mesh_index)
+        if not file_path.exists():
+            return None
+
+        try:
+            with np.load(file_path, allow_pickle=False) as data:
+                # the skin weights are stored as flat batches, with the offset of each batch's vertex indices
+                offsets = data["batch_offsets"].tolist()
+                batch_vertex_indices = [
+                    data["batch_vertex_indices"][start:end] for start, end in itertools.pairwise(offsets)
+                ]
+                skin_weights = {}
+                for joint_index, weight, vertex_indices in zip(
+                    data["batch_joints"].tolist(), data["batch_weights"].tolist(), batch_vertex_indices, strict=True
+                ):
+                    joint_name = str(data["joint_names"][joint_index])
+                    skin_weights.setdefault(joint_name, []).append((weight, vertex_indices.tolist()))
+
+                mesh_data = DecodedMesh(
+                    mesh_index=mesh_index,
+                    positions=data["positions"],
+                    position_indices=data["position_indices"],
+                    loop_vertex_indices=data["loop_vertex_indices"],
+                    loop_layout_indices=data["loop_layout_indices"],
+                    loop_starts=data["loop_starts"],
+                    uvs=data["uvs"],
+                    normals=data["normals"],
+                    skin_weights=skin_weights,
+                )
+        except (OSError, KeyError, ValueError) as error:
+            logger.warning(f'Failed to load "{file_path}" from the import cache: {error}')
+            return None
+
+        return mesh_data
+
+    def save(self, mesh_data: DecodedMesh):
+        """
+        Saves a decoded mesh to the cache.
+
+        Args:
+            mesh_data (DecodedMesh): The decoded mesh.
+        """
+        joint_names = list(mesh_data.skin_weights.keys())
+        batches = [
+            (joint_index, weight, vertex_indices)
+            for joint_index, joint_name in enumerate(joint_names)
+            for weight, vertex_indices in mesh_data.skin_weights[joint_name]
+        ]
+        batch_sizes = [len(vertex_indices) for _, _, vertex_indices in batches]
+
+        file_path = self.get_file_path(mesh_data.mesh_index)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, so a partially written file is never loaded
+        temp_file_path = file_path.with_suffix(".tmp.npz")
+        try:
+            np.savez(
+                temp_file_path,
+                positions=mesh_data.positions,
+                position_indices=mesh_data.position_indices,
+                loop_vertex_indices=mesh_data.loop_vertex_indices,
+                loop_layout_indices=mesh_data.loop_layout_indices,
+                loop_starts=mesh_data.loop_starts,
+                uvs=mesh_data.uvs,
+                normals=mesh_data.normals,
+                joint_names=np.asarray(joint_names, dtype=np.str_),
+                batch_joints=np.asarray([batch[0] for batch in batches], dtype=np.int32),
+                batch_weights=np.asarray([batch[1] for batch in batches], dtype=np.float32),
+                batch_offsets=np.concatenate(([0], np.cumsum(batch_sizes, dtype=np.int64))),
+                batch_vertex_indices=np.fromiter(
+                    itertools.chain.from_iterable(batch[2] for batch in batches), dtype=np.int32, count=sum(batch_sizes)
+                ),
+            )
+            temp_file_path.replace(file_path)
+        except OSError as error:
+            logger.warning(f'Failed to save "{file_path}" to the import cache: {error}')
+
+    def touch(self):
+        """Marks this cache entry as the most recently used one."""
+        if self.entry_folder.exists():
+            os.utime(self.entry_folder)
+
+    def evict(self):
+        """Removes the least recently used cache entries until the cache fits in its max size."""
+        if not self.folder.exists():
+            return
+
+        entries = []
+        for entry_folder in self.folder.iterdir():
+            if entry_folder.is_dir():
+                size = sum(file_path.stat().st_size for file_path in entry_folder.iterdir())
+                entries.append((entry_folder.stat().st_mtime, size, entry_folder))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_folder in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            logger.info(f'Removing "{entry_folder.name}" from the import cache')
+            shutil.rmtree(entry_folder, ignore_errors=True)
+            total_size -= size
+
+
 class DNAImporter:
     def __init__(
         self,
@@ -69,10 +241,6 @@ class DNAImporter:
 
         self._prefix = self._instance.name
         self._import_lods = {}
-        self._index_to_vert = {}
-        self._index_to_face = {}
-        self._vert_index_to_dna_index = {}
-        self._face_index_to_dna_index = {}
         self._vertex_color_data = []
         self._default_vertex_color_layout = False
         self._component_type = component_type
@@ -121,22 +289,33 @@ class DNAImporter:
 
         return indices, positions
 
-    def get_dna_vertex_colors(self, mesh_index: int) -> tuple[list[int], list[list[float]]]:
+    def get_dna_vertex_colors(self, mesh_index: int) -> tuple[np.ndarray, np.ndarray]:
         if self._component_type == "body":
-            return [], []
+            return np.empty(0, dtype=np.int64), np.empty((0, 4), dtype=np.float32)
 
         # Avoid loading the vertex colors multiple times
         if not self._vertex_color_data:
-            vertex_colors_file = self.source_dna_file.parent / f"{self._prefix}_{MESH_VERTEX_COLORS_FILE_NAME}"
-            if not vertex_colors_file.exists():
-                vertex_colors_file = MESH_VERTEX_COLORS_FILE_PATH
+            # prefer the binary sidecar next to the DNA file, then its JSON, then the defaults in the addon resources
+            vertex_colors_file = next(
+                (
+                    file_path
+                    for file_path in (
+                        self.source_dna_file.parent / f"{self._prefix}_{MESH_VERTEX_COLORS_BINARY_FILE_NAME}",
+                        self.source_dna_file.parent / f"{self._prefix}_{MESH_VERTEX_COLORS_FILE_NAME}",
+                    )
+                    if file_path.exists()
+                ),
+                None,
+            )
+            if not vertex_colors_file:
+                vertex_colors_file = MESH_VERTEX_COLORS_BINARY_FILE_PATH
+                if not vertex_colors_file.exists():
+                    vertex_colors_file = MESH_VERTEX_COLORS_FILE_PATH
                 self._default_vertex_color_layout = True
 
-            with vertex_colors_file.open() as file:
-                self._vertex_color_data = json.load(file)
+            self._vertex_color_data = load_vertex_colors(vertex_colors_file)
 
-        data = self._vertex_color_data[mesh_index]
-        return (data["indices"], data["values"])
+        return self._vertex_color_data[mesh_index]
 
     def get_dna_vertex_normals(self, mesh_index: int) -> dict[int, Vector]:
         x_values = self._dna_reader.getVertexNormalXs(mesh_index)
@@ -218,95 +397,190 @@ class DNAImporter:
 
         return shape_key  # pyright: ignore[reportReturnType]
 
-    def set_custom_bone_shape(self, pose_bone: bpy.types.PoseBone):
+    def set_custom_bone_shape(self, pose_bone: bpy.types.PoseBone, bone_shape: bpy.types.Object | None = None):
         if pose_bone.rotation_mode != "XYZ":
             pose_bone.rotation_mode = "XYZ"
-        pose_bone.custom_shape = utilities.get_bone_shape()
+        pose_bone.custom_shape = bone_shape or utilities.get_bone_shape()
         pose_bone.custom_shape_scale_xyz = CUSTOM_BONE_SHAPE_SCALE
 
-    def set_vertex_groups(self, mesh_index: int, mesh_object: bpy.types.Object):
+    def decode_mesh(self, mesh_index: int, import_vertex_groups: bool) -> DecodedMesh:
+        """
+        Reads the DNA arrays of a mesh and converts them into buffers that can be written directly to a
+        blender mesh. This does not touch any blender data, so it is safe to run on a worker thread.
+
+        Args:
+            mesh_index (int): The index of the mesh in the DNA file.
+            import_vertex_groups (bool): Whether to decode the skin weights. This is read from the import
+                properties on the main thread, since they are blender data.
+
+        Returns:
+            DecodedMesh: The decoded mesh data.
+        """
+        # vertex positions
+        positions = np.column_stack(
+            (
+                np.asarray(self._dna_reader.getVertexPositionXs(mesh_index), dtype=np.float32),
+                np.asarray(self._dna_reader.getVertexPositionYs(mesh_index), dtype=np.float32),
+                np.asarray(self._dna_reader.getVertexPositionZs(mesh_index), dtype=np.float32),
+            )
+        )
+        layout_position_indices = np.asarray(
+            self._dna_reader.getVertexLayoutPositionIndices(mesh_index), dtype=np.int64
+        )
+
+        # only the positions used by the vertex layout become vertices, and they are kept in the same order
+        # as the DNA file. This maps each vertex layout index to its vertex index in the mesh.
+        position_indices = np.unique(layout_position_indices)
+        layout_to_vertex = np.searchsorted(position_indices, layout_position_indices)
+
+        # face layout
+        face_sizes = []
+        loop_layout_indices = []
+        face_keys = set()
+        layout_to_vertex_list = layout_to_vertex.tolist()
+        for index, face_layout_indices in enumerate(self.get_dna_faces(mesh_index)):
+            # skip the faces that blender can't create, which are degenerate or duplicate faces
+            face_vertex_indices = [layout_to_vertex_list[i] for i in face_layout_indices]
+            face_key = frozenset(face_vertex_indices)
+            if len(face_key) < 3 or len(face_key) != len(face_vertex_indices) or face_key in face_keys:
+                logger.error(f"Face {index} failed to create on mesh index {mesh_index}")
+                continue
+
+            face_keys.add(face_key)
+            face_sizes.append(len(face_layout_indices))
+            loop_layout_indices.append(face_layout_indices)
+
+        loop_layout_indices = np.fromiter(
+            itertools.chain.from_iterable(loop_layout_indices), dtype=np.int64, count=sum(face_sizes)
+        )
+        face_sizes = np.asarray(face_sizes, dtype=np.int64)
+
+        # the loops are created in vertex layout order, so the layout indices map directly to the loops
+        uvs = np.column_stack(
+            (
+                np.asarray(self._dna_reader.getVertexTextureCoordinateUs(mesh_index), dtype=np.float32),
+                np.asarray(self._dna_reader.getVertexTextureCoordinateVs(mesh_index), dtype=np.float32),
+            )
+        )
+        uv_indices = np.asarray(self._dna_reader.getVertexLayoutTextureCoordinateIndices(mesh_index), dtype=np.int64)
+
+        normals = np.column_stack(
+            (
+                np.asarray(self._dna_reader.getVertexNormalXs(mesh_index), dtype=np.float32),
+                np.asarray(self._dna_reader.getVertexNormalYs(mesh_index), dtype=np.float32),
+                np.asarray(self._dna_reader.getVertexNormalZs(mesh_index), dtype=np.float32),
+            )
+        )
+        normal_indices = np.asarray(self._dna_reader.getVertexLayoutNormalIndices(mesh_index), dtype=np.int64)
+
+        return DecodedMesh(
+            mesh_index=mesh_index,
+            positions=(positions[position_indices] * self._linear_modifier).ravel(),
+            position_indices=position_indices,
+            loop_vertex_indices=layout_to_vertex[loop_layout_indices].astype(np.int32),
+            loop_layout_indices=loop_layout_indices.astype(np.int32),
+            loop_starts=(np.cumsum(face_sizes) - face_sizes).astype(np.int32),
+            uvs=uvs[uv_indices[loop_layout_indices]].ravel(),
+            normals=normals[normal_indices[loop_layout_indices]] * self._linear_modifier,
+            skin_weights=self.get_dna_skin_weights(mesh_index, position_indices) if import_vertex_groups else {},
+        )
+
+    def get_import_cache(self) -> DNAImportCache | None:
+        preferences = utilities.get_addon_preferences()
+        if (preferences and not preferences.import_cache_enabled) or not self.source_dna_file.is_file():
+            return None
+
+        max_size = preferences.import_cache_max_size if preferences else IMPORT_CACHE_MAX_SIZE
+        return DNAImportCache(
+            dna_file_path=self.source_dna_file,
+            options={
+                "linear_modifier": self._linear_modifier,
+                "import_vertex_groups": bool(self._import_properties.import_vertex_groups),
+            },
+            max_size=max_size * 1024 * 1024,
+        )
+
+    def load_mesh(self, mesh_index: int, cache: DNAImportCache | None, import_vertex_groups: bool) -> DecodedMesh:
+        """
+        Loads the decoded mesh from the import cache, or decodes it from the DNA file and caches it.
+
+        Args:
+            mesh_index (int): The index of the mesh in the DNA file.
+            cache (DNAImportCache | None): The import cache, or None to always decode the mesh.
+            import_vertex_groups (bool): Whether to decode the skin weights.
+
+        Returns:
+            DecodedMesh: The decoded mesh data.
+        """
+        if cache:
+            mesh_data = cache.load(mesh_index)
+            if mesh_data:
+                return mesh_data
+
+        mesh_data = self.decode_mesh(mesh_index, import_vertex_groups)
+        if cache:
+            cache.save(mesh_data)
+        return mesh_data
+
+    def get_dna_skin_weights(
+        self, mesh_index: int, position_indices: np.ndarray
+    ) -> dict[str, list[tuple[float, list[int]]]]:
+        # gather the weights per joint first, so each vertex group is only resolved once
+        joint_weights: dict[int, tuple[list[int], list[float]]] = {}
+        for vertex_index, dna_vertex_index in enumerate(position_indices.tolist()):
+            vertex_bone_indices = self._dna_reader.getSkinWeightsJointIndices(mesh_index, dna_vertex_index)
+            vertex_weights = self._dna_reader.getSkinWeightsValues(mesh_index, dna_vertex_index)
+            for bone_index, weight in zip(vertex_bone_indices, vertex_weights, strict=False):
+                if bone_index not in joint_weights:
+                    joint_weights[bone_index] = ([], [])
+                joint_weights[bone_index][0].append(vertex_index)
+                joint_weights[bone_index][1].append(weight)
+
+        skin_weights = {}
+        for bone_index, (vertex_indices, vertex_weights) in joint_weights.items():
+            # the vertices that share the same weight are batched together
+            indices = np.asarray(vertex_indices, dtype=np.int64)
+            weights, weight_indices = np.unique(np.asarray(vertex_weights, dtype=np.float32), return_inverse=True)
+            batches = np.split(
+                indices[np.argsort(weight_indices, kind="stable")], np.cumsum(np.bincount(weight_indices))[:-1]
+            )
+            skin_weights[self._dna_reader.getJointName(bone_index)] = [
+                (weight, batch.tolist()) for weight, batch in zip(weights.tolist(), batches, strict=True)
+            ]
+
+        return skin_weights
+
+    def set_vertex_groups(self, mesh_data: DecodedMesh, mesh_object: bpy.types.Object):
         if not mesh_object.data or not isinstance(mesh_object.data, bpy.types.Mesh):
             logger.warning(
                 f"Object '{mesh_object.name}' has no mesh data in the blender scene. Skipping vertex group export..."
             )
             return
 
-        for vertex in mesh_object.data.vertices:
-            vertex_bone_indices = self._dna_reader.getSkinWeightsJointIndices(mesh_index, vertex.index)
-            vertex_weights = self._dna_reader.getSkinWeightsValues(mesh_index, vertex.index)
+        for vertex_group_name, batches in mesh_data.skin_weights.items():
+            vertex_group = mesh_object.vertex_groups.get(vertex_group_name)
+            if not vertex_group:
+                vertex_group = mesh_object.vertex_groups.new(name=vertex_group_name)
+            for weight, vertex_indices in batches:
+                vertex_group.add(index=vertex_indices, weight=weight, type="REPLACE")
 
-            for bone_index, weight in zip(vertex_bone_indices, vertex_weights, strict=False):
-                vertex_group_name = self._dna_reader.getJointName(bone_index)
-                vertex_group = mesh_object.vertex_groups.get(vertex_group_name)
-                if not vertex_group:
-                    vertex_group = mesh_object.vertex_groups.new(name=vertex_group_name)
-                vertex_group.add(index=[vertex.index], weight=weight, type="REPLACE")
-
-    def set_mesh_normals(self, mesh_index: int, mesh: bpy.types.Mesh):
-        x_values = self._dna_reader.getVertexNormalXs(mesh_index)
-        y_values = self._dna_reader.getVertexNormalYs(mesh_index)
-        z_values = self._dna_reader.getVertexNormalZs(mesh_index)
-        normal_indices = self._dna_reader.getVertexLayoutNormalIndices(mesh_index)
-        mesh.normals_split_custom_set_from_vertices(
-            [
-                [
-                    x_values[normal_indices[index]] * self._linear_modifier,
-                    y_values[normal_indices[index]] * self._linear_modifier,
-                    z_values[normal_indices[index]] * self._linear_modifier,
-                ]
-                for index in self._index_to_vert
-            ]
-        )
-
-    def set_mesh_vertex_positions(self, mesh_index: int, bmesh_object: bmesh.types.BMesh):
-        x_values = self._dna_reader.getVertexPositionXs(mesh_index)
-        y_values = self._dna_reader.getVertexPositionYs(mesh_index)
-        z_values = self._dna_reader.getVertexPositionZs(mesh_index)
+    def set_mesh_normals(self, mesh_data: DecodedMesh, mesh: bpy.types.Mesh):
+        mesh.normals_split_custom_set(mesh_data.normals)
 
-        self._index_to_vert.clear()
-        for dna_index in self._dna_reader.getVertexLayoutPositionIndices(mesh_index):
-            if not self._index_to_vert.get(dna_index):
-                vert = bmesh_object.verts.new(
-                    [
-                        x_values[dna_index] * self._linear_modifier,
-                        y_values[dna_index] * self._linear_modifier,
-                        z_values[dna_index] * self._linear_modifier,
-                    ]
-                )
-                self._index_to_vert[dna_index] = vert
-
-        bmesh_object.verts.index_update()
-        # flip the dictionary so that we can get the dna index from the vertex index
-        self._vert_index_to_dna_index = {vert.index: index for index, vert in self._index_to_vert.items()}
-        # sort the vertices so that they are in the same order as the DNA file
-        bmesh_object.verts.sort(key=lambda v: self._vert_index_to_dna_index[v.index])
-        bmesh_object.verts.ensure_lookup_table()
-
-    def set_mesh_face_layout(self, mesh_index: int, bmesh_object: bmesh.types.BMesh):
-        vertex_indices = self._dna_reader.getVertexLayoutPositionIndices(mesh_index)
-        self._index_to_face.clear()
-        for index in range(self._dna_reader.getFaceCount(mesh_index)):
-            try:
-                face = bmesh_object.faces.new(
-                    [
-                        bmesh_object.verts[vertex_indices[i]]
-                        for i in self._dna_reader.getFaceVertexLayoutIndices(mesh_index, index)
-                    ]
-                )
-                self._index_to_face[index] = face
-            except (RuntimeError, Exception):
-                logger.error(f"Face {index} failed to create on mesh index {mesh_index}")
+    def set_mesh_vertex_positions(self, mesh_data: DecodedMesh, mesh: bpy.types.Mesh):
+        mesh.vertices.add(len(mesh_data.position_indices))
+        mesh.vertices.foreach_set("co", mesh_data.positions)
 
-        bmesh_object.faces.index_update()
-        # flip the dictionary so that we can get the dna index from the face index
-        self._face_index_to_dna_index = {face.index: index for index, face in self._index_to_face.items()}
-        bmesh_object.faces.sort(key=lambda f: self._face_index_to_dna_index[f.index])
-        bmesh_object.faces.ensure_lookup_table()
+    def set_mesh_face_layout(self, mesh_data: DecodedMesh, mesh: bpy.types.Mesh):
+        mesh.loops.add(len(mesh_data.loop_vertex_indices))
+        mesh.loops.foreach_set("vertex_index", mesh_data.loop_vertex_indices)
+        mesh.polygons.add(len(mesh_data.loop_starts))
+        mesh.polygons.foreach_set("loop_start", mesh_data.loop_starts)
+        mesh.update(calc_edges=True)
 
-    def set_smooth(self, bmesh_object: bmesh.types.BMesh):
+    def set_smooth(self, mesh: bpy.types.Mesh):
         # smooth faces all faces
-        for face in bmesh_object.faces:
-            face.smooth = True
+        mesh.shade_smooth()
 
     @staticmethod
     def init_uvs(mesh: bpy.types.Mesh):
@@ -315,50 +589,54 @@ class DNAImporter:
             uv_layer = mesh.uv_layers.new(name=UV_MAP_NAME)
         mesh.uv_layers.active = uv_layer
 
-    def set_mesh_uvs(self, mesh_index: int, bmesh_object: bmesh.types.BMesh):
-        u_values = self._dna_reader.getVertexTextureCoordinateUs(mesh_index)
-        v_values = self._dna_reader.getVertexTextureCoordinateVs(mesh_index)
-        uv_indices = self._dna_reader.getVertexLayoutTextureCoordinateIndices(mesh_index)
-        uv_layer = bmesh_object.loops.layers.uv.active
-
-        for face in bmesh_object.faces:
-            face_vert_indices = [v.index for v in face.verts]
-            dna_face_vert_indices = self._dna_reader.getFaceVertexLayoutIndices(mesh_index, face.index)
-            lookup = dict(zip(face_vert_indices, dna_face_vert_indices, strict=False))
-            for loop in face.loops:
-                uv_index = uv_indices[lookup[loop.vert.index]]
-                loop[uv_layer].uv.x = u_values[uv_index]
-                loop[uv_layer].uv.y = v_values[uv_index]
-
-    def set_vertex_colors(self, mesh_index: int, bmesh_object: bmesh.types.BMesh):
-        vertex_color_indices, vertex_color_values = self.get_dna_vertex_colors(mesh_index)
-        if not vertex_color_indices or not vertex_color_values:
-            logger.debug(f"No vertex colors found for mesh index {mesh_index}. Skipping vertex color import.")
-            return
+    def set_mesh_uvs(self, mesh_data: DecodedMesh, mesh: bpy.types.Mesh):
+        uv_layer = mesh.uv_layers.active
+        uv_layer.data.foreach_set("uv", mesh_data.uvs)
 
-        bmesh_object.loops.layers.color.verify()
-        color_layer = bmesh_object.loops.layers.color.active
+    def set_vertex_colors(self, mesh_data: DecodedMesh, mesh: bpy.types.Mesh):
+        vertex_color_indices, vertex_color_values = self.get_dna_vertex_colors(mesh_data.mesh_index)
+        if not len(vertex_color_indices) or not len(vertex_color_values):
+            logger.debug(f"No vertex colors found for mesh index {mesh_data.mesh_index}. Skipping vertex color import.")
+            return
 
         if self._default_vertex_color_layout:
-            for vertex_index in self._dna_reader.getVertexLayoutPositionIndices(mesh_index):
-                vert = bmesh_object.verts[vertex_index]
-                for loop in vert.link_loops:
-                    value = vertex_color_values[vertex_color_indices[vertex_index]]
-                    loop[color_layer] = Vector(value)
-
-        # Todo: Implement the custom vertex color layout from exported JSON file
-        # else:  # noqa: ERA001
-        #     for face in bmesh_object.faces:
-        #         face_vert_indices = [v.index for v in face.verts]  # noqa: ERA001
-        #         dna_face_vert_indices = self._dna_reader.getFaceVertexLayoutIndices(mesh_index, face.index)  # noqa: E501, ERA001
-        #         lookup = dict(zip(face_vert_indices, dna_face_vert_indices))  # noqa: ERA001
-        #         for loop in face.loops:
-        #             vertex_color_index = vertex_color_indices[lookup[loop.vert.index]]  # noqa: ERA001
-        #             loop[color_layer] = Vector(vertex_color_values[vertex_color_index])  # noqa: ERA001
-
-    def create_mesh_object(self, lod_index: int, mesh_name: str) -> bpy.types.Object:
+            # each loop gets the color of the DNA vertex position it uses
+            loop_color_keys = mesh_data.position_indices[mesh_data.loop_vertex_indices]
+        else:
+            # exported vertex colors store the color of each DNA vertex layout, so each loop gets the color
+            # of the layout index its face uses for it
+            loop_color_keys = mesh_data.loop_layout_indices
+
+        if loop_color_keys.max(initial=0) >= len(vertex_color_indices):
+            logger.warning(
+                f"The vertex colors do not match the vertices of mesh index {mesh_data.mesh_index}. "
+                "Skipping vertex color import."
+            )
+            return
+
+        loop_color_indices = vertex_color_indices[loop_color_keys]
+        if loop_color_indices.max(initial=0) >= len(vertex_color_values):
+            logger.warning(
+                f"The vertex colors of mesh index {mesh_data.mesh_index} are missing color values. "
+                "Skipping vertex color import."
+            )
+            return
+
+        color_attribute = mesh.color_attributes.new(
+            name=VERTEX_COLOR_ATTRIBUTE_NAME, type="BYTE_COLOR", domain="CORNER"
+        )
+        color_attribute.data.foreach_set(  # type: ignore[attr-defined]
+            "color_srgb", vertex_color_values[loop_color_indices].ravel()
+        )
+        mesh.color_attributes.active_color = color_attribute
+
+    def create_mesh_object(
+        self, lod_index: int, mesh_name: str, mesh_data: DecodedMesh | None = None
+    ) -> bpy.types.Object:
         name = f"{self._prefix}_{mesh_name}"
         mesh_index = self._import_lods[lod_index][mesh_name]["mesh_index"]
+        if mesh_data is None:
+            mesh_data = self.decode_mesh(mesh_index, bool(self._import_properties.import_vertex_groups))
 
         # remove the mesh object if it already exists
         mesh_object = bpy.data.objects.get(name)
@@ -380,39 +658,28 @@ class DNAImporter:
             bpy.context.view_layer.objects.active = mesh_object
         mesh_object.select_set(True)
 
-        # Initialize the UV map
-        self.init_uvs(mesh)
-
-        # create an empty BMesh
-        bmesh_object = bmesh.new()
-
-        # fill it in from a Mesh
-        bmesh_object.from_mesh(mesh=mesh)
-
-        self.set_mesh_vertex_positions(mesh_index, bmesh_object)
-        self.set_mesh_face_layout(mesh_index, bmesh_object)
-        self.set_smooth(bmesh_object)
+        # Build the mesh geometry directly from the DNA arrays
+        self.set_mesh_vertex_positions(mesh_data, mesh)
+        self.set_mesh_face_layout(mesh_data, mesh)
+        self.set_smooth(mesh)
 
         # Add vertex colors
         # Todo: See if we can import vertex colors on all LODs.
         if self._import_properties.import_vertex_colors and lod_index == 0 and self._component_type == "head":
-            self.set_vertex_colors(mesh_index, bmesh_object)
+            self.set_vertex_colors(mesh_data, mesh)
 
         # Add UVs
-        self.set_mesh_uvs(mesh_index, bmesh_object)
-
-        # send the data back to the mesh and free the BMesh from memory
-        bmesh_object.to_mesh(mesh)
-        bmesh_object.free()
+        self.init_uvs(mesh)
+        self.set_mesh_uvs(mesh_data, mesh)
 
         # Add custom split normals
         # Todo: Implement the custom split normals import. Currently, not correctly implemented
         if self._import_properties.import_normals:
-            self.set_mesh_normals(mesh_index, mesh)
+            self.set_mesh_normals(mesh_data, mesh)
 
         if self._import_properties.import_vertex_groups:
             # Create the vertex groups
-            self.set_vertex_groups(mesh_index, mesh_object=mesh_object)
+            self.set_vertex_groups(mesh_data, mesh_object=mesh_object)
             # Attach the mesh to the armature
             self.set_armature_modifier(mesh_object)
 
@@ -527,12 +794,34 @@ class DNAImporter:
         if not self.rig_object or not self.rig_object.data or not isinstance(self.rig_object.data, bpy.types.Armature):
             return
 
-        x_locations = self._dna_reader.getNeutralJointTranslationXs()
-        y_locations = self._dna_reader.getNeutralJointTranslationYs()
-        z_locations = self._dna_reader.getNeutralJointTranslationZs()
-        x_rotations = self._dna_reader.getNeutralJointRotationXs()
-        y_rotations = self._dna_reader.getNeutralJointRotationYs()
-        z_rotations = self._dna_reader.getNeutralJointRotationZs()
+        joint_count = self._dna_reader.getJointCount()
+        bone_names = [self._dna_reader.getJointName(index) for index in range(joint_count)]
+        parent_indices = np.fromiter(
+            (self._dna_reader.getJointParentIndex(index) for index in range(joint_count)),
+            dtype=np.int64,
+            count=joint_count,
+        )
+        translations = np.column_stack(
+            (
+                self._dna_reader.getNeutralJointTranslationXs(),
+                self._dna_reader.getNeutralJointTranslationYs(),
+                self._dna_reader.getNeutralJointTranslationZs(),
+            )
+        ).astype(np.float64)
+        rotations = np.column_stack(
+            (
+                self._dna_reader.getNeutralJointRotationXs(),
+                self._dna_reader.getNeutralJointRotationYs(),
+                self._dna_reader.getNeutralJointRotationZs(),
+            )
+        ).astype(np.float64)
+
+        # The first bone is in object space, and the others are in the space of their parent. So the
+        # global matrices are accumulated down the hierarchy before any edit bones are created.
+        global_matrices = utilities.get_joint_global_matrices(
+            local_matrices=utilities.get_joint_local_matrices(translations * self._linear_modifier, rotations),
+            parent_indices=parent_indices,
+        )
 
         # Switch to edit mode
         utilities.switch_to_bone_edit_mode(self.rig_object)
@@ -544,50 +833,22 @@ class DNAImporter:
         # Create the extra bones below the last bone in the DNA file
         extra_edit_bone = self.create_extra_bones()
 
-        for index in range(self._dna_reader.getJointCount()):
-            bone_name = self._dna_reader.getJointName(index)
-            location = Vector(
-                (
-                    x_locations[index] * self._linear_modifier,
-                    y_locations[index] * self._linear_modifier,
-                    z_locations[index] * self._linear_modifier,
-                )
-            )
-            euler_rotation = Euler(
-                (
-                    math.radians(x_rotations[index]),
-                    math.radians(y_rotations[index]),
-                    math.radians(z_rotations[index]),
-                ),
-                "XYZ",
-            )
-
-            # Create the new edit bone
+        edit_bones = []
+        for bone_name, global_matrix in zip(bone_names, global_matrices.tolist(), strict=True):
             edit_bone = self.rig_object.data.edit_bones.new(name=bone_name)
+            edit_bone.length = self._linear_modifier
+            edit_bone.matrix = Matrix(global_matrix)
+            edit_bones.append(edit_bone)
 
-            # The first bone is in object space
-            if index == 0:
-                edit_bone.length = self._linear_modifier
-                edit_bone.matrix = Matrix.Translation(location) @ euler_rotation.to_matrix().to_4x4()
-                # The last extra bone should be the parent of first bone in the DNA file
-                edit_bone.parent = extra_edit_bone
-
-            # Otherwise they are in parent space
-            else:
-                parent_index = self._dna_reader.getJointParentIndex(index)
-                parent_bone_name = self._dna_reader.getJointName(parent_index)
-                parent_bone = self.rig_object.data.edit_bones[parent_bone_name]
-                edit_bone.parent = parent_bone
-                edit_bone.length = self._linear_modifier
-                # Calculate the global transformation matrix of the bone
-                local_matrix = Matrix.Translation(location) @ euler_rotation.to_matrix().to_4x4()
-                global_matrix = parent_bone.matrix @ local_matrix
-                edit_bone.matrix = global_matrix
+        # The last extra bone should be the parent of first bone in the DNA file
+        for index, (edit_bone, parent_index) in enumerate(zip(edit_bones, parent_indices.tolist(), strict=True)):
+            edit_bone.parent = extra_edit_bone if parent_index == index else edit_bones[parent_index]
 
         # Set the custom bone shapes
         utilities.switch_to_object_mode()
+        bone_shape = utilities.get_bone_shape()
         for pose_bone in self.rig_object.pose.bones:
-            self.set_custom_bone_shape(pose_bone)
+            self.set_custom_bone_shape(pose_bone, bone_shape)
         self.rig_object.data.relation_line_position = "HEAD"
 
         # Rotate the armature and apply to Z-up
@@ -653,30 +914,53 @@ class DNAImporter:
         errors = []
         self.initialize_dna_data()
 
-        if self._import_properties.import_bones:
-            self.create_rig_object()
-            self.import_bones()
-            self.setup_swing_bones()
-            self.setup_twist_bones()
-
-        for lod_index, meshes in self._import_lods.items():
-            lod_meshes = []
-            for mesh_name in meshes:
-                # Create the mesh object
-                try:
-                    if self._import_properties.import_mesh:
-                        mesh_object = self.create_mesh_object(lod_index=lod_index, mesh_name=mesh_name)
-                        mesh_object.parent = self.rig_object
-                        lod_meshes.append(mesh_object)
-                except (RuntimeError, Exception) as error:
-                    message = f'Mesh "{mesh_name}" Error: {error}'
-                    errors.append(message)
-                    logger.error(message)
-
-            # Make a collection per LOD
-            utilities.move_to_collection(
-                scene_objects=lod_meshes, collection_name=f"{self._prefix}_lod{lod_index}", exclusively=True
-            )
+        cache = self.get_import_cache() if self._import_properties.import_mesh else None
+        # the workers can't read the import properties, since they are blender data
+        import_vertex_groups = bool(self._import_properties.import_vertex_groups)
+        with ThreadPoolExecutor(max_workers=IMPORT_DECODE_THREAD_COUNT) as executor:
+            # decode the meshes on worker threads, while the bones and meshes are built on the main thread
+            decoded_meshes = {}
+            if self._import_properties.import_mesh:
+                decoded_meshes = {
+                    (lod_index, mesh_name): executor.submit(
+                        self.load_mesh, mesh_data["mesh_index"], cache, import_vertex_groups
+                    )
+                    for lod_index, meshes in self._import_lods.items()
+                    for mesh_name, mesh_data in meshes.items()
+                }
+
+            if self._import_properties.import_bones:
+                self.create_rig_object()
+                self.import_bones()
+                self.setup_swing_bones()
+                self.setup_twist_bones()
+
+            for lod_index, meshes in self._import_lods.items():
+                lod_meshes = []
+                for mesh_name in meshes:
+                    # Create the mesh object
+                    try:
+                        if self._import_properties.import_mesh:
+                            mesh_object = self.create_mesh_object(
+                                lod_index=lod_index,
+                                mesh_name=mesh_name,
+                                mesh_data=decoded_meshes.pop((lod_index, mesh_name)).result(),
+                            )
+                            mesh_object.parent = self.rig_object
+                            lod_meshes.append(mesh_object)
+                    except (RuntimeError, Exception) as error:
+                        message = f'Mesh "{mesh_name}" Error: {error}'
+                        errors.append(message)
+                        logger.error(message)
+
+                # Make a collection per LOD
+                utilities.move_to_collection(
+                    scene_objects=lod_meshes, collection_name=f"{self._prefix}_lod{lod_index}", exclusively=True
+                )
+
+        if cache:
+            cache.touch()
+            cache.evict()
 
         if errors:
             return False, "\n".join(errors)
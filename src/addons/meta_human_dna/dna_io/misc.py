@@ -1,14 +1,14 @@
 # standard library imports
+import itertools
+import json
 import logging
-import math
 
 from pathlib import Path
 from typing import Literal
 
 # third party imports
 import bpy
-
-from mathutils import Matrix, Vector
+import numpy as np
 
 # local imports
 from ..constants import SHAPE_KEY_BASIS_NAME, ComponentType
@@ -129,78 +129,204 @@ def get_dna_component_type(file_path: Path) -> ComponentType | None:
     return component_type
 
 
+def save_vertex_colors(file_path: Path, vertex_color_data: list[tuple[np.ndarray, np.ndarray]]):
+    """
+    Saves the vertex colors of each mesh to a sidecar file. A compressed .npz file stores the vertex color indices of
+    all meshes as one packed int32 array and their RGBA values as one packed uint8 array, with the offsets
+    of each mesh in them. Any other suffix is saved as JSON.
+
+    Args:
+        file_path (Path): The path of the vertex colors file.
+        vertex_color_data (list[tuple[np.ndarray, np.ndarray]]): The vertex color indices and (n, 4) RGBA
+            values from 0 to 1 of each mesh, in mesh index order.
+    """
+    if file_path.suffix.lower() != ".npz":
+        with file_path.open("w") as file:
+            json.dump(
+                [
+                    {"indices": np.asarray(indices).tolist(), "values": np.asarray(values).tolist()}
+                    for indices, values in vertex_color_data
+                ],
+                file,
+            )
+        return
+
+    index_counts = [len(indices) for indices, _ in vertex_color_data]
+    value_counts = [len(values) for _, values in vertex_color_data]
+    np.savez_compressed(
+        file_path,
+        index_offsets=np.concatenate(([0], np.cumsum(index_counts, dtype=np.int64))),
+        value_offsets=np.concatenate(([0], np.cumsum(value_counts, dtype=np.int64))),
+        indices=np.concatenate([np.asarray(indices, dtype=np.int32) for indices, _ in vertex_color_data] or [[]]),
+        values=np.concatenate(
+            [
+                np.rint(np.clip(np.asarray(values, dtype=np.float32).reshape(-1, 4), 0.0, 1.0) * 255)
+                for _, values in vertex_color_data
+            ]
+            or [np.empty((0, 4))]
+        ).astype(np.uint8),
+    )
+
+
+def load_vertex_colors(file_path: Path) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Loads the vertex colors of each mesh from a .npz or JSON sidecar file.
+
+    Args:
+        file_path (Path): The path of the vertex colors file.
+
+    Returns:
+        list[tuple[np.ndarray, np.ndarray]]: The vertex color indices and (n, 4) float32 RGBA values from
+            0 to 1 of each mesh, in mesh index order.
+    """
+    if file_path.suffix.lower() != ".npz":
+        with file_path.open() as file:
+            return [
+                (
+                    np.asarray(data["indices"], dtype=np.int64),
+                    np.asarray(data["values"], dtype=np.float32).reshape(-1, 4),
+                )
+                for data in json.load(file)
+            ]
+
+    with np.load(file_path, allow_pickle=False) as data:
+        indices = data["indices"].astype(np.int64)
+        values = data["values"].astype(np.float32) / 255
+        index_offsets = data["index_offsets"].tolist()
+        value_offsets = data["value_offsets"].tolist()
+
+    return [
+        (indices[index_start:index_end], values[value_start:value_end])
+        for (index_start, index_end), (value_start, value_end) in zip(
+            itertools.pairwise(index_offsets), itertools.pairwise(value_offsets), strict=True
+        )
+    ]
+
+
 @exclude_rig_instance_evaluation
-def create_shape_key(
-    index: int,
+def create_shape_keys(
+    target_indices: list[int],
     mesh_index: int,
     mesh_object: bpy.types.Object,
     reader: "riglogic.BinaryStreamReader",
-    name: str,
+    names: list[str] | None = None,
     prefix: str = "",
     is_neutral: bool = False,
     linear_modifier: float = 1.0,
-) -> bpy.types.ShapeKey | None:
+) -> list[bpy.types.ShapeKey]:
+    """
+    Creates the shape keys for many blend shape targets of a mesh at once. The basis coordinates are read
+    once, and each shape key is written with a single foreach_set call.
+
+    Args:
+        target_indices (list[int]): The blend shape target indices of the mesh in the DNA.
+        mesh_index (int): The index of the mesh in the DNA.
+        mesh_object (bpy.types.Object): The mesh object to add the shape keys to.
+        reader (riglogic.BinaryStreamReader): The DNA reader.
+        names (list[str] | None, optional): The shape key names of the targets. Defaults to the blend shape
+            channel names in the DNA.
+        prefix (str, optional): The prefix of the shape key names. Defaults to "".
+        is_neutral (bool, optional): Whether to create the shape keys without their deltas. Defaults to False.
+        linear_modifier (float, optional): The scale from DNA units to blender units. Defaults to 1.0.
+
+    Returns:
+        list[bpy.types.ShapeKey]: The created shape keys.
+    """
     if not mesh_object:
-        logger.error(f"Mesh object not found for shape key {name}. Skipping creation.")
-        return None
+        logger.error(f"Mesh object not found for mesh index {mesh_index}. Skipping shape key creation.")
+        return []
     if not mesh_object.data or not isinstance(mesh_object.data, bpy.types.Mesh):
         logger.error(
             f"Object '{mesh_object.name}' has no mesh data in the blender scene. Skipping shape key creation..."
         )
-        return None
+        return []
     if not mesh_object.data.shape_keys:
         mesh_object.shape_key_add(name=SHAPE_KEY_BASIS_NAME, from_mix=False)
 
     window_manager_properties = get_addon_window_manager_properties()
     window_manager_properties.progress_mesh_name = mesh_object.name
-    # create the new key block on the shape key
-    logger.info(f"Creating shape key {name}")
-    shape_key_name = f"{prefix}{name}"
 
     switch_to_object_mode()
 
-    # Ensure no existing shape key influence is active before we create a new one
-    if mesh_object.data.shape_keys:
-        for key_block in mesh_object.data.shape_keys.key_blocks:
-            key_block.value = 0.0
-        mesh_object.active_shape_key_index = 0
-
-    shape_key = mesh_object.data.shape_keys.key_blocks.get(shape_key_name)  # type: ignore[attr-defined]
-    if shape_key:
-        shape_key.lock_shape = False
-        mesh_object.shape_key_remove(shape_key)
-
-    shape_key_block = mesh_object.shape_key_add(name=shape_key_name, from_mix=False)
-
-    # Import the deltas if the shape key is not supposed to be neutral
-    if not is_neutral:
-        # DNA is Y-up, Blender is Z-up, so we need to rotate the deltas
-        rotation_matrix = Matrix.Rotation(math.radians(90), 4, "X")  # type: ignore[arg-type]
-
-        delta_x_values = reader.getBlendShapeTargetDeltaXs(mesh_index, index)
-        delta_y_values = reader.getBlendShapeTargetDeltaYs(mesh_index, index)
-        delta_z_values = reader.getBlendShapeTargetDeltaZs(mesh_index, index)
-        vertex_indices = reader.getBlendShapeTargetVertexIndices(mesh_index, index)
-
-        # the new vertex layout is the original vertex layout with the deltas from the dna applied
-        for vertex_index, delta_x, delta_y, delta_z in zip(
-            vertex_indices, delta_x_values, delta_y_values, delta_z_values, strict=False
-        ):
-            try:
-                delta = Vector((delta_x, delta_y, delta_z)) * linear_modifier
-                rotated_delta = rotation_matrix @ delta
-
-                # set the positions of the shape key vertices
-                base_co = mesh_object.data.shape_keys.reference_key.data[vertex_index].co.copy()  # type: ignore[attr-defined]
-                shape_key_block.data[vertex_index].co = base_co + rotated_delta
-            except IndexError:
+    # Ensure no existing shape key influence is active before we create the new ones
+    key_blocks = mesh_object.data.shape_keys.key_blocks  # type: ignore[attr-defined]
+    key_blocks.foreach_set("value", np.zeros(len(key_blocks), dtype=np.float32))
+    mesh_object.active_shape_key_index = 0
+
+    # read the basis coordinates once for all the targets
+    reference_key = mesh_object.data.shape_keys.reference_key  # type: ignore[attr-defined]
+    basis = np.empty(len(reference_key.data) * 3, dtype=np.float32)
+    reference_key.data.foreach_get("co", basis)
+    basis = basis.reshape(-1, 3)
+
+    shape_key_blocks = []
+    for target_number, index in enumerate(target_indices):
+        if names:
+            name = names[target_number]
+        else:
+            name = reader.getBlendShapeChannelName(reader.getBlendShapeChannelIndex(mesh_index, index))
+        shape_key_name = f"{prefix}{name}"
+        logger.info(f"Creating shape key {shape_key_name}")
+
+        shape_key_block = key_blocks.get(shape_key_name)
+        if shape_key_block:
+            shape_key_block.lock_shape = False
+            mesh_object.shape_key_remove(shape_key_block)
+
+        shape_key_block = mesh_object.shape_key_add(name=shape_key_name, from_mix=False)
+
+        # Import the deltas if the shape key is not supposed to be neutral
+        if not is_neutral:
+            vertex_indices = np.asarray(reader.getBlendShapeTargetVertexIndices(mesh_index, index), dtype=np.int64)
+            # DNA is Y-up, Blender is Z-up, so the deltas are rotated 90 degrees around X
+            deltas = np.column_stack(
+                (
+                    np.asarray(reader.getBlendShapeTargetDeltaXs(mesh_index, index), dtype=np.float32),
+                    -np.asarray(reader.getBlendShapeTargetDeltaZs(mesh_index, index), dtype=np.float32),
+                    np.asarray(reader.getBlendShapeTargetDeltaYs(mesh_index, index), dtype=np.float32),
+                )
+            ) * np.float32(linear_modifier)
+
+            missing = vertex_indices >= len(basis)
+            if missing.any():
                 logger.warning(
-                    f'Vertex index {vertex_index} is missing for shape key "{name}". Was this deleted '
-                    f'on the base mesh "{mesh_object.name}"?'
+                    f"{np.count_nonzero(missing)} vertex indices are missing for shape key "
+                    f'"{shape_key_name}". Were these deleted on the base mesh "{mesh_object.name}"?'
                 )
+                vertex_indices = vertex_indices[~missing]
+                deltas = deltas[~missing]
 
-    shape_key_block.lock_shape = True
+            # the new vertex layout is the original vertex layout with the deltas from the dna applied
+            positions = basis.copy()
+            positions[vertex_indices] += deltas
+            shape_key_block.data.foreach_set("co", positions.ravel())
+
+        shape_key_block.lock_shape = True
+        shape_key_blocks.append(shape_key_block)
 
     update_mesh(mesh_object)
 
-    return shape_key_block
+    return shape_key_blocks
+
+
+def create_shape_key(
+    index: int,
+    mesh_index: int,
+    mesh_object: bpy.types.Object,
+    reader: "riglogic.BinaryStreamReader",
+    name: str,
+    prefix: str = "",
+    is_neutral: bool = False,
+    linear_modifier: float = 1.0,
+) -> bpy.types.ShapeKey | None:
+    shape_key_blocks = create_shape_keys(
+        target_indices=[index],
+        mesh_index=mesh_index,
+        mesh_object=mesh_object,
+        reader=reader,
+        names=[name],
+        prefix=prefix,
+        is_neutral=is_neutral,
+        linear_modifier=linear_modifier,
+    )
+    return shape_key_blocks[0] if shape_key_blocks else None
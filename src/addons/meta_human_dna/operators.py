@@ -4,10 +4,14 @@ import logging
 import math
 import queue
 import shutil
+import time
 import webbrowser
 
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import Any
 
 # third party imports
 import bpy
@@ -19,15 +23,18 @@ from . import constants, utilities
 from .components import MetaHumanComponentBody, MetaHumanComponentHead, get_meta_human_component
 from .constants import (
     DEFAULT_UV_TOLERANCE,
+    EXPORT_THREAD_COUNT,
     FACE_BOARD_NAME,
     HEAD_TEXTURE_LOGIC_NODE_LABEL,
     HEAD_TEXTURE_LOGIC_NODE_NAME,
     NUMBER_OF_HEAD_LODS,
+    PROGRESS_QUEUE_REDRAW_RATE,
+    PROGRESS_QUEUE_TIME_BUDGET,
     SHAPE_KEY_BASIS_NAME,
     ToolInfo,
 )
-from .dna_io import DNACalibrator, DNAExporter, get_dna_reader
-from .properties import BlendFileMetaHumanCollection, MetahumanImportProperties
+from .dna_io import BoneTransformsCache, DNACalibrator, DNAExporter, get_dna_reader
+from .properties import BakeJobData, BlendFileMetaHumanCollection, MetahumanImportProperties
 from .typing import *  # noqa: F403
 from .ui import callbacks, importer
 
@@ -52,6 +59,16 @@ class GenericProgressQueueOperator(bpy.types.Operator):
     _timer: bpy.types.Timer | None = None
     _commands_queue = queue.Queue()
     _commands_queue_size = 0
+    _start_time = 0.0
+    _last_redraw_time = 0.0
+
+    @property
+    def time_budget(self) -> float:
+        """The number of seconds of queued commands that are run per timer tick."""
+        preferences = utilities.get_addon_preferences()
+        if preferences:
+            return preferences.progress_queue_time_budget / 1000
+        return PROGRESS_QUEUE_TIME_BUDGET / 1000
 
     def modal(self, context: "Context", event: bpy.types.Event) -> set[str]:
         addon_window_manager_properties = utilities.get_addon_window_manager_properties(context)
@@ -60,33 +77,57 @@ class GenericProgressQueueOperator(bpy.types.Operator):
             return self.finish(context)
 
         if event.type == "TIMER" and context.screen:
-            [a.tag_redraw() for a in context.screen.areas]
             if self._commands_queue.empty():
                 return self.finish(context)
 
-            index, mesh_index, description, kwargs_callback, callback = self._commands_queue.get()
-            new_size = self._commands_queue.qsize()
+            # run as many commands as fit in the time budget before handing control back to the UI
+            tick_end = time.perf_counter() + self.time_budget
+            while not self._commands_queue.empty():
+                self.run_next_command(addon_window_manager_properties)
+                if time.perf_counter() >= tick_end:
+                    break
 
-            # calculate the kwargs
-            kwargs = kwargs_callback(index, mesh_index)
-            # inject the kwargs into the description
-            description = description.format(**kwargs)
-            addon_window_manager_properties.progress = (
-                self._commands_queue_size - new_size
-            ) / self._commands_queue_size
-            addon_window_manager_properties.progress_description = description
-            callback(**kwargs)
+            # only redraw at the UI refresh rate, rather than on every tick
+            if time.perf_counter() - self._last_redraw_time >= 1 / PROGRESS_QUEUE_REDRAW_RATE:
+                [a.tag_redraw() for a in context.screen.areas]
+                self._last_redraw_time = time.perf_counter()
 
         return {"PASS_THROUGH"}
 
+    def run_next_command(self, addon_window_manager_properties: "MetahumanWindowMangerProperties"):
+        index, mesh_index, description, kwargs_callback, callback = self._commands_queue.get()
+        completed = self._commands_queue_size - self._commands_queue.qsize()
+
+        # calculate the kwargs
+        kwargs = kwargs_callback(index, mesh_index)
+        # inject the kwargs into the description
+        description = description.format(**kwargs)
+        addon_window_manager_properties.progress = completed / self._commands_queue_size
+        addon_window_manager_properties.progress_description = (
+            f"{description} ({completed / max(time.perf_counter() - self._start_time, 1e-6):.1f}/s)"
+        )
+        callback(**kwargs)
+
+    def start_timer(self, context: "Context"):
+        self._start_time = time.perf_counter()
+        self._last_redraw_time = 0.0
+        self._timer = context.window_manager.event_timer_add(0.01, window=context.window)
+        context.window_manager.modal_handler_add(self)
+
+    def log_throughput(self):
+        elapsed = time.perf_counter() - self._start_time
+        completed = self._commands_queue_size - self._commands_queue.qsize()
+        if completed and elapsed > 0:
+            logger.info(
+                f"{self.bl_label}: ran {completed} commands in {elapsed:.2f}s ({completed / elapsed:.1f} commands/s)"
+            )
+
     def execute(self, context: "Context") -> set[str]:
         addon_window_manager_properties = utilities.get_addon_window_manager_properties(context)
 
         if not self.validate(context):
             return {"CANCELLED"}
 
-        self._timer = context.window_manager.event_timer_add(0.01, window=context.window)
-        context.window_manager.modal_handler_add(self)
         head = utilities.get_active_head()
         if head:
             addon_window_manager_properties.progress = 0
@@ -94,6 +135,7 @@ class GenericProgressQueueOperator(bpy.types.Operator):
             self._commands_queue = queue.Queue()
             self.set_commands_queue(context, head, self._commands_queue)
             self._commands_queue_size = self._commands_queue.qsize()
+            self.start_timer(context)
             return {"RUNNING_MODAL"}
         return {"CANCELLED"}
 
@@ -102,6 +144,7 @@ class GenericProgressQueueOperator(bpy.types.Operator):
 
         if self._timer:
             context.window_manager.event_timer_remove(self._timer)
+        self.log_throughput()
         addon_window_manager_properties.progress = 1
         # re-initialize the rig instance so the shape key blocks collection is updated for the UI
         instance = callbacks.get_active_rig_instance()
@@ -381,7 +424,113 @@ class ImportComponentAnimation(ImportAnimationBase, importer.ImportAnimation):
         return {"FINISHED"}
 
 
-class BakeAnimationBase(bpy.types.Operator):
+class BakeAnimationSettings:
+    """
+    Mix-in class containing the bake settings shared by the bake operators.
+    """
+
+    step: bpy.props.IntProperty(
+        name="Step",
+        default=1,
+        min=1,
+        description="The frame step to bake the animation on. Essentially add a keyframe every nth frame",
+    )  # pyright: ignore[reportInvalidTypeForm]
+
+    masks: bpy.props.BoolProperty(
+        name="Masks", default=True, description="Bakes the values of the wrinkle map masks over time"
+    )  # pyright: ignore[reportInvalidTypeForm]
+
+    shape_keys: bpy.props.BoolProperty(
+        name="Shape Keys", default=True, description="Bakes the values of the shape keys over time"
+    )  # pyright: ignore[reportInvalidTypeForm]
+
+    clean_curves: bpy.props.BoolProperty(
+        name="Clean Curves", default=False, description="Clean Curves, After baking curves, remove redundant keys"
+    )  # pyright: ignore[reportInvalidTypeForm]
+
+    bone_location: bpy.props.BoolProperty(
+        name="Bone Location", default=True, description="Bakes the location of the bones"
+    )  # pyright: ignore[reportInvalidTypeForm]
+    bone_rotation: bpy.props.BoolProperty(
+        name="Bone Rotation", default=True, description="Bakes the rotation of the bones"
+    )  # pyright: ignore[reportInvalidTypeForm]
+    bone_scale: bpy.props.BoolProperty(name="Bone Scale", default=True, description="Bakes the scale of the bones")  # pyright: ignore[reportInvalidTypeForm]
+
+    reduce_keyframes: bpy.props.BoolProperty(
+        name="Reduce Keyframes",
+        default=False,
+        description=(
+            "Simplifies the baked curves by removing the keyframes that can be linearly interpolated from their "
+            "neighbors within the channel tolerances below. This greatly reduces the size of the baked actions"
+        ),
+    )  # pyright: ignore[reportInvalidTypeForm]
+    location_tolerance: bpy.props.FloatProperty(
+        name="Location Tolerance",
+        default=0.0001,
+        min=0.0,
+        precision=5,
+        step=0.001,
+        description="The maximum error allowed when simplifying the baked bone location curves",
+    )  # pyright: ignore[reportInvalidTypeForm]
+    rotation_tolerance: bpy.props.FloatProperty(
+        name="Rotation Tolerance",
+        default=0.0001,
+        min=0.0,
+        precision=5,
+        step=0.001,
+        description="The maximum error allowed when simplifying the baked bone rotation curves",
+    )  # pyright: ignore[reportInvalidTypeForm]
+    scale_tolerance: bpy.props.FloatProperty(
+        name="Scale Tolerance",
+        default=0.0001,
+        min=0.0,
+        precision=5,
+        step=0.001,
+        description="The maximum error allowed when simplifying the baked bone scale curves",
+    )  # pyright: ignore[reportInvalidTypeForm]
+    shape_key_tolerance: bpy.props.FloatProperty(
+        name="Shape Key Tolerance",
+        default=0.001,
+        min=0.0,
+        precision=5,
+        step=0.01,
+        description="The maximum error allowed when simplifying the baked shape key value curves",
+    )  # pyright: ignore[reportInvalidTypeForm]
+    mask_tolerance: bpy.props.FloatProperty(
+        name="Mask Tolerance",
+        default=0.001,
+        min=0.0,
+        precision=5,
+        step=0.01,
+        description="The maximum error allowed when simplifying the baked wrinkle map mask curves",
+    )  # pyright: ignore[reportInvalidTypeForm]
+
+    @property
+    def channel_types(self) -> set[str]:
+        channel_types = set()
+        if self.bone_location:
+            channel_types.add("LOCATION")
+        if self.bone_rotation:
+            channel_types.add("ROTATION")
+        if self.bone_scale:
+            channel_types.add("SCALE")
+        return channel_types
+
+    @property
+    def keyframe_tolerances(self) -> dict[str, float] | None:
+        if not self.reduce_keyframes:
+            return None
+
+        return {
+            "location": self.location_tolerance,
+            "rotation": self.rotation_tolerance,
+            "scale": self.scale_tolerance,
+            "shape_key": self.shape_key_tolerance,
+            "mask": self.mask_tolerance,
+        }
+
+
+class BakeAnimationBase(bpy.types.Operator, BakeAnimationSettings):
     action_name: bpy.props.StringProperty(
         name="Action Name",
         default="baked_action",
@@ -427,33 +576,6 @@ class BakeAnimationBase(bpy.types.Operator):
         description="The frame to end baking the animation on",
     )  # pyright: ignore[reportInvalidTypeForm]
 
-    step: bpy.props.IntProperty(
-        name="Step",
-        default=1,
-        min=1,
-        description="The frame step to bake the animation on. Essentially add a keyframe every nth frame",
-    )  # pyright: ignore[reportInvalidTypeForm]
-
-    masks: bpy.props.BoolProperty(
-        name="Masks", default=True, description="Bakes the values of the wrinkle map masks over time"
-    )  # pyright: ignore[reportInvalidTypeForm]
-
-    shape_keys: bpy.props.BoolProperty(
-        name="Shape Keys", default=True, description="Bakes the values of the shape keys over time"
-    )  # pyright: ignore[reportInvalidTypeForm]
-
-    clean_curves: bpy.props.BoolProperty(
-        name="Clean Curves", default=False, description="Clean Curves, After baking curves, remove redundant keys"
-    )  # pyright: ignore[reportInvalidTypeForm]
-
-    bone_location: bpy.props.BoolProperty(
-        name="Bone Location", default=True, description="Bakes the location of the bones"
-    )  # pyright: ignore[reportInvalidTypeForm]
-    bone_rotation: bpy.props.BoolProperty(
-        name="Bone Rotation", default=True, description="Bakes the rotation of the bones"
-    )  # pyright: ignore[reportInvalidTypeForm]
-    bone_scale: bpy.props.BoolProperty(name="Bone Scale", default=True, description="Bakes the scale of the bones")  # pyright: ignore[reportInvalidTypeForm]
-
     def invoke(self, context: "Context", event: bpy.types.Event) -> set[str]:
         return context.window_manager.invoke_props_dialog(  # type: ignore[return-value]
             self, title=self.dialog_title, width=250
@@ -501,6 +623,21 @@ class BakeAnimationBase(bpy.types.Operator):
         row.prop(self, "bone_rotation", text="Rotation")
         row = self.layout.row()
         row.prop(self, "bone_scale", text="Scale")
+        row = self.layout.row()
+        row.label(text="Keyframe Reduction:")
+        row = self.layout.row()
+        row.prop(self, "reduce_keyframes")
+        if self.reduce_keyframes:
+            row = self.layout.row()
+            row.prop(self, "location_tolerance", text="Location")
+            row = self.layout.row()
+            row.prop(self, "rotation_tolerance", text="Rotation")
+            row = self.layout.row()
+            row.prop(self, "scale_tolerance", text="Scale")
+            row = self.layout.row()
+            row.prop(self, "shape_key_tolerance", text="Shape Keys")
+            row = self.layout.row()
+            row.prop(self, "mask_tolerance", text="Masks")
 
 
 class BakeFaceBoardAnimation(BakeAnimationBase):
@@ -516,14 +653,6 @@ class BakeFaceBoardAnimation(BakeAnimationBase):
 
         instance = callbacks.get_active_rig_instance()
         if instance and instance.head_rig:
-            channel_types = set()
-            if self.bone_location:
-                channel_types.add("LOCATION")
-            if self.bone_rotation:
-                channel_types.add("ROTATION")
-            if self.bone_scale:
-                channel_types.add("SCALE")
-
             action_name = utilities.get_action_name(
                 instance=instance,
                 action_name=self.action_name,
@@ -540,10 +669,11 @@ class BakeFaceBoardAnimation(BakeAnimationBase):
                 start_frame=self.start_frame,
                 end_frame=self.end_frame,
                 step=self.step,
-                channel_types=channel_types,
+                channel_types=self.channel_types,
                 clean_curves=self.clean_curves,
                 masks=self.masks,
                 shape_keys=self.shape_keys,
+                keyframe_tolerances=self.keyframe_tolerances,
             )
         return {"FINISHED"}
 
@@ -601,14 +731,6 @@ class BakeComponentAnimation(BakeAnimationBase):
 
         instance = callbacks.get_active_rig_instance()
         if instance and instance.body_rig and self.component_type == "body":
-            channel_types = set()
-            if self.bone_location:
-                channel_types.add("LOCATION")
-            if self.bone_rotation:
-                channel_types.add("ROTATION")
-            if self.bone_scale:
-                channel_types.add("SCALE")
-
             action_name = utilities.get_action_name(
                 instance=instance,
                 action_name=self.action_name,
@@ -625,7 +747,7 @@ class BakeComponentAnimation(BakeAnimationBase):
                 start_frame=self.start_frame,
                 end_frame=self.end_frame,
                 step=self.step,
-                channel_types=channel_types,
+                channel_types=self.channel_types,
                 clean_curves=self.clean_curves,
                 masks=self.masks,
                 shape_keys=self.shape_keys,
@@ -634,6 +756,7 @@ class BakeComponentAnimation(BakeAnimationBase):
                 twist_bones=self.twist_bones,
                 swing_bones=self.swing_bones,
                 other_bones=self.other_bones,
+                keyframe_tolerances=self.keyframe_tolerances,
             )
         return {"FINISHED"}
 
@@ -674,6 +797,105 @@ class BakeComponentAnimation(BakeAnimationBase):
         return False
 
 
+class BakeAnimationQueue(GenericProgressQueueOperator, BakeAnimationSettings):
+    """Bakes a queue of actions on one or more rig instances in a single call. The RigLogic state of each rig instance is reused between its jobs"""  # noqa: E501
+
+    bl_idname = f"{ToolInfo.NAME}.bake_animation_queue"
+    bl_label = "Bake Animation Queue"
+
+    jobs: bpy.props.CollectionProperty(type=BakeJobData)  # pyright: ignore[reportInvalidTypeForm]
+    replace_action: bpy.props.BoolProperty(
+        name="Replace Action", default=False, description="Replaces the existing actions with the baked actions"
+    )  # pyright: ignore[reportInvalidTypeForm]
+
+    _failed_job_count = 0
+
+    @property
+    def bake_jobs(self) -> list[utilities.BakeJob]:
+        return [
+            utilities.BakeJob(
+                instance_name=job.instance_name,
+                action_name=job.action_name,
+                start_frame=job.start_frame,
+                end_frame=job.end_frame,
+                component=job.component,
+                baked_action_name=job.baked_action_name,
+            )
+            for job in self.jobs
+        ]
+
+    @property
+    def bake_settings(self) -> dict:
+        return {
+            "replace_action": self.replace_action,
+            "step": self.step,
+            "clean_curves": self.clean_curves,
+            "channel_types": self.channel_types,
+            "masks": self.masks,
+            "shape_keys": self.shape_keys,
+            "keyframe_tolerances": self.keyframe_tolerances,
+        }
+
+    def validate(self, context: "Context") -> bool:
+        for job in self.jobs:
+            if job.start_frame > job.end_frame:
+                self.report({"ERROR"}, f'The start frame must be less than the end frame for "{job.action_name}"')
+                return False
+        return len(self.jobs) > 0
+
+    def execute(self, context: "Context") -> set[str]:
+        if not self.validate(context):
+            return {"CANCELLED"}
+
+        bake_jobs = self.bake_jobs
+
+        # without a window there are no timer events, so bake everything now
+        if bpy.app.background or not context.window:
+            failed_jobs = utilities.bake_queue(jobs=bake_jobs, **self.bake_settings)
+            if failed_jobs:
+                self.report({"WARNING"}, f"{len(failed_jobs)} of {len(bake_jobs)} bake jobs failed")
+            return {"FINISHED"}
+
+        addon_window_manager_properties = utilities.get_addon_window_manager_properties(context)
+        addon_window_manager_properties.progress = 0
+        addon_window_manager_properties.progress_description = ""
+
+        bake_settings = self.bake_settings
+        self._failed_job_count = 0
+        self._commands_queue = queue.Queue()
+        for index in range(len(bake_jobs)):
+            self._commands_queue.put(
+                (
+                    index,
+                    None,
+                    "{job.description}",
+                    lambda index, _: {"job": bake_jobs[index], **bake_settings},
+                    self.bake_job,
+                )
+            )
+        self._commands_queue_size = self._commands_queue.qsize()
+
+        self.start_timer(context)
+        return {"RUNNING_MODAL"}
+
+    def bake_job(self, **kwargs: Any):
+        if not utilities.bake_job(**kwargs):
+            self._failed_job_count += 1
+
+    def finish(self, context: "Context") -> set[str]:
+        addon_window_manager_properties = utilities.get_addon_window_manager_properties(context)
+
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+        self.log_throughput()
+        addon_window_manager_properties.progress = 1
+        addon_window_manager_properties.progress_description = ""
+        if self._failed_job_count:
+            self.report({"WARNING"}, f"{self._failed_job_count} of {self._commands_queue_size} bake jobs failed")
+        # the rig instances are not re-initialized here, so their RigLogic state is kept for the next bake
+        return {"FINISHED"}
+
+
 class ImportMetaHumanDna(bpy.types.Operator, importer.ImportAsset, MetahumanImportProperties):
     """Import a metahuman head from a DNA file"""
 
@@ -1092,10 +1314,34 @@ class ImportShapeKeys(GenericProgressQueueOperator):
     bl_label = "Import Shape Keys"
 
     def validate(self, context: "Context") -> bool:
+        instance = callbacks.get_active_rig_instance()
+        if instance and instance.shape_key_import_filter == "action" and not instance.shape_key_import_action:
+            self.report({"ERROR"}, "You must select an action to import its active shape keys")
+            return False
         return True
 
+    def get_channel_indices(self, component: MetaHumanComponentHead) -> set[int] | None:
+        instance = component.rig_instance
+        if instance.shape_key_import_filter == "action":
+            if not instance.head_initialized:
+                instance.head_initialize()
+            return utilities.get_active_head_channel_indices(instance, instance.shape_key_import_action)
+
+        if instance.shape_key_import_filter == "channels":
+            channel_names = {name.strip() for name in instance.shape_key_import_channels.split(",") if name.strip()}
+            return {
+                index
+                for index in range(component.dna_reader.getBlendShapeChannelCount())
+                if component.dna_reader.getBlendShapeChannelName(index) in channel_names
+            }
+
+        return None
+
     def set_commands_queue(self, context: "Context", component: MetaHumanComponentHead, commands_queue: queue.Queue):
-        component.import_shape_keys(commands_queue)
+        channel_indices = self.get_channel_indices(component)
+        if channel_indices is not None:
+            logger.info(f"Importing the shape keys of {len(channel_indices)} blend shape channels")
+        component.import_shape_keys(commands_queue, channel_indices=channel_indices)
         ops = utilities.get_addon_ops_module()
         ops.force_evaluate()
 
@@ -1180,81 +1426,208 @@ class SendToMetaHumanCreator(bpy.types.Operator):
     bl_idname = f"{ToolInfo.NAME}.send_to_meta_human_creator"
     bl_label = "Send to MetaHuman Creator"
 
-    def execute(self, context: "Context") -> set[str]:
-        instance = callbacks.get_active_rig_instance()
-        if instance:
-            # store the current auto evaluate settings
-            auto_evaluate_head = instance.auto_evaluate_head
-            auto_evaluate_body = instance.auto_evaluate_body
-
-            # disable auto evaluate while we are exporting
-            instance.auto_evaluate_head = False
-            instance.auto_evaluate_body = False
+    _timer: bpy.types.Timer | None
+    _executor: ThreadPoolExecutor | None
+    _stages: list[tuple[str, Callable[[], bool]]]
+    _stage_count: int
+    _futures: list[Future]
+    _messages: list[str]
+    _auto_evaluate: tuple[bool, bool]
+    _current_context: dict | None
+    _bone_transforms_cache: BoneTransformsCache | None
 
-            current_context = utilities.get_current_context()
-
-            for attribute_name in ["head_mesh", "head_rig", "body_mesh", "body_rig"]:
-                if not getattr(instance, attribute_name):
-                    self.report(
-                        {"ERROR"},
-                        (
-                            f"No {attribute_name} set on the active instance. Please ensure you have a "
-                            "head and body mesh and rig set before sending to MetaHuman Creator."
-                        ),
-                    )
-                    return {"CANCELLED"}
+    def execute(self, context: "Context") -> set[str]:
+        # the operator state lives on the instance, so a new run never sees the state of a previous one
+        self._timer = None
+        self._executor = None
+        self._stages = []
+        self._stage_count = 0
+        self._futures = []
+        self._messages = []
+        self._auto_evaluate = (True, True)
+        self._current_context = None
+        self._bone_transforms_cache = None
 
-            if not bpy.path.abspath(instance.output_folder_path) and not bpy.data.filepath:
-                self.report({"ERROR"}, "File must be saved to use a relative path")
-                return {"CANCELLED"}
+        instance = callbacks.get_active_rig_instance()
+        if not instance:
+            return {"FINISHED"}
 
-            head = utilities.get_active_head()
-            body = utilities.get_active_body()
-            if not head or not body:
+        for attribute_name in ["head_mesh", "head_rig", "body_mesh", "body_rig"]:
+            if not getattr(instance, attribute_name):
                 self.report(
                     {"ERROR"},
-                    "No active instance found. Please select an instance from the list under the RigLogic panel.",
+                    (
+                        f"No {attribute_name} set on the active instance. Please ensure you have a "
+                        "head and body mesh and rig set before sending to MetaHuman Creator."
+                    ),
                 )
                 return {"CANCELLED"}
 
-            last_component = None
-            for component in [head, body]:
-                dna_io_instance: DNAExporter = None  # type: ignore[assignment]
-                if instance.output_method == "calibrate":
-                    dna_io_instance = DNACalibrator(
-                        instance=instance,
-                        linear_modifier=component.linear_modifier,
-                        file_name=f"{component.component_type}.dna",
-                        component_type=component.component_type,
-                    )
-                elif instance.output_method == "overwrite":
-                    dna_io_instance = DNAExporter(
-                        instance=instance,
-                        linear_modifier=component.linear_modifier,
-                        file_name=f"{component.component_type}.dna",
-                        component_type=component.component_type,
-                    )
+        if not bpy.path.abspath(instance.output_folder_path) and not bpy.data.filepath:
+            self.report({"ERROR"}, "File must be saved to use a relative path")
+            return {"CANCELLED"}
 
-                valid, title, message, fix = dna_io_instance.run()
-                if not valid:
-                    utilities.report_error_panel(title=title, message=message, fix=fix, width=500)
-                    return {"CANCELLED"}
-                self.report({"INFO"}, message)
+        head = utilities.get_active_head()
+        body = utilities.get_active_body()
+        if not head or not body:
+            self.report(
+                {"ERROR"},
+                "No active instance found. Please select an instance from the list under the RigLogic panel.",
+            )
+            return {"CANCELLED"}
 
-                last_component = component
+        # store the current auto evaluate settings, and disable auto evaluate while we are exporting
+        self._auto_evaluate = (instance.auto_evaluate_head, instance.auto_evaluate_body)
+        instance.auto_evaluate_head = False
+        instance.auto_evaluate_body = False
+        self._current_context = utilities.get_current_context()
+        # the head calibration reads the body rig when aligning them, so reuse its bone transforms for the body
+        self._bone_transforms_cache = BoneTransformsCache()
+
+        # Each stage extracts scene data on the main thread, then submits its file writes to the worker pool
+        self._stages = [
+            (f"Exporting {component.component_type}...", lambda component=component: self.export_component(component))
+            for component in [head, body]
+        ]
+        # write a manifest file to the output folder similar to the MetaHuman Creator DCC export
+        self._stages.append(("Writing export manifest...", lambda: self.export_manifest(body)))
+        self._stage_count = len(self._stages)
+        self._executor = ThreadPoolExecutor(max_workers=EXPORT_THREAD_COUNT)
+
+        # without a window there is no event loop to run the modal timer, so run the stages now
+        if not context.window:
+            while self._stages:
+                description, stage = self._stages.pop(0)
+                try:
+                    if not stage():
+                        return self.finish(context, cancelled=True)
+                except Exception as error:
+                    logger.exception(f"{description} failed")
+                    self.report({"ERROR"}, str(error))
+                    return self.finish(context, cancelled=True)
+            self.restore_context()
+            return self.finish(context)
 
-            # write a manifest file to the output folder similar to the MetaHuman Creator DCC export
-            if last_component:
-                last_component.write_export_manifest()
-                ops = utilities.get_addon_ops_module()
-                ops.force_evaluate()
+        addon_window_manager_properties = utilities.get_addon_window_manager_properties(context)
+        addon_window_manager_properties.export_progress = 0
+        addon_window_manager_properties.export_progress_description = ""
+        self._timer = context.window_manager.event_timer_add(0.01, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
 
-            utilities.set_context(current_context)
+    def modal(self, context: "Context", event: bpy.types.Event) -> set[str]:
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
 
-            # restore the auto evaluate settings
-            instance.auto_evaluate_head = auto_evaluate_head
-            instance.auto_evaluate_body = auto_evaluate_body
+        addon_window_manager_properties = utilities.get_addon_window_manager_properties(context)
+        if self._stages:
+            description, stage = self._stages.pop(0)
+            addon_window_manager_properties.export_progress_description = description
+            try:
+                if not stage():
+                    return self.finish(context, cancelled=True)
+            except Exception as error:
+                logger.exception(f"{description} failed")
+                self.report({"ERROR"}, str(error))
+                return self.finish(context, cancelled=True)
+            # the remaining writes don't touch the scene, so give the user back their context right away
+            if not self._stages:
+                self.restore_context()
+        else:
+            saved_count = len([future for future in self._futures if future.done()])
+            if saved_count == len(self._futures):
+                return self.finish(context)
+            addon_window_manager_properties.export_progress_description = (
+                f"Saving files ({saved_count}/{len(self._futures)})..."
+            )
+
+        # each stage submits one file write, so the progress is the completed stages and writes
+        completed = self._stage_count - len(self._stages) + len([future for future in self._futures if future.done()])
+        addon_window_manager_properties.export_progress = completed / (self._stage_count * 2)
+        if context.screen:
+            [a.tag_redraw() for a in context.screen.areas]
+
+        return {"PASS_THROUGH"}
+
+    def export_component(self, component: MetaHumanComponentHead | MetaHumanComponentBody) -> bool:
+        instance = callbacks.get_active_rig_instance()
+        dna_io_instance: DNAExporter = None  # type: ignore[assignment]
+        if instance.output_method == "calibrate":  # type: ignore[union-attr]
+            dna_io_instance = DNACalibrator(
+                instance=instance,  # type: ignore[arg-type]
+                linear_modifier=component.linear_modifier,
+                file_name=f"{component.component_type}.dna",
+                component_type=component.component_type,
+                bone_transforms_cache=self._bone_transforms_cache,
+            )
+        elif instance.output_method == "overwrite":  # type: ignore[union-attr]
+            dna_io_instance = DNAExporter(
+                instance=instance,  # type: ignore[arg-type]
+                linear_modifier=component.linear_modifier,
+                file_name=f"{component.component_type}.dna",
+                component_type=component.component_type,
+                bone_transforms_cache=self._bone_transforms_cache,
+            )
 
+        valid, title, message, fix = dna_io_instance.extract()
+        if not valid:
+            utilities.report_error_panel(title=title, message=message, fix=fix, width=500)
+            return False
+
+        # encode the edited images on the main thread since they use blender data, then write the DNA and copy the
+        # unmodified image files on a worker thread
+        dna_io_instance.save_images()
+        self._futures.append(self._executor.submit(dna_io_instance.save))  # type: ignore[union-attr]
+        self._messages.append(message)
+        return True
+
+    def export_manifest(self, component: MetaHumanComponentHead | MetaHumanComponentBody) -> bool:
+        file_path, manifest = component.get_export_manifest()
+        self._futures.append(self._executor.submit(component.save_export_manifest, file_path, manifest))  # type: ignore[union-attr]
+        return True
+
+    def restore_context(self):
+        """Restores the selection, mode and active object that the extraction stages changed."""
+        if self._current_context is not None:
+            utilities.set_context(self._current_context)
+            self._current_context = None
+
+    def finish(self, context: "Context", cancelled: bool = False) -> set[str]:
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+
+        # wait for any writes that are still running, so no files are left half written
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._bone_transforms_cache = None
+        errors = [str(future.exception()) for future in self._futures if future.exception()]
+
+        addon_window_manager_properties = utilities.get_addon_window_manager_properties(context)
+        addon_window_manager_properties.export_progress = 1
+        addon_window_manager_properties.export_progress_description = ""
+
+        if not cancelled and not errors:
+            ops = utilities.get_addon_ops_module()
+            ops.force_evaluate()
+
+        # only restores the context if a stage failed before the last one ran
+        self.restore_context()
+
+        # restore the auto evaluate settings
+        instance = callbacks.get_active_rig_instance()
+        if instance:
+            instance.auto_evaluate_head, instance.auto_evaluate_body = self._auto_evaluate
+
+        if errors:
+            self.report({"ERROR"}, "\n".join(errors))
+            return {"CANCELLED"}
+        if cancelled:
+            return {"CANCELLED"}
+
+        for message in self._messages:
+            self.report({"INFO"}, message)
         return {"FINISHED"}
 
 
@@ -1285,6 +1658,7 @@ class ExportSelectedComponent(bpy.types.Operator):
                 self.report({"ERROR"}, "File must be saved to use a relative path")
                 return {"CANCELLED"}
 
+            bone_transforms_cache = BoneTransformsCache()
             dna_io_instance: DNAExporter = None  # type: ignore[assignment]
             if instance.output_method == "calibrate":
                 dna_io_instance = DNACalibrator(
@@ -1293,6 +1667,7 @@ class ExportSelectedComponent(bpy.types.Operator):
                     file_name=f"{component.component_type}.dna",
                     component_type=component.component_type,
                     textures=False,
+                    bone_transforms_cache=bone_transforms_cache,
                 )
             elif instance.output_method == "overwrite":
                 dna_io_instance = DNAExporter(
@@ -1301,6 +1676,7 @@ class ExportSelectedComponent(bpy.types.Operator):
                     file_name=f"{component.component_type}.dna",
                     component_type=component.component_type,
                     textures=False,
+                    bone_transforms_cache=bone_transforms_cache,
                 )
 
             valid, title, message, fix = dna_io_instance.run()
@@ -1430,6 +1806,14 @@ class ShapeKeyOperatorBase(bpy.types.Operator):
     def get_select_shape_key(self, instance: "RigInstance") -> tuple[int | None, bpy.types.ShapeKey | None, int | None]:
         # find the related mesh objects for the head rig
         channel_index = instance.head_channel_name_to_index_lookup[self.shape_key_name]
+
+        # shape keys that were left out of the import are created from the DNA the first time they are edited
+        if not any(
+            shape_key_block.name == self.shape_key_name
+            for shape_key_block in instance.head_shape_key_blocks.get(channel_index, [])
+        ):
+            instance.materialize_head_shape_key(self.shape_key_name)
+
         for shape_key_block in instance.head_shape_key_blocks.get(channel_index, []):
             if not shape_key_block.id_data:
                 continue
@@ -5,7 +5,13 @@ import logging
 import bpy
 
 # local imports
-from .constants import DEFAULT_BACKUPS_FOLDER, NUMBER_OF_HEAD_LODS, ToolInfo
+from .constants import (
+    DEFAULT_BACKUPS_FOLDER,
+    IMPORT_CACHE_MAX_SIZE,
+    NUMBER_OF_HEAD_LODS,
+    PROGRESS_QUEUE_TIME_BUDGET,
+    ToolInfo,
+)
 from .rig_instance import (
     OutputData,
     RigInstance,
@@ -57,6 +63,37 @@ class BlendFileMetaHumanCollection(bpy.types.PropertyGroup):
     enabled: bpy.props.BoolProperty(default=True)  # pyright: ignore[reportInvalidTypeForm]
 
 
+class BakeJobData(bpy.types.PropertyGroup):
+    instance_name: bpy.props.StringProperty(
+        default="",
+        description="The name of the rig instance to bake the action on",
+    )  # pyright: ignore[reportInvalidTypeForm]
+    action_name: bpy.props.StringProperty(
+        default="",
+        description="The name of the face board or body action to bake",
+    )  # pyright: ignore[reportInvalidTypeForm]
+    start_frame: bpy.props.IntProperty(
+        default=1,
+        description="The frame to start baking the animation on",
+    )  # pyright: ignore[reportInvalidTypeForm]
+    end_frame: bpy.props.IntProperty(
+        default=250,
+        description="The frame to end baking the animation on",
+    )  # pyright: ignore[reportInvalidTypeForm]
+    component: bpy.props.EnumProperty(
+        default="head",
+        items=[
+            ("head", "Head", "Bake the action on the face board to the head"),
+            ("body", "Body", "Bake the action on the body rig"),
+        ],
+        description="The component the action animates",
+    )  # pyright: ignore[reportInvalidTypeForm]
+    baked_action_name: bpy.props.StringProperty(
+        default="",
+        description='The name of the baked action. Defaults to the action name with a "_baked" suffix',
+    )  # pyright: ignore[reportInvalidTypeForm]
+
+
 class ExtraDnaFolder(bpy.types.PropertyGroup):
     folder_path: bpy.props.StringProperty(
         default="", description="The folder location of the extension repo.", subtype="DIR_PATH"
@@ -74,6 +111,34 @@ class MetahumanAddonProperties:
         description="This will send anonymous usage data to Poly Hammer to help improve the addon and help catch bugs",
     )  # pyright: ignore[reportInvalidTypeForm]
 
+    progress_queue_time_budget: bpy.props.IntProperty(
+        name="Queue Time Budget",
+        default=PROGRESS_QUEUE_TIME_BUDGET,
+        min=1,
+        max=1000,
+        description=(
+            "The number of milliseconds of queued work, like importing shape keys, that is run between UI "
+            "updates. Higher values finish faster, but make the UI less responsive while the work runs"
+        ),
+    )  # pyright: ignore[reportInvalidTypeForm]
+    import_cache_enabled: bpy.props.BoolProperty(
+        name="Import Cache",
+        default=True,
+        description=(
+            "Caches the decoded meshes of imported DNA files on disk, so importing the same DNA file again "
+            "rebuilds its meshes without decoding them"
+        ),
+    )  # pyright: ignore[reportInvalidTypeForm]
+    import_cache_max_size: bpy.props.IntProperty(
+        name="Import Cache Size",
+        default=IMPORT_CACHE_MAX_SIZE,
+        min=0,
+        description=(
+            "The number of megabytes the import cache can use on disk. The least recently imported DNA files "
+            "are removed from the cache when it is full"
+        ),
+    )  # pyright: ignore[reportInvalidTypeForm]
+
     # ------- RBF Editor Properties -------
 
     rbf_editor_show_viewport_overlay: bpy.props.BoolProperty(
@@ -171,8 +236,8 @@ class MetahumanImportProperties(get_dna_import_property_group_base_class()):
         name="Vertex Colors",
         description=(
             "Whether to import the vertex colors for the head mesh. Note this will first look "
-            "for a vertex_colors.json in the same folder as the .dna file. Otherwise it will use the "
-            "default vertex_colors.json in the addon resources"
+            "for a vertex_colors.npz or vertex_colors.json in the same folder as the .dna file. Otherwise it will "
+            "use the default vertex colors in the addon resources"
         ),
     )  # pyright: ignore[reportInvalidTypeForm]
     import_materials: bpy.props.BoolProperty(
@@ -220,6 +285,8 @@ class MetahumanWindowMangerProperties(bpy.types.PropertyGroup, MetahumanImportPr
     progress: bpy.props.FloatProperty(default=1.0)  # pyright: ignore[reportInvalidTypeForm]
     progress_description: bpy.props.StringProperty(default="")  # pyright: ignore[reportInvalidTypeForm]
     progress_mesh_name: bpy.props.StringProperty(default="")  # pyright: ignore[reportInvalidTypeForm]
+    export_progress: bpy.props.FloatProperty(default=1.0)  # pyright: ignore[reportInvalidTypeForm]
+    export_progress_description: bpy.props.StringProperty(default="")  # pyright: ignore[reportInvalidTypeForm]
     evaluate_dependency_graph: bpy.props.BoolProperty(default=True)  # pyright: ignore[reportInvalidTypeForm]
     is_undoing: bpy.props.BoolProperty(default=False)  # pyright: ignore[reportInvalidTypeForm]
     is_rendering: bpy.props.BoolProperty(default=False)  # pyright: ignore[reportInvalidTypeForm]
@@ -340,6 +407,7 @@ def register():
     # Now register RigLogicInstance
     bpy.utils.register_class(RigInstance)
     bpy.utils.register_class(BlendFileMetaHumanCollection)
+    bpy.utils.register_class(BakeJobData)
 
     try:
         bpy.utils.register_class(MetahumanSceneProperties)
@@ -413,6 +481,7 @@ def unregister():
         bpy.utils.unregister_class(ShapeKeyData)
         bpy.utils.unregister_class(OutputData)
         bpy.utils.unregister_class(BlendFileMetaHumanCollection)
+        bpy.utils.unregister_class(BakeJobData)
 
     except RuntimeError as error:
         logger.debug(error)
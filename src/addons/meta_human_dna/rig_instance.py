@@ -8,12 +8,21 @@ from typing import Literal
 
 # third party imports
 import bpy
+import numpy as np
 
 from mathutils import Euler, Matrix, Quaternion, Vector
 
 # local imports
 from . import utilities
-from .constants import FLOATING_POINT_PRECISION, IS_BLENDER_5, SCALE_FACTOR, SHAPE_KEY_NAME_MAX_LENGTH, ToolInfo
+from .constants import (
+    FLOATING_POINT_PRECISION,
+    IS_BLENDER_5,
+    SCALE_FACTOR,
+    SHAPE_KEY_BASIS_NAME,
+    SHAPE_KEY_NAME_MAX_LENGTH,
+    SPARSE_BLEND_SHAPES_SHAPE_KEY_NAME,
+    ToolInfo,
+)
 from .ui import callbacks
 from .typing import *  # noqa: F403
 
@@ -237,6 +246,24 @@ class RigInstance(bpy.types.PropertyGroup):
         name="Evaluate Shape Keys",
         description="Whether to evaluate shape keys based on the face board controls",
     )  # pyright: ignore[reportInvalidTypeForm]
+    head_shape_key_evaluation_mode: bpy.props.EnumProperty(
+        name="Shape Key Evaluation",
+        items=[
+            ("shape_keys", "Shape Keys", "Evaluates the head blend shapes by setting the values of the shape keys"),
+            (
+                "sparse",
+                "Sparse Deltas",
+                (
+                    "Evaluates the head blend shapes by applying the DNA deltas to a single shape key on the meshes "
+                    "that have no DNA shape keys. This does not require the shape keys to be imported, which is "
+                    "faster for animation only workflows"
+                ),
+            ),
+        ],
+        description="Choose how the head blend shapes are evaluated",
+        default="shape_keys",
+        update=callbacks.update_head_shape_key_evaluation_mode,  # type: ignore[call-arg]
+    )  # pyright: ignore[reportInvalidTypeForm]
     evaluate_texture_masks: bpy.props.BoolProperty(
         default=True,
         name="Evaluate Texture Masks",
@@ -488,11 +515,52 @@ class RigInstance(bpy.types.PropertyGroup):
         ),
         default=False,
     )  # pyright: ignore[reportInvalidTypeForm]
+    shape_key_import_filter: bpy.props.EnumProperty(
+        name="Import",
+        items=[
+            ("all", "All Shape Keys", "Imports every shape key in the DNA file"),
+            (
+                "action",
+                "Active in Action",
+                (
+                    "Only imports the shape keys whose channels are non-zero on any frame of the chosen face board "
+                    "action. The other shape keys are created from the DNA file when they are sculpted or edited"
+                ),
+            ),
+            (
+                "channels",
+                "Channel List",
+                (
+                    "Only imports the shape keys of the given channel names. The other shape keys are created from "
+                    "the DNA file when they are sculpted or edited"
+                ),
+            ),
+        ],
+        default="all",
+    )  # pyright: ignore[reportInvalidTypeForm]
+    shape_key_import_action: bpy.props.PointerProperty(
+        type=bpy.types.Action,
+        name="Action",
+        description="The face board action that is evaluated to find the shape key channels to import",
+    )  # pyright: ignore[reportInvalidTypeForm]
+    shape_key_import_channels: bpy.props.StringProperty(
+        name="Channels",
+        default="",
+        description="A comma separated list of the blend shape channel names to import, i.e. jawOpen, eyeBlink_L",
+    )  # pyright: ignore[reportInvalidTypeForm]
 
     # ----- Output Properties -----
     output_run_validations: bpy.props.BoolProperty(
         name="Validate", description="Whether to run validations before exporting", default=True
     )  # pyright: ignore[reportInvalidTypeForm]
+    output_incremental: bpy.props.BoolProperty(
+        name="Incremental",
+        description=(
+            "Whether to only rewrite the meshes, shape keys, skin weights and bones that changed since the last "
+            "export to the same output folder. The rest are reused from the previously exported DNA file"
+        ),
+        default=False,
+    )  # pyright: ignore[reportInvalidTypeForm]
     output_folder_path: bpy.props.StringProperty(
         name="Output Folder",
         description="The root folder where the output files will be saved",
@@ -614,6 +682,51 @@ class RigInstance(bpy.types.PropertyGroup):
                         return key_block
         return None
 
+    def materialize_head_shape_key(self, name: str) -> bpy.types.ShapeKey | None:
+        """
+        Creates a head shape key that was not imported from its blend shape target in the DNA file.
+
+        Args:
+            name (str): The shape key name, which is the DNA mesh name and channel name joined by "__".
+
+        Returns:
+            bpy.types.ShapeKey | None: The created shape key block, or None if the DNA has no matching target.
+        """
+        from .dna_io import create_shape_keys
+
+        if not self.head_dna_reader or "__" not in name:
+            return None
+
+        mesh_dna_name, channel_name = name.split("__", 1)
+        is_centimeters = self.head_dna_reader.getTranslationUnit().name.lower() == "cm"
+        for mesh_index in self.head_dna_reader.getMeshIndicesForLOD(0):
+            if self.head_dna_reader.getMeshName(mesh_index) != mesh_dna_name:
+                continue
+
+            for target_index in range(self.head_dna_reader.getBlendShapeTargetCount(mesh_index)):
+                channel_index = self.head_dna_reader.getBlendShapeChannelIndex(mesh_index, target_index)
+                if self.head_dna_reader.getBlendShapeChannelName(channel_index) != channel_name:
+                    continue
+
+                logger.info(f'Materializing the shape key "{name}" from the DNA file')
+                # remove the sparse evaluation shape key, so the mesh is evaluated through its DNA shape keys instead
+                self.reset_head_sparse_blend_shapes()
+                shape_key_blocks = create_shape_keys(
+                    target_indices=[target_index],
+                    mesh_index=mesh_index,
+                    mesh_object=self.head_mesh_index_lookup.get(mesh_index),  # type: ignore[arg-type]
+                    reader=self.head_dna_reader,
+                    prefix=f"{mesh_dna_name}__",
+                    is_neutral=self.generate_neutral_shapes,
+                    linear_modifier=1 / SCALE_FACTOR if is_centimeters else 1,
+                )
+                # re-cache the shape key blocks so rig logic drives the new shape key
+                self.data.pop(f"{self.name}_head_shape_key_blocks", None)
+                self.data.pop(f"{self.name}_shape_key", None)
+                self.head_shape_key_blocks  # noqa: B018
+                return shape_key_blocks[0] if shape_key_blocks else None
+        return None
+
     def apply_dependency_graph_update(self, dependency_graph: bpy.types.Depsgraph | None = None):
         if not dependency_graph:
             dependency_graph = bpy.context.evaluated_depsgraph_get()
@@ -722,6 +835,14 @@ class RigInstance(bpy.types.PropertyGroup):
 
         return callbacks.get_head_texture_logic_node(self.head_material)
 
+    @property
+    def body_texture_masks_node(self) -> bpy.types.ShaderNodeGroup | None:
+        # first check if the texture masks node is set
+        if not self.body_material:
+            return None
+
+        return callbacks.get_body_texture_logic_node(self.body_material)
+
     @property
     def head_initialized(self) -> bool:
         return bool(self.data.get(f"{self.name}_head_initialized"))
@@ -753,6 +874,24 @@ class RigInstance(bpy.types.PropertyGroup):
         self.data[f"{self.name}_head_mesh_index_lookup"] = mesh_index_lookup
         return self.data[f"{self.name}_head_mesh_index_lookup"]
 
+    @property
+    def body_mesh_index_lookup(self) -> dict[int, bpy.types.Object]:
+        if not self.body_dna_reader:
+            return {}
+
+        mesh_index_lookup = self.data.get(f"{self.name}_body_mesh_index_lookup", {})
+        if mesh_index_lookup:
+            return mesh_index_lookup
+
+        for mesh_index in range(self.body_dna_reader.getMeshCount()):
+            dna_mesh_name = self.body_dna_reader.getMeshName(mesh_index)
+            mesh_object = bpy.data.objects.get(f"{self.name}_{dna_mesh_name}")
+            if mesh_object:
+                mesh_index_lookup[mesh_index] = mesh_object
+
+        self.data[f"{self.name}_body_mesh_index_lookup"] = mesh_index_lookup
+        return self.data[f"{self.name}_body_mesh_index_lookup"]
+
     @property
     def head_channel_name_to_index_lookup(self) -> dict[str, int]:
         if not self.head_dna_reader:
@@ -848,7 +987,15 @@ class RigInstance(bpy.types.PropertyGroup):
                         key_block_list.append(shape_key_block)
                         shape_key_blocks[channel_index] = key_block_list
 
-                    elif len(shape_key_block_name) <= SHAPE_KEY_NAME_MAX_LENGTH:
+                    elif len(shape_key_block_name) > SHAPE_KEY_NAME_MAX_LENGTH:
+                        continue
+
+                    elif self.shape_key_import_filter != "all":
+                        # list the shape keys that were not imported, so they can be materialized on demand
+                        shape_key_item = self.shape_key_list.add()
+                        shape_key_item.name = shape_key_block_name
+
+                    else:
                         failed_to_cache_count += 1
 
             if failed_to_cache_count > 0:
@@ -862,6 +1009,77 @@ class RigInstance(bpy.types.PropertyGroup):
 
         return self.data[f"{self.name}_head_shape_key_blocks"]
 
+    @property
+    def head_sparse_blend_shapes(self) -> "dict[int, utilities.SparseBlendShapes]":
+        if not self.head_dna_reader:
+            return {}
+
+        sparse_blend_shapes = self.data.get(f"{self.name}_head_sparse_blend_shapes")
+        if sparse_blend_shapes is None:
+            sparse_blend_shapes = {}
+            is_centimeters = self.head_dna_reader.getTranslationUnit().name.lower() == "cm"
+
+            # Note: The meshes that have DNA shape keys keep being evaluated through their shape keys
+            sparse_shape_key_names = {SHAPE_KEY_BASIS_NAME, SPARSE_BLEND_SHAPES_SHAPE_KEY_NAME}
+            for mesh_index in self.head_dna_reader.getMeshIndicesForLOD(0):
+                mesh_object = self.head_mesh_index_lookup.get(mesh_index)
+                if not mesh_object:
+                    continue
+                shape_keys = mesh_object.data.shape_keys  # type: ignore[attr-defined]
+                if shape_keys and set(shape_keys.key_blocks.keys()) - sparse_shape_key_names:
+                    continue
+
+                blend_shapes = utilities.get_sparse_blend_shapes(
+                    reader=self.head_dna_reader,
+                    mesh_index=mesh_index,
+                    linear_modifier=1 / SCALE_FACTOR if is_centimeters else 1,
+                )
+                if not blend_shapes:
+                    continue
+
+                if len(blend_shapes.basis) != len(mesh_object.data.vertices):  # type: ignore[attr-defined]
+                    logger.warning(
+                        f'The vertex count of "{mesh_object.name}" does not match the DNA. Its blend shapes '
+                        "will not be evaluated."
+                    )
+                    continue
+
+                sparse_blend_shapes[mesh_index] = blend_shapes
+
+            self.data[f"{self.name}_head_sparse_blend_shapes"] = sparse_blend_shapes
+
+        return self.data[f"{self.name}_head_sparse_blend_shapes"]
+
+    @property
+    def body_shape_key_blocks(self) -> dict[int, list[bpy.types.ShapeKey]]:
+        if not self.body_dna_reader:
+            return {}
+
+        shape_key_blocks = self.data.get(f"{self.name}_body_shape_key_blocks")
+        if shape_key_blocks is None:
+            shape_key_blocks = {}
+
+            # Note: Unlike the head, the body shape keys are optional, so missing ones are not reported
+            for mesh_index in self.body_dna_reader.getMeshIndicesForLOD(0):
+                mesh_object = self.body_mesh_index_lookup.get(mesh_index)
+                if not mesh_object or not mesh_object.data.shape_keys:  # type: ignore[attr-defined]
+                    continue
+
+                key_blocks = mesh_object.data.shape_keys.key_blocks  # type: ignore[attr-defined]
+                dna_mesh_name = self.body_dna_reader.getMeshName(mesh_index)
+                for target_index in range(self.body_dna_reader.getBlendShapeTargetCount(mesh_index)):
+                    channel_index = self.body_dna_reader.getBlendShapeChannelIndex(mesh_index, target_index)
+                    name = self.body_dna_reader.getBlendShapeChannelName(channel_index)
+                    shape_key_block = key_blocks.get(f"{dna_mesh_name}__{name}")
+                    if shape_key_block:
+                        key_block_list = shape_key_blocks.get(channel_index, [])
+                        key_block_list.append(shape_key_block)
+                        shape_key_blocks[channel_index] = key_block_list
+
+            self.data[f"{self.name}_body_shape_key_blocks"] = shape_key_blocks
+
+        return self.data[f"{self.name}_body_shape_key_blocks"]
+
     @property
     def head_rest_pose(self) -> dict[str, tuple[Vector, Euler, Vector, Matrix]]:
         rest_pose = self.data.get(f"{self.name}_head_rest_pose", {})
@@ -1375,11 +1593,64 @@ class RigInstance(bpy.types.PropertyGroup):
         # set the provided shape key value to 1.0
         shape_key.value = 1.0
 
+    def get_head_sparse_blend_shapes_key_block(self, mesh_object: bpy.types.Object) -> bpy.types.ShapeKey:
+        # the evaluated positions are written to their own shape key, so the rest shape of the mesh is never changed
+        if not mesh_object.data.shape_keys:  # type: ignore[attr-defined]
+            mesh_object.shape_key_add(name=SHAPE_KEY_BASIS_NAME, from_mix=False)
+
+        key_block = mesh_object.data.shape_keys.key_blocks.get(SPARSE_BLEND_SHAPES_SHAPE_KEY_NAME)  # type: ignore[attr-defined]
+        if not key_block:
+            key_block = mesh_object.shape_key_add(name=SPARSE_BLEND_SHAPES_SHAPE_KEY_NAME, from_mix=False)
+        if key_block.value != 1.0:
+            key_block.value = 1.0
+        return key_block
+
+    def update_head_sparse_blend_shapes(self):
+        channel_weights = np.asarray(self.head_instance.getBlendShapeOutputs(), dtype=np.float32)
+
+        # skip writing the shape keys if the blend shape outputs have not changed
+        previous_weights = self.data.get(f"{self.name}_head_sparse_blend_shape_weights")
+        if previous_weights is not None and np.array_equal(previous_weights, channel_weights):
+            return
+        self.data[f"{self.name}_head_sparse_blend_shape_weights"] = channel_weights
+
+        for mesh_index, blend_shapes in self.head_sparse_blend_shapes.items():
+            mesh_object = self.head_mesh_index_lookup[mesh_index]
+            key_block = self.get_head_sparse_blend_shapes_key_block(mesh_object)
+
+            # apply the deltas to the current rest shape, so any edits to the neutral are kept
+            rest_positions = np.empty(len(key_block.data) * 3, dtype=np.float32)
+            key_block.relative_key.data.foreach_get("co", rest_positions)
+            key_block.data.foreach_set(
+                "co", blend_shapes.evaluate(channel_weights, basis=rest_positions.reshape(-1, 3))
+            )
+            mesh_object.data.update()  # type: ignore[attr-defined]
+
+    def reset_head_sparse_blend_shapes(self):
+        # remove the sparse evaluation shape keys, and the basis if it was the only other shape key
+        for mesh_index in self.data.get(f"{self.name}_head_sparse_blend_shapes", {}):
+            mesh_object = self.head_mesh_index_lookup.get(mesh_index)
+            shape_keys = mesh_object and mesh_object.data.shape_keys  # type: ignore[attr-defined]
+            if not shape_keys:
+                continue
+
+            key_block = shape_keys.key_blocks.get(SPARSE_BLEND_SHAPES_SHAPE_KEY_NAME)
+            if key_block:
+                mesh_object.shape_key_remove(key_block)  # type: ignore[union-attr]
+            if shape_keys.key_blocks.keys() == [SHAPE_KEY_BASIS_NAME]:
+                mesh_object.shape_key_clear()  # type: ignore[union-attr]
+
+        self.data.pop(f"{self.name}_head_sparse_blend_shapes", None)
+        self.data.pop(f"{self.name}_head_sparse_blend_shape_weights", None)
+
     def update_head_shape_keys(self) -> list[tuple[bpy.types.ShapeKey, float]]:
         # skip if the head mesh is not set
         if not self.head_mesh or not self.head_dna_reader:
             return []
 
+        if self.head_shape_key_evaluation_mode == "sparse":
+            self.update_head_sparse_blend_shapes()
+
         # skip if there are no shape keys
         if len(bpy.data.shape_keys) == 0:
             return []
@@ -1718,6 +1989,53 @@ class RigInstance(bpy.types.PropertyGroup):
                     f'The bone "{name}" was not found on "{self.body_rig.name}". Rig Logic will not update the bone.'
                 )
 
+    def update_body_shape_keys(self) -> list[tuple[bpy.types.ShapeKey, float]]:
+        # skip if the body dna reader is not set
+        if not self.body_dna_reader or not self.body_instance:
+            return []
+
+        shape_key_blocks = self.body_shape_key_blocks
+        if not shape_key_blocks:
+            return []
+
+        shape_key_values = []
+
+        # update blend shapes
+        for index, value in enumerate(self.body_instance.getBlendShapeOutputs()):
+            for shape_key in shape_key_blocks.get(index, []):
+                shape_key.value = value
+                shape_key_values.append((shape_key, value))
+
+        return shape_key_values
+
+    def update_body_texture_masks(self) -> list[tuple[str, float]]:
+        # skip if the material is not set
+        if not self.body_material or not self.body_dna_reader or not self.body_instance:
+            return []
+
+        # skip if the body dna has no animated maps
+        if self.body_dna_reader.getAnimatedMapCount() == 0:
+            return []
+
+        body_texture_masks_node = self.body_texture_masks_node
+        # if the texture masks node is not set, we can't update the texture masks
+        if not body_texture_masks_node:
+            return []
+
+        texture_mask_values = []
+
+        # update texture masks values
+        for index, value in enumerate(self.body_instance.getAnimatedMapOutputs()):
+            name = self.body_dna_reader.getAnimatedMapName(index)
+            slider_name = f"{name.split('.')[0].split('_')[-1].lower().replace('cm', 'wm')}.{name.split('.')[-1]}_msk"
+
+            mask_slider = body_texture_masks_node.inputs.get(slider_name)
+            if mask_slider:
+                mask_slider.default_value = value  # type: ignore[attr-defined]
+                texture_mask_values.append((slider_name, value))
+
+        return texture_mask_values
+
     def update_body_rbf_solver_list(self):
         try:
             from .editors.rbf_editor.core import update_body_rbf_solver_list
@@ -1751,6 +2069,10 @@ class RigInstance(bpy.types.PropertyGroup):
                 # apply the changes
                 if self.evaluate_bones:
                     self.update_body_bone_transforms()
+                if self.evaluate_shape_keys:
+                    self.update_body_shape_keys()
+                if self.evaluate_texture_masks:
+                    self.update_body_texture_masks()
 
             if component in ("head", "all") and self.head_initialized:
                 # update the gui controls
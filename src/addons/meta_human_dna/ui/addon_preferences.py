@@ -38,6 +38,13 @@ class MetaHumanDnaPreferences(MetahumanAddonProperties, bpy.types.AddonPreferenc
         row = layout.row()
         row.prop(self, "metrics_collection", text="Allow Metrics Collection")
         row = layout.row()
+        row.prop(self, "progress_queue_time_budget", text="Queue Time Budget (ms)")
+        row = layout.row()
+        row.prop(self, "import_cache_enabled", text="Cache Imported Meshes")
+        row = layout.row()
+        row.enabled = self.import_cache_enabled
+        row.prop(self, "import_cache_max_size", text="Import Cache Size (MB)")
+        row = layout.row()
 
         # TODO: Enable RBF Editor settings later in later release
         # # RBF Editor Settings
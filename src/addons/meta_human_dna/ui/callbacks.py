@@ -562,6 +562,11 @@ def update_evaluate_rbfs_value(self: "RigInstance", context: "Context"):
     _update_evaluate_rbfs_value(self, context)
 
 
+def update_head_shape_key_evaluation_mode(self: "RigInstance", context: "Context"):  # noqa: ARG001
+    # the sparse blend shapes are rebuilt the next time they are evaluated
+    self.reset_head_sparse_blend_shapes()
+
+
 def update_head_topology_selection(self: "RigInstance", context: "Context"):  # noqa: ARG001
     head = get_active_head()
     if head:
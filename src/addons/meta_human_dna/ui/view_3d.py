@@ -68,6 +68,17 @@ def draw_rig_instance_error(layout: bpy.types.UILayout, error: str):
     row.label(text=error)
 
 
+def draw_shape_key_import_filter(layout: bpy.types.UILayout, instance: "RigInstance"):
+    row = layout.row()
+    row.prop(instance, "shape_key_import_filter")
+    if instance.shape_key_import_filter == "action":
+        row = layout.row()
+        row.prop(instance, "shape_key_import_action")
+    elif instance.shape_key_import_filter == "channels":
+        row = layout.row()
+        row.prop(instance, "shape_key_import_channels")
+
+
 class RigInstanceDependentPanel(bpy.types.Panel):
     @classmethod
     def poll(cls, context: "Context") -> bool:
@@ -691,6 +702,8 @@ class META_HUMAN_DNA_PT_rig_instance_head_sub_panel(bpy.types.Panel):
             row.prop(instance, "head_rig", icon="OUTLINER_OB_ARMATURE")
             row = box.row()
             row.prop(instance, "head_material", icon="MATERIAL")
+            row = box.row()
+            row.prop(instance, "head_shape_key_evaluation_mode", icon="SHAPEKEY_DATA")
 
 
 class META_HUMAN_DNA_PT_rig_instance_body_sub_panel(bpy.types.Panel):
@@ -787,6 +800,7 @@ class META_HUMAN_DNA_PT_shape_keys(RigInstanceDependentPanel):
                 row.label(text=f"No shape keys on {instance.name}", icon="ERROR")
                 row = self.layout.row()
                 row.prop(instance, "generate_neutral_shapes")
+                draw_shape_key_import_filter(self.layout, instance)
                 row = self.layout.row()
                 row.operator(f"{ToolInfo.NAME}.import_shape_keys", icon="IMPORT")
                 return
@@ -835,8 +849,9 @@ class META_HUMAN_DNA_PT_shape_keys(RigInstanceDependentPanel):
             row.prop(instance, "solo_shape_key", text="Solo selected shape key")
             row = self.layout.row()
             row.prop(instance, "generate_neutral_shapes")
+            draw_shape_key_import_filter(self.layout, instance)
             row = self.layout.row()
-            row.operator(f"{ToolInfo.NAME}.import_shape_keys", icon="IMPORT", text="Reimport All Shape Keys")
+            row.operator(f"{ToolInfo.NAME}.import_shape_keys", icon="IMPORT", text="Reimport Shape Keys")
         else:
             draw_rig_instance_error(self.layout, error)
 
@@ -920,6 +935,19 @@ class META_HUMAN_DNA_PT_output_buttons_sub_panel(bpy.types.Panel):
             return
 
         properties = getattr(context.scene, ToolInfo.NAME)
+        addon_window_manager_properties = getattr(context.window_manager, ToolInfo.NAME)
+        if addon_window_manager_properties.export_progress < 1:
+            row = self.layout.row()
+            row.label(text="Exporting...", icon="SORTTIME")
+            row = self.layout.row()
+            row.progress(
+                factor=addon_window_manager_properties.export_progress,
+                type="BAR",
+                text=addon_window_manager_properties.export_progress_description,
+            )
+            row.scale_x = 2
+            return
+
         error = valid_rig_instance_exists(context, ignore_face_board=True)
         row = self.layout.row()
         if not error:
@@ -928,6 +956,7 @@ class META_HUMAN_DNA_PT_output_buttons_sub_panel(bpy.types.Panel):
             active_index = properties.rig_instance_list_active_index
             instance = properties.rig_instance_list[active_index]
             row.prop(instance, "output_run_validations")
+            row.prop(instance, "output_incremental")
             row = self.layout.row()
 
             if instance.output_method == "calibrate":
@@ -2,17 +2,35 @@
 import json
 import logging
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 
 # third party imports
 import bpy
+import numpy as np
 
 from mathutils import Quaternion
 
 # local imports
-from ..constants import EYE_AIM_BONES, FACE_BOARD_SWITCHES, IS_BLENDER_5, SCALE_FACTOR, Axis, ComponentType, ToolInfo
+from ..constants import (
+    EYE_AIM_BONES,
+    FACE_BOARD_SWITCHES,
+    FLOATING_POINT_PRECISION,
+    IS_BLENDER_5,
+    SCALE_FACTOR,
+    Axis,
+    ComponentType,
+    ToolInfo,
+)
 from ..typing import *  # noqa: F403
-from .misc import apply_transforms, switch_to_object_mode, switch_to_pose_mode
+from .misc import (
+    apply_transforms,
+    get_addon_scene_properties,
+    get_addon_window_manager_properties,
+    switch_to_object_mode,
+    switch_to_pose_mode,
+)
 
 
 # blender 4.5 and 5.0 support
@@ -24,6 +42,23 @@ else:
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class BakeJob:
+    """A single bake of an action on a rig instance component in a bake queue."""
+
+    instance_name: str
+    action_name: str
+    start_frame: int
+    end_frame: int
+    component: ComponentType = "head"
+    baked_action_name: str = ""
+
+    @property
+    def description(self) -> str:
+        """Get a human-readable description of this job."""
+        return f'Baking "{self.action_name}" on {self.instance_name} {self.component}'
+
+
 def get_action_name(
     instance: "RigInstance",
     action_name: str,
@@ -501,26 +536,230 @@ def import_face_board_action_from_json(file_path: Path, armature: bpy.types.Obje
     armature.animation_data.action = action
 
 
-def bake_control_curve_values_for_frame(
-    instance: "RigInstance",
-    texture_logic_node: bpy.types.ShaderNodeGroup | None,
-    action: bpy.types.Action,
-    frame: int,
-    masks: bool = True,
-    shape_keys: bool = True,
-    component: ComponentType = "head",
+def get_keyframe_reduction_channel(data_path: str) -> str | None:
+    """
+    Gets the keyframe reduction channel that the given fcurve data path belongs to. The channel
+    is used to look up the tolerance that should be used when simplifying the fcurve.
+
+    Args:
+        data_path (str): The data path of the fcurve.
+
+    Returns:
+        str | None: Either "location", "rotation", "scale", "shape_key" or "mask". None if the
+            data path is not a baked channel.
+    """
+    if data_path.endswith("location"):
+        return "location"
+    if data_path.endswith(("rotation_quaternion", "rotation_euler", "rotation_axis_angle")):
+        return "rotation"
+    if data_path.endswith("scale"):
+        return "scale"
+    if data_path.startswith("key_blocks[") and data_path.endswith(".value"):
+        return "shape_key"
+    if data_path.endswith("default_value"):
+        return "mask"
+    return None
+
+
+def get_simplified_keyframe_mask(frames: np.ndarray, values: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Gets a mask of the keyframes that are needed to reproduce the sampled curve within the given
+    tolerance. This is the Ramer-Douglas-Peucker algorithm, but the error is measured along the
+    value axis only, since frames and values are not in the same units.
+
+    Args:
+        frames (np.ndarray): The sorted frame numbers of the samples.
+        values (np.ndarray): The values of the samples.
+        tolerance (float): The maximum difference allowed between a sample and the linearly
+            interpolated simplified curve.
+
+    Returns:
+        np.ndarray: A boolean mask of the samples that should be kept as keyframes.
+    """
+    count = len(frames)
+    keep = np.zeros(count, dtype=bool)
+    if count == 0:
+        return keep
+
+    keep[0] = True
+    # a curve that never leaves the tolerance only needs a single key
+    if count == 1 or np.ptp(values) <= tolerance:
+        return keep
+
+    keep[-1] = True
+    segments = [(0, count - 1)]
+    while segments:
+        start, end = segments.pop()
+        if end - start < 2:
+            continue
+
+        # measure every sample in the segment against the line between its end points at once
+        slope = (values[end] - values[start]) / (frames[end] - frames[start])
+        interpolated = values[start] + slope * (frames[start + 1 : end] - frames[start])
+        errors = np.abs(values[start + 1 : end] - interpolated)
+        index = int(np.argmax(errors))
+        if errors[index] > tolerance:
+            split = start + 1 + index
+            keep[split] = True
+            segments.append((start, split))
+            segments.append((split, end))
+
+    return keep
+
+
+def set_fcurve_keyframes(
+    fcurve: bpy.types.FCurve,
+    frames: np.ndarray,
+    values: np.ndarray,
+    tolerance: float | None = None,
 ):
-    index_lookup = {0: "x", 1: "y", 2: "z"}
-    control_curve_values = {}
+    """
+    Replaces the keyframes of the fcurve within the given frame range with the given samples in
+    a single bulk write. Keyframes outside the frame range are left untouched.
+
+    Args:
+        fcurve (bpy.types.FCurve): The fcurve to write the keyframes to.
+        frames (np.ndarray): The sorted frame numbers of the samples.
+        values (np.ndarray): The values of the samples.
+        tolerance (float | None, optional): If given, the samples are simplified to this tolerance
+            and the remaining keyframes are linearly interpolated. Defaults to None.
+    """
+    if len(frames) == 0:
+        return
 
+    frames = np.asarray(frames, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    # the frame range is taken before simplifying, since it can drop the last sample of a flat curve
+    first_frame, last_frame = frames[0], frames[-1]
+    if tolerance is not None:
+        mask = get_simplified_keyframe_mask(frames, values, tolerance)
+        frames = frames[mask]
+        values = values[mask]
+
+    # keep any existing keyframes that are outside the baked frame range
+    existing = np.empty(len(fcurve.keyframe_points) * 2, dtype=np.float32)
+    fcurve.keyframe_points.foreach_get("co", existing)
+    existing = existing.reshape(-1, 2)
+    outside = existing[(existing[:, 0] < first_frame) | (existing[:, 0] > last_frame)]
+
+    co = np.concatenate([outside, np.column_stack([frames, values]).astype(np.float32)])
+    co = co[np.argsort(co[:, 0], kind="stable")]
+
+    fcurve.keyframe_points.clear()
+    fcurve.keyframe_points.add(len(co))
+    fcurve.keyframe_points.foreach_set("co", co.ravel())
+    if tolerance is not None:
+        # the simplification error is measured against straight lines between the kept keys
+        for keyframe_point in fcurve.keyframe_points:
+            if first_frame <= keyframe_point.co[0] <= last_frame:
+                keyframe_point.interpolation = "LINEAR"
+    fcurve.update()
+
+
+def get_property_fcurve(owner: bpy.types.bpy_struct, data_path: str) -> bpy.types.FCurve | None:
+    """
+    Gets the fcurve that animates the given property on the owner's ID data block.
+
+    Args:
+        owner (bpy.types.bpy_struct): The struct that owns the property, i.e. a shape key block.
+        data_path (str): The name of the property on the owner.
+
+    Returns:
+        bpy.types.FCurve | None: The fcurve if the property is animated.
+    """
+    id_data = owner.id_data
+    animation_data = getattr(id_data, "animation_data", None)
+    if not animation_data or not animation_data.action:
+        return None
+
+    action = animation_data.action
     if anim_utils:
-        channel_bag = anim_utils.action_ensure_channelbag_for_slot(action, action.slots[0])
+        channel_bag = anim_utils.action_ensure_channelbag_for_slot(action, animation_data.action_slot)
     else:
         channel_bag = action
 
     if not channel_bag:
+        return None
+
+    return channel_bag.fcurves.find(owner.path_from_id(data_path))
+
+
+def set_property_keyframes(
+    owner: bpy.types.bpy_struct,
+    data_path: str,
+    frames: np.ndarray,
+    values: np.ndarray,
+    tolerance: float | None = None,
+):
+    """
+    Keys the property on the owner with all the given samples in bulk. The first sample is inserted
+    with keyframe_insert so Blender creates the action, slot and fcurve as it normally would, then
+    the rest of the samples are written directly to the fcurve.
+
+    Args:
+        owner (bpy.types.bpy_struct): The struct that owns the property, i.e. a shape key block.
+        data_path (str): The name of the property on the owner.
+        frames (np.ndarray): The sorted frame numbers of the samples.
+        values (np.ndarray): The values of the samples.
+        tolerance (float | None, optional): If given, the samples are simplified to this tolerance.
+            Defaults to None.
+    """
+    if len(frames) == 0:
         return
 
+    setattr(owner, data_path, float(values[0]))
+    owner.keyframe_insert(data_path, frame=float(frames[0]))
+
+    fcurve = get_property_fcurve(owner, data_path)
+    if fcurve:
+        set_fcurve_keyframes(fcurve=fcurve, frames=frames, values=values, tolerance=tolerance)
+
+
+def simplify_action_keyframes(action: bpy.types.Action, tolerances: dict[str, float]) -> int:
+    """
+    Simplifies the keyframes of every fcurve in the action in place, using the tolerance of the
+    channel that each fcurve belongs to. Fcurves in channels without a tolerance are left as is.
+
+    Args:
+        action (bpy.types.Action): The action to simplify.
+        tolerances (dict[str, float]): The tolerance per keyframe reduction channel, see
+            get_keyframe_reduction_channel.
+
+    Returns:
+        int: The number of keyframes that were removed.
+    """
+    if anim_utils:
+        channel_bag = anim_utils.action_ensure_channelbag_for_slot(action, action.slots[0])
+    else:
+        channel_bag = action
+
+    if not channel_bag:
+        return 0
+
+    removed_count = 0
+    for fcurve in channel_bag.fcurves:
+        channel = get_keyframe_reduction_channel(fcurve.data_path)
+        tolerance = tolerances.get(channel) if channel else None
+        count = len(fcurve.keyframe_points)
+        if tolerance is None or count < 3:
+            continue
+
+        co = np.empty(count * 2, dtype=np.float32)
+        fcurve.keyframe_points.foreach_get("co", co)
+        co = co.reshape(-1, 2)
+        set_fcurve_keyframes(fcurve=fcurve, frames=co[:, 0], values=co[:, 1], tolerance=tolerance)
+        removed_count += count - len(fcurve.keyframe_points)
+
+    logger.info(f'Removed {removed_count} redundant keyframes from action "{action.name}"')
+    return removed_count
+
+
+def get_control_curve_values_for_frame(
+    channel_bag: bpy.types.Action | bpy.types.ActionChannelbag, frame: int
+) -> dict[str, dict[str, float]]:
+    index_lookup = {0: "x", 1: "y", 2: "z"}
+    control_curve_values = {}
+
     for fcurve in channel_bag.fcurves:
         control_curve_name, transform = fcurve.data_path.split('"].')
         if transform == "location" and fcurve.array_index != 2:
@@ -530,28 +769,140 @@ def bake_control_curve_values_for_frame(
             control_curve_values[control_curve_name] = control_curve_values.get(control_curve_name, {})
             control_curve_values[control_curve_name].update({axis: fcurve.evaluate(frame)})
 
-    # set and update the control curve values based on the fcurve values
-    instance.update_head_gui_control_values(override_values=control_curve_values)
-
-    # now get the calculated values and bake them to the shape keys value
-    if shape_keys:
-        if component == "head":
-            for shape_key, value in instance.update_head_shape_keys():
-                shape_key.value = value
-                shape_key.keyframe_insert("value", frame=frame)
-        elif component == "body":
-            # TODO: implement body shape key baking
-            pass
-
-    # now bake the texture mask values
-    if texture_logic_node and masks:
-        if component == "head":
-            for slider_name, value in instance.update_head_texture_masks():
-                texture_logic_node.inputs[slider_name].default_value = value  # type: ignore[attr-defined]
-                texture_logic_node.inputs[slider_name].keyframe_insert("default_value", frame=frame)
-        elif component == "body":
-            # TODO: implement body texture mask baking
-            pass
+    return control_curve_values
+
+
+def get_active_head_channel_indices(
+    instance: "RigInstance", action: bpy.types.Action, tolerance: float = FLOATING_POINT_PRECISION
+) -> set[int]:
+    """
+    Evaluates rig logic for every frame of a face board action and gets the blend shape channels
+    that are non-zero on any of them.
+
+    Args:
+        instance (RigInstance): The rig instance to evaluate.
+        action (bpy.types.Action): The face board action.
+        tolerance (float, optional): The value a channel must exceed to be active. Defaults to FLOATING_POINT_PRECISION.
+
+    Returns:
+        set[int]: The indices of the active blend shape channels.
+    """
+    if anim_utils:
+        channel_bag = anim_utils.action_ensure_channelbag_for_slot(action, action.slots[0])
+    else:
+        channel_bag = action
+
+    if not channel_bag or not instance.head_instance:
+        return set()
+
+    active = np.zeros(instance.head_dna_reader.getBlendShapeChannelCount(), dtype=bool)
+    start_frame, end_frame = action.frame_range
+    for frame in range(int(start_frame), int(end_frame) + 1):
+        instance.update_head_gui_control_values(
+            override_values=get_control_curve_values_for_frame(channel_bag=channel_bag, frame=frame)
+        )
+        active |= np.abs(np.asarray(instance.head_instance.getBlendShapeOutputs())) > tolerance
+
+    return set(np.flatnonzero(active).tolist())
+
+
+def bake_control_curve_values(
+    instance: "RigInstance",
+    texture_logic_node: bpy.types.ShaderNodeGroup | None,
+    action: bpy.types.Action,
+    frames: list[int],
+    masks: bool = True,
+    shape_keys: bool = True,
+    component: ComponentType = "head",
+    keyframe_tolerances: dict[str, float] | None = None,
+):
+    """
+    Evaluates rig logic for every given frame and bakes the resulting shape key and texture mask
+    values. The values for the whole frame range are collected first and then written to each
+    fcurve in a single bulk operation. For the head the control curves are evaluated straight from
+    the face board action. For the body the scene is stepped to each frame, so the driver bones are
+    read with any constraints applied.
+
+    Args:
+        instance (RigInstance): The rig instance to evaluate.
+        texture_logic_node (bpy.types.ShaderNodeGroup | None): The texture logic node that holds the mask sliders.
+        action (bpy.types.Action): The face board action for the head or the body rig action for the body.
+        frames (list[int]): The frames to bake.
+        masks (bool, optional): Whether to bake the texture mask values. Defaults to True.
+        shape_keys (bool, optional): Whether to bake the shape key values. Defaults to True.
+        component (ComponentType, optional): The component to bake. Defaults to "head".
+        keyframe_tolerances (dict[str, float] | None, optional): If given, the baked values are simplified
+            with the "shape_key" and "mask" tolerances before they are written. Defaults to None.
+    """
+    if anim_utils:
+        channel_bag = anim_utils.action_ensure_channelbag_for_slot(action, action.slots[0])
+    else:
+        channel_bag = action
+
+    if not channel_bag or not frames or not bpy.context.scene:
+        return
+
+    keyframe_tolerances = keyframe_tolerances or {}
+    shape_key_blocks = []
+    shape_key_values = []
+    slider_names = []
+    mask_values = []
+    current_frame = bpy.context.scene.frame_current
+
+    # the body is evaluated by changing the scene frame, so it is always put back, even if a frame fails
+    try:
+        for frame in frames:
+            if component == "head":
+                instance.update_head_gui_control_values(
+                    override_values=get_control_curve_values_for_frame(channel_bag=channel_bag, frame=frame)
+                )
+                frame_shape_key_values = instance.update_head_shape_keys() if shape_keys else []
+                frame_mask_values = instance.update_head_texture_masks() if texture_logic_node and masks else []
+            else:
+                bpy.context.scene.frame_set(frame)
+                instance.apply_dependency_graph_update()
+                instance.update_body_raw_control_values()
+                frame_shape_key_values = instance.update_body_shape_keys() if shape_keys else []
+                frame_mask_values = instance.update_body_texture_masks() if texture_logic_node and masks else []
+
+            if frame_shape_key_values:
+                if not shape_key_blocks:
+                    shape_key_blocks = [shape_key for shape_key, _ in frame_shape_key_values]
+                shape_key_values.append([value for _, value in frame_shape_key_values])
+
+            if frame_mask_values:
+                if not slider_names:
+                    slider_names = [slider_name for slider_name, _ in frame_mask_values]
+                mask_values.append([value for _, value in frame_mask_values])
+    finally:
+        if component == "body":
+            bpy.context.scene.frame_set(current_frame)
+
+    frame_numbers = np.array(frames, dtype=np.float64)
+
+    # now write the collected values to the shape key fcurves
+    if shape_key_blocks:
+        values = np.array(shape_key_values, dtype=np.float64)
+        for column, shape_key in enumerate(shape_key_blocks):
+            set_property_keyframes(
+                owner=shape_key,
+                data_path="value",
+                frames=frame_numbers,
+                values=values[:, column],
+                tolerance=keyframe_tolerances.get("shape_key"),
+            )
+
+    # and the texture mask values to the texture logic node fcurves
+    if texture_logic_node and slider_names:
+        values = np.array(mask_values, dtype=np.float64)
+        for column, slider_name in enumerate(slider_names):
+            set_property_keyframes(
+                owner=texture_logic_node.inputs[slider_name],
+                data_path="default_value",
+                frames=frame_numbers,
+                values=values[:, column],
+                tolerance=keyframe_tolerances.get("mask"),
+            )
 
 
 def bake_face_board_to_action(  # noqa: PLR0912
@@ -566,6 +917,7 @@ def bake_face_board_to_action(  # noqa: PLR0912
     channel_types: set | None = None,
     masks: bool = True,
     shape_keys: bool = True,
+    keyframe_tolerances: dict[str, float] | None = None,
 ):
     from ..ui.callbacks import get_head_texture_logic_node
 
@@ -630,23 +982,26 @@ def bake_face_board_to_action(  # noqa: PLR0912
             )
             instance.auto_evaluate_head = False
 
+            # simplify the baked bone curves, since nla.bake keys every frame
+            if keyframe_tolerances and armature_object.animation_data and armature_object.animation_data.action:
+                simplify_action_keyframes(armature_object.animation_data.action, keyframe_tolerances)
+
             window_manager_properties: MetahumanWindowMangerProperties = getattr(
                 bpy.context.window_manager, ToolInfo.NAME
             )
             window_manager_properties.evaluate_dependency_graph = False
             texture_logic_node = get_head_texture_logic_node(instance.head_material)
-            for frame in range(start_frame, end_frame + 1):
+            bake_control_curve_values(
+                instance=instance,
+                texture_logic_node=texture_logic_node,
+                action=action,
                 # modulo the step to only bake every nth frame
-                if frame % step == 0:
-                    bake_control_curve_values_for_frame(
-                        instance=instance,
-                        texture_logic_node=texture_logic_node,
-                        action=action,
-                        frame=frame,
-                        shape_keys=shape_keys,
-                        masks=masks,
-                        component="head",
-                    )
+                frames=[frame for frame in range(start_frame, end_frame + 1) if frame % step == 0],
+                shape_keys=shape_keys,
+                masks=masks,
+                component="head",
+                keyframe_tolerances=keyframe_tolerances,
+            )
 
             # rename the newly created object action
             for _action in bpy.data.actions:
@@ -675,7 +1030,7 @@ def bake_face_board_to_action(  # noqa: PLR0912
             window_manager_properties.evaluate_dependency_graph = True
 
 
-def bake_body_to_action(  # noqa: PLR0912
+def bake_body_to_action(  # noqa: PLR0912, PLR0915
     instance: "RigInstance",
     armature_object: bpy.types.Object,
     action_name: str,
@@ -685,14 +1040,17 @@ def bake_body_to_action(  # noqa: PLR0912
     step: int = 1,
     clean_curves: bool = True,
     channel_types: set | None = None,
-    masks: bool = True,  # noqa: ARG001
-    shape_keys: bool = True,  # noqa: ARG001
+    masks: bool = True,
+    shape_keys: bool = True,
     driver_bones: bool = True,
     driven_bones: bool = True,
     twist_bones: bool = True,
     swing_bones: bool = True,
     other_bones: bool = True,
+    keyframe_tolerances: dict[str, float] | None = None,
 ):
+    from ..ui.callbacks import get_body_texture_logic_node
+
     if instance:
         if channel_types is None:
             channel_types = {"LOCATION", "ROTATION", "SCALE"}
@@ -764,6 +1122,25 @@ def bake_body_to_action(  # noqa: PLR0912
                 current_object_actions = [a for a in bpy.data.actions if a.id_root == "OBJECT"]
                 current_node_tree_actions = [a for a in bpy.data.actions if a.id_root == "NODETREE"]
 
+            # bake the body shape key and texture mask values in the same pass over the frame range. This is
+            # done before the bones are baked, while the source action still drives the rig, since nla.bake
+            # switches the rig to the new action and that may not have the driver bones keyed
+            if shape_keys or masks:
+                window_manager_properties = get_addon_window_manager_properties()
+                window_manager_properties.evaluate_dependency_graph = False
+                bake_control_curve_values(
+                    instance=instance,
+                    texture_logic_node=get_body_texture_logic_node(instance.body_material),
+                    action=action,
+                    # modulo the step to only bake every nth frame
+                    frames=[frame for frame in range(start_frame, end_frame + 1) if frame % step == 0],
+                    shape_keys=shape_keys,
+                    masks=masks,
+                    component="body",
+                    keyframe_tolerances=keyframe_tolerances,
+                )
+                window_manager_properties.evaluate_dependency_graph = True
+
             # bake the visual keying of the pose bones
             bpy.ops.nla.bake(
                 frame_start=start_frame,
@@ -778,6 +1155,10 @@ def bake_body_to_action(  # noqa: PLR0912
             )
             instance.auto_evaluate_body = False
 
+            # simplify the baked bone curves, since nla.bake keys every frame
+            if keyframe_tolerances and armature_object.animation_data and armature_object.animation_data.action:
+                simplify_action_keyframes(armature_object.animation_data.action, keyframe_tolerances)
+
             # rename the newly created action
             if replace_action:
                 action.name = action_name
@@ -799,3 +1180,160 @@ def bake_body_to_action(  # noqa: PLR0912
                 ) and _action not in current_node_tree_actions:
                     _action.name = f"{action_name}_shader"
                     break
+
+
+def bake_job(
+    job: BakeJob,
+    replace_action: bool = False,
+    step: int = 1,
+    clean_curves: bool = False,
+    channel_types: set | None = None,
+    masks: bool = True,
+    shape_keys: bool = True,
+    keyframe_tolerances: dict[str, float] | None = None,
+) -> bool:
+    """
+    Bakes a single bake queue job. The action is assigned to the face board for head jobs or the
+    body rig for body jobs and then baked with the same path as the bake operators. The RigLogic
+    state of the rig instance is initialized only if it hasn't been already, so consecutive jobs on
+    the same rig instance reuse it.
+
+    Args:
+        job (BakeJob): The job to bake.
+        replace_action (bool, optional): Whether to bake into the current action. Defaults to False.
+        step (int, optional): The frame step to bake on. Defaults to 1.
+        clean_curves (bool, optional): Whether nla.bake should remove redundant keys. Defaults to False.
+        channel_types (set | None, optional): The bone channel types to bake. Defaults to None.
+        masks (bool, optional): Whether to bake the texture mask values. Defaults to True.
+        shape_keys (bool, optional): Whether to bake the shape key values. Defaults to True.
+        keyframe_tolerances (dict[str, float] | None, optional): The keyframe reduction tolerances per
+            channel. Defaults to None.
+
+    Returns:
+        bool: Whether the job was baked.
+    """
+    instance = None
+    for rig_instance in get_addon_scene_properties().rig_instance_list:
+        if rig_instance.name == job.instance_name:
+            instance = rig_instance
+            break
+
+    if not instance:
+        logger.error(f'No rig instance "{job.instance_name}" was found. Skipping bake of "{job.action_name}"')
+        return False
+
+    action = bpy.data.actions.get(job.action_name)
+    if not action:
+        logger.error(f'No action "{job.action_name}" was found. Skipping bake on "{job.instance_name}"')
+        return False
+
+    if job.component == "head":
+        source_object, armature_object = instance.face_board, instance.head_rig
+    else:
+        source_object, armature_object = instance.body_rig, instance.body_rig
+
+    if not source_object or not armature_object:
+        logger.error(f'The rig instance "{job.instance_name}" has no {job.component} rig to bake')
+        return False
+
+    # only initialize rig logic the first time, so jobs on the same rig instance share the state
+    if job.component == "head" and not instance.head_initialized:
+        instance.head_initialize()
+
+    # assign the action to the object that drives rig logic
+    if not source_object.animation_data:
+        source_object.animation_data_create()
+    source_object.animation_data.action = action  # type: ignore[union-attr]
+
+    baked_action_name = job.baked_action_name or f"{job.action_name}_baked"
+    if job.component == "head":
+        bake_face_board_to_action(
+            instance=instance,
+            armature_object=armature_object,
+            action_name=baked_action_name,
+            replace_action=replace_action,
+            start_frame=job.start_frame,
+            end_frame=job.end_frame,
+            step=step,
+            clean_curves=clean_curves,
+            channel_types=channel_types,
+            masks=masks,
+            shape_keys=shape_keys,
+            keyframe_tolerances=keyframe_tolerances,
+        )
+    else:
+        bake_body_to_action(
+            instance=instance,
+            armature_object=armature_object,
+            action_name=baked_action_name,
+            replace_action=replace_action,
+            start_frame=job.start_frame,
+            end_frame=job.end_frame,
+            step=step,
+            clean_curves=clean_curves,
+            channel_types=channel_types,
+            masks=masks,
+            shape_keys=shape_keys,
+            keyframe_tolerances=keyframe_tolerances,
+        )
+    return True
+
+
+def bake_queue(
+    jobs: list[BakeJob],
+    replace_action: bool = False,
+    step: int = 1,
+    clean_curves: bool = False,
+    channel_types: set | None = None,
+    masks: bool = True,
+    shape_keys: bool = True,
+    keyframe_tolerances: dict[str, float] | None = None,
+    progress_callback: Callable[[float, str], None] | None = None,
+) -> list[BakeJob]:
+    """
+    Bakes all the jobs in order in a single call. This does not need a window, so it can be used
+    to batch bake a whole sequence from a background Blender session. Progress is reported through
+    the addon window manager progress properties.
+
+    Args:
+        jobs (list[BakeJob]): The jobs to bake.
+        replace_action (bool, optional): Whether to bake into the current actions. Defaults to False.
+        step (int, optional): The frame step to bake on. Defaults to 1.
+        clean_curves (bool, optional): Whether nla.bake should remove redundant keys. Defaults to False.
+        channel_types (set | None, optional): The bone channel types to bake. Defaults to None.
+        masks (bool, optional): Whether to bake the texture mask values. Defaults to True.
+        shape_keys (bool, optional): Whether to bake the shape key values. Defaults to True.
+        keyframe_tolerances (dict[str, float] | None, optional): The keyframe reduction tolerances per
+            channel. Defaults to None.
+        progress_callback (Callable[[float, str], None] | None, optional): Called with the progress and
+            description before each job. Defaults to None.
+
+    Returns:
+        list[BakeJob]: The jobs that failed to bake.
+    """
+    window_manager_properties = get_addon_window_manager_properties()
+    failed_jobs = []
+
+    for index, job in enumerate(jobs):
+        window_manager_properties.progress = index / len(jobs)
+        window_manager_properties.progress_description = job.description
+        logger.info(f"{job.description} ({index + 1}/{len(jobs)})")
+        if progress_callback:
+            progress_callback(index / len(jobs), job.description)
+
+        baked = bake_job(
+            job=job,
+            replace_action=replace_action,
+            step=step,
+            clean_curves=clean_curves,
+            channel_types=channel_types,
+            masks=masks,
+            shape_keys=shape_keys,
+            keyframe_tolerances=keyframe_tolerances,
+        )
+        if not baked:
+            failed_jobs.append(job)
+
+    window_manager_properties.progress = 1
+    window_manager_properties.progress_description = ""
+    return failed_jobs
@@ -7,6 +7,7 @@ from typing import Literal
 # third party imports
 import bmesh
 import bpy
+import numpy as np
 
 from mathutils import Euler, Matrix, Quaternion, Vector
 
@@ -50,6 +51,65 @@ def get_bone_rest_transformations(
     return rest_location, rest_rotation, rest_scale, rest_to_parent_matrix  # type: ignore[return-value]
 
 
+def get_joint_local_matrices(translations: np.ndarray, rotations: np.ndarray) -> np.ndarray:
+    """
+    Converts joint translations and XYZ euler rotations into local transformation matrices.
+
+    Args:
+        translations (np.ndarray): The (n, 3) joint translations.
+        rotations (np.ndarray): The (n, 3) joint XYZ euler rotations in degrees.
+
+    Returns:
+        np.ndarray: The (n, 4, 4) local matrices.
+    """
+    cos_x, cos_y, cos_z = np.cos(np.radians(rotations)).T
+    sin_x, sin_y, sin_z = np.sin(np.radians(rotations)).T
+
+    # the same as Euler(rotation, "XYZ").to_matrix(), which is Rz @ Ry @ Rx
+    matrices = np.zeros((len(translations), 4, 4), dtype=np.float64)
+    matrices[:, 0, 0] = cos_y * cos_z
+    matrices[:, 0, 1] = sin_x * sin_y * cos_z - cos_x * sin_z
+    matrices[:, 0, 2] = cos_x * sin_y * cos_z + sin_x * sin_z
+    matrices[:, 1, 0] = cos_y * sin_z
+    matrices[:, 1, 1] = sin_x * sin_y * sin_z + cos_x * cos_z
+    matrices[:, 1, 2] = cos_x * sin_y * sin_z - sin_x * cos_z
+    matrices[:, 2, 0] = -sin_y
+    matrices[:, 2, 1] = sin_x * cos_y
+    matrices[:, 2, 2] = cos_x * cos_y
+    matrices[:, :3, 3] = translations
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+def get_joint_global_matrices(local_matrices: np.ndarray, parent_indices: np.ndarray) -> np.ndarray:
+    """
+    Accumulates local joint matrices down the joint hierarchy. The joints are processed one hierarchy depth
+    at a time, so all the joints at the same depth are multiplied by their parent matrices at once.
+
+    Args:
+        local_matrices (np.ndarray): The (n, 4, 4) local joint matrices.
+        parent_indices (np.ndarray): The parent index of each joint. Root joints are their own parent.
+
+    Returns:
+        np.ndarray: The (n, 4, 4) global joint matrices.
+    """
+    # find the depth of each joint by walking every joint up to its root at the same time
+    depths = np.zeros(len(parent_indices), dtype=np.int64)
+    ancestors = np.arange(len(parent_indices))
+    while True:
+        is_root = parent_indices[ancestors] == ancestors
+        if is_root.all():
+            break
+        depths += ~is_root
+        ancestors = np.where(is_root, ancestors, parent_indices[ancestors])
+
+    global_matrices = local_matrices.copy()
+    for depth in range(1, int(depths.max(initial=0)) + 1):
+        indices = np.flatnonzero(depths == depth)
+        global_matrices[indices] = global_matrices[parent_indices[indices]] @ local_matrices[indices]
+    return global_matrices
+
+
 def get_bone_shape(name: str = CUSTOM_BONE_SHAPE_NAME) -> bpy.types.Object | None:
     rotations = [
         [90, 0, 0],
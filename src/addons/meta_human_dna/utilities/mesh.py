@@ -4,11 +4,13 @@ import logging
 import math
 import re
 
+from dataclasses import dataclass
 from pathlib import Path
 
 # third party imports
 import bmesh
 import bpy
+import numpy as np
 
 from bpy_extras.bmesh_utils import bmesh_linked_uv_islands
 from mathutils import Matrix, Vector
@@ -22,6 +24,7 @@ from ..constants import (
     SHAPE_KEY_BASIS_NAME,
     Axis,
 )
+from ..typing import *  # noqa: F403
 from .misc import exclude_rig_instance_evaluation, preserve_context, switch_to_edit_mode, switch_to_object_mode
 
 
@@ -432,24 +435,25 @@ def copy_mesh(
 
 def split_mesh_along_uv_islands(bmesh_object: bmesh.types.BMesh) -> dict[int, int]:
     uv_layer = bmesh_object.loops.layers.uv.active
-    _uv_border_verts = []
+    _uv_border_verts = set()
 
     if not uv_layer:
         return {}
 
     # get each uv island and it's loops
     for island_faces in bmesh_linked_uv_islands(bmesh_object, uv_layer):
+        island_face_set = set(island_faces)
         island_loops = [loop for face in island_faces for loop in face.loops]  # type: ignore[attr-defined]
         for loop in island_loops:
             # Select border loops on the island
             loops = (loop, loop.link_loop_radial_next)
             if (
                 loops[0] == loops[1]
-                or loops[1].face not in island_faces
+                or loops[1].face not in island_face_set
                 or loops[0][uv_layer].uv != loops[1].link_loop_next[uv_layer].uv
                 or loops[1][uv_layer].uv != loops[0].link_loop_next[uv_layer].uv
             ):
-                _uv_border_verts.append(loop.vert)
+                _uv_border_verts.add(loop.vert)
 
     uv_border_edges = []
     uv_border_verts = []
@@ -466,14 +470,18 @@ def split_mesh_along_uv_islands(bmesh_object: bmesh.types.BMesh) -> dict[int, in
     bmesh_object.verts.ensure_lookup_table()
     bmesh_object.faces.ensure_lookup_table()
 
+    # Hash the border verts by their position so the new verts can be mapped to the original
+    # verts sharing the same position. When several border verts share a position, the last one wins.
+    border_vert_lookup = {tuple(vert.co): vert.index for vert in uv_border_verts}
+
     # Create a lookup table so we can map the new verts to the original verts
     # sharing the same position.
     split_to_original_vert_lookup = {}
     for edge in split["edges"]:
         for vert in edge.verts:
-            for _vert in uv_border_verts:
-                if vert.co == _vert.co:
-                    split_to_original_vert_lookup[vert.index] = _vert.index
+            original_index = border_vert_lookup.get(tuple(vert.co))
+            if original_index is not None:
+                split_to_original_vert_lookup[vert.index] = original_index
 
     return split_to_original_vert_lookup
 
@@ -581,3 +589,126 @@ def get_uv_values(mesh_object: bpy.types.Object) -> tuple[list[float], list[floa
     bmesh_object.free()
 
     return u_values, v_values
+
+
+@dataclass
+class SparseBlendShapes:
+    """
+    The blend shape deltas of a mesh, stored as a sparse (targets x vertices) matrix in CSR layout. This lets
+    the blend shape outputs from rig logic be applied as a single sparse matrix-vector product, instead of
+    through hundreds of shape key blocks.
+    """
+
+    # the blend shape channel index of each target
+    channel_indices: np.ndarray
+    # the offset of each target's first delta, with the total delta count appended
+    target_offsets: np.ndarray
+    # the vertex index of each delta
+    vertex_indices: np.ndarray
+    # (delta count, 3) deltas in blender space
+    deltas: np.ndarray
+    # (vertex count, 3) rest positions in blender space
+    basis: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            array.nbytes
+            for array in (self.channel_indices, self.target_offsets, self.vertex_indices, self.deltas, self.basis)
+        )
+
+    def evaluate(self, channel_weights: np.ndarray, basis: np.ndarray | None = None) -> np.ndarray:
+        """
+        Applies the blend shape channel weights to the basis positions.
+
+        Args:
+            channel_weights (np.ndarray): The blend shape output value of every channel.
+            basis (np.ndarray | None): The (vertex count, 3) rest positions to apply the deltas to. Defaults to
+                the rest positions from the DNA.
+
+        Returns:
+            np.ndarray: The flat vertex positions.
+        """
+        if basis is None:
+            basis = self.basis
+
+        target_weights = channel_weights[self.channel_indices]
+        active_targets = np.flatnonzero(target_weights)
+        if not active_targets.size:
+            return basis.ravel()
+
+        # gather the deltas of only the targets that have a weight
+        starts = self.target_offsets[active_targets]
+        counts = self.target_offsets[active_targets + 1] - starts
+        delta_indices = np.arange(counts.sum()) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        weighted_deltas = self.deltas[delta_indices] * np.repeat(target_weights[active_targets], counts)[:, None]
+        vertex_indices = self.vertex_indices[delta_indices]
+
+        positions = basis.copy()
+        for axis in range(3):
+            positions[:, axis] += np.bincount(vertex_indices, weights=weighted_deltas[:, axis], minlength=len(basis))
+        return positions.ravel()
+
+
+def get_sparse_blend_shapes(
+    reader: "riglogic.BinaryStreamReader", mesh_index: int, linear_modifier: float
+) -> SparseBlendShapes | None:
+    """
+    Reads the blend shape targets of a mesh from the DNA into a sparse matrix.
+
+    Args:
+        reader (riglogic.BinaryStreamReader): The DNA reader.
+        mesh_index (int): The index of the mesh in the DNA.
+        linear_modifier (float): The scale from DNA units to blender units.
+
+    Returns:
+        SparseBlendShapes | None: The sparse blend shapes, or None if the mesh has no blend shape targets.
+    """
+    target_count = reader.getBlendShapeTargetCount(mesh_index)
+    if not target_count:
+        return None
+
+    # the mesh vertices are the positions used by the vertex layout, in DNA order
+    position_indices = np.unique(np.asarray(reader.getVertexLayoutPositionIndices(mesh_index), dtype=np.int64))
+    positions = np.column_stack(
+        (
+            np.asarray(reader.getVertexPositionXs(mesh_index), dtype=np.float32),
+            np.asarray(reader.getVertexPositionYs(mesh_index), dtype=np.float32),
+            np.asarray(reader.getVertexPositionZs(mesh_index), dtype=np.float32),
+        )
+    )[position_indices]
+
+    channel_indices = np.empty(target_count, dtype=np.int64)
+    target_offsets = np.zeros(target_count + 1, dtype=np.int64)
+    vertex_indices = []
+    deltas = []
+    for target_index in range(target_count):
+        channel_indices[target_index] = reader.getBlendShapeChannelIndex(mesh_index, target_index)
+        target_vertex_indices = np.asarray(
+            reader.getBlendShapeTargetVertexIndices(mesh_index, target_index), dtype=np.int64
+        )
+        target_deltas = np.column_stack(
+            (
+                np.asarray(reader.getBlendShapeTargetDeltaXs(mesh_index, target_index), dtype=np.float32),
+                np.asarray(reader.getBlendShapeTargetDeltaYs(mesh_index, target_index), dtype=np.float32),
+                np.asarray(reader.getBlendShapeTargetDeltaZs(mesh_index, target_index), dtype=np.float32),
+            )
+        )
+        # skip any deltas on positions that are not part of the mesh
+        vertex_positions = np.searchsorted(position_indices, target_vertex_indices).clip(max=len(position_indices) - 1)
+        valid = position_indices[vertex_positions] == target_vertex_indices
+        vertex_indices.append(vertex_positions[valid])
+        deltas.append(target_deltas[valid])
+        target_offsets[target_index + 1] = target_offsets[target_index] + np.count_nonzero(valid)
+
+    # DNA is Y-up, Blender is Z-up, so the positions and deltas are rotated 90 degrees around X
+    def to_blender_space(values: np.ndarray) -> np.ndarray:
+        return np.column_stack((values[:, 0], -values[:, 2], values[:, 1])) * np.float32(linear_modifier)
+
+    return SparseBlendShapes(
+        channel_indices=channel_indices,
+        target_offsets=target_offsets,
+        vertex_indices=np.concatenate(vertex_indices),
+        deltas=to_blender_space(np.concatenate(deltas)),
+        basis=to_blender_space(positions),
+    )
@@ -163,3 +163,152 @@ def test_bake_face_board_animation(
     assert any(
         name == f"{instance.name}_head_{action_name}_shader" for name in expected_node_tree_action_names
     ), "The baked node tree action name is not as expected."
+
+
+def test_bake_body_shape_keys_and_masks(load_full_dna_for_animation):
+    from meta_human_dna.ui.callbacks import get_body_texture_logic_node
+    from meta_human_dna.utilities import get_property_fcurve
+
+    instance = get_active_rig_instance()
+    bpy.context.window_manager.meta_human_dna.current_component_type = "body"
+    source_action = instance.body_rig.animation_data.action
+    frames = range(1, 11)
+
+    # without the driver bones the new action can't drive rig logic, so the shape keys and masks have to be
+    # baked from the source action
+    bpy.ops.meta_human_dna.bake_component_animation(
+        start_frame=frames[0],
+        end_frame=frames[-1],
+        component_type="body",
+        action_name="shape_key_test",
+        replace_action=False,
+        driver_bones=False,
+    )
+    baked_action = instance.body_rig.animation_data.action
+    assert baked_action != source_action, "A new action should be created when not replacing an existing action."
+
+    # evaluate rig logic with the source action to get the expected values
+    texture_logic_node = get_body_texture_logic_node(instance.body_material)
+    expected_values = {}
+    current_frame = bpy.context.scene.frame_current
+    instance.body_rig.animation_data.action = source_action
+    try:
+        for frame in frames:
+            bpy.context.scene.frame_set(frame)
+            instance.apply_dependency_graph_update()
+            instance.update_body_raw_control_values()
+            for shape_key, value in instance.update_body_shape_keys():
+                expected_values.setdefault(get_property_fcurve(shape_key, "value"), []).append(value)
+            if texture_logic_node:
+                for slider_name, value in instance.update_body_texture_masks():
+                    fcurve = get_property_fcurve(texture_logic_node.inputs[slider_name], "default_value")
+                    expected_values.setdefault(fcurve, []).append(value)
+    finally:
+        instance.body_rig.animation_data.action = baked_action
+        bpy.context.scene.frame_set(current_frame)
+
+    assert expected_values, "The body has no shape keys or masks to bake."
+    for fcurve, values in expected_values.items():
+        assert fcurve, "A body shape key or mask value was not baked."
+        baked_values = [fcurve.evaluate(frame) for frame in frames]
+        assert baked_values == pytest.approx(values, abs=1e-4), (
+            f'The baked values of "{fcurve.data_path}" do not match the source action.'
+        )
+
+
+def test_bake_component_animation_reduce_keyframes(load_full_dna_for_animation):
+    instance = get_active_rig_instance()
+    bpy.context.window_manager.meta_human_dna.current_component_type = "body"
+
+    bpy.ops.meta_human_dna.bake_component_animation(
+        start_frame=1,
+        end_frame=10,
+        component_type="body",
+        action_name="reduced_test",
+        replace_action=False,
+        reduce_keyframes=True,
+    )
+
+    action = instance.body_rig.animation_data.action
+    if IS_BLENDER_5:
+        from bpy_extras import anim_utils
+
+        fcurves = anim_utils.action_ensure_channelbag_for_slot(action, action.slots[0]).fcurves
+    else:
+        fcurves = action.fcurves
+
+    assert len(fcurves) > 0, "The baked action should have fcurves."
+    assert all(
+        len(fcurve.keyframe_points) <= 10 for fcurve in fcurves
+    ), "The reduced fcurves should never have more keyframes than baked frames."
+    assert any(
+        len(fcurve.keyframe_points) == 1 for fcurve in fcurves
+    ), "The constant fcurves should have been reduced to a single keyframe."
+
+
+@pytest.mark.parametrize(
+    ("values", "expected_count"),
+    [
+        ([0.5] * 10, 1),
+        ([index / 9 for index in range(10)], 2),
+        ([0.0] * 5 + [1.0] * 5, 4),
+    ],
+)
+def test_reduce_property_keyframes(values: list[float], expected_count: int):
+    import numpy as np
+
+    from meta_human_dna.utilities import get_property_fcurve, set_property_keyframes
+
+    mesh = bpy.data.meshes.new("reduce_keyframes_test")
+    mesh_object = bpy.data.objects.new("reduce_keyframes_test", mesh)
+    mesh_object.shape_key_add(name="Basis")
+    key_block = mesh_object.shape_key_add(name="test")
+    try:
+        set_property_keyframes(
+            owner=key_block,
+            data_path="value",
+            frames=np.arange(1, 11, dtype=np.float64),
+            values=np.array(values, dtype=np.float64),
+            tolerance=1e-4,
+        )
+        fcurve = get_property_fcurve(key_block, "value")
+        assert fcurve, "The shape key value was not keyed."
+        assert len(fcurve.keyframe_points) == expected_count, (
+            f"The fcurve should have been reduced to {expected_count} keyframes, but has {len(fcurve.keyframe_points)}."
+        )
+    finally:
+        action = mesh.shape_keys.animation_data and mesh.shape_keys.animation_data.action
+        bpy.data.objects.remove(mesh_object)
+        bpy.data.meshes.remove(mesh)
+        if action:
+            bpy.data.actions.remove(action)
+
+
+def test_bake_animation_queue(load_full_dna_for_animation):
+    instance = get_active_rig_instance()
+    action_name = instance.body_rig.animation_data.action.name
+
+    bpy.ops.meta_human_dna.bake_animation_queue(
+        jobs=[
+            {
+                "instance_name": instance.name,
+                "action_name": action_name,
+                "start_frame": 1,
+                "end_frame": 5,
+                "component": "body",
+                "baked_action_name": "queue_test_1",
+            },
+            {
+                "instance_name": instance.name,
+                "action_name": action_name,
+                "start_frame": 6,
+                "end_frame": 10,
+                "component": "body",
+                "baked_action_name": "queue_test_2",
+            },
+        ],
+    )
+
+    for baked_action_name in ["queue_test_1", "queue_test_2"]:
+        assert bpy.data.actions.get(baked_action_name), f'The baked action "{baked_action_name}" was not created.'
+    assert instance.body_initialized, "The body rig logic state should be kept between bake jobs."
@@ -106,3 +106,79 @@ def test_skin_weights(
         changed_vertex_group_weight=changed_head_vertex_group_weight,
         tolerance=TOLERANCE[attribute],
     )
+
+
+@pytest.mark.parametrize("linear_modifier", [1.0, 0.01])
+def test_shape_key_deltas(linear_modifier: float):
+    import math
+
+    import bpy
+    import numpy as np
+
+    from mathutils import Matrix
+
+    from meta_human_dna.constants import SHAPE_KEY_DELTA_THRESHOLD
+    from meta_human_dna.dna_io import DNACalibrator
+
+    mesh = bpy.data.meshes.new("shape_key_deltas")
+    mesh.from_pydata([(x * 0.01, y * 0.01, (x + y) * 0.001) for x in range(20) for y in range(20)], [], [])
+    mesh_object = bpy.data.objects.new(mesh.name, mesh)
+    basis = mesh_object.shape_key_add(name="Basis")
+    shape_key = mesh_object.shape_key_add(name="shape_key", from_mix=False)
+    for index, point in enumerate(shape_key.data):
+        # move every third vertex, and nudge the rest by less than the threshold
+        offset = 0.01 * (index % 7) if index % 3 == 0 else SHAPE_KEY_DELTA_THRESHOLD * 0.1
+        point.co += Vector((offset, -offset, offset * 0.5))
+
+    # the deltas as they were calculated one vertex at a time before they were vectorized
+    rotation_matrix = Matrix.Rotation(math.radians(-90), 4, "X")
+    expected_vertex_indices = []
+    expected_deltas = []
+    for vertex_index in range(len(mesh.vertices)):
+        new_delta = rotation_matrix @ (shape_key.data[vertex_index].co.copy() - basis.data[vertex_index].co)
+        if new_delta.length > SHAPE_KEY_DELTA_THRESHOLD:
+            converted_delta = new_delta / linear_modifier
+            expected_vertex_indices.append(vertex_index)
+            expected_deltas.append((converted_delta.x, converted_delta.y, converted_delta.z))
+
+    shape_key_positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    shape_key.data.foreach_get("co", shape_key_positions)
+    basis_positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    basis.data.foreach_get("co", basis_positions)
+    vertex_indices, deltas = DNACalibrator.get_shape_key_deltas(shape_key_positions, basis_positions, linear_modifier)
+
+    bpy.data.objects.remove(mesh_object)
+    bpy.data.meshes.remove(mesh)
+
+    assert expected_vertex_indices
+    assert vertex_indices.tolist() == expected_vertex_indices
+    assert np.allclose(deltas, expected_deltas, atol=1e-6)
+
+
+def test_unchanged_shape_key_deltas():
+    import numpy as np
+
+    from meta_human_dna.constants import SHAPE_KEY_DELTA_THRESHOLD
+    from meta_human_dna.dna_io import DNACalibrator
+
+    rng = np.random.default_rng(0)
+    basis_positions = rng.random(300, dtype=np.float32)
+    shape_key_positions = basis_positions.copy()
+    shape_key_positions[:30] += 0.01
+    dna_vertex_indices, dna_deltas = DNACalibrator.get_shape_key_deltas(shape_key_positions, basis_positions, 0.01)
+
+    # drift that is below the threshold matches the DNA target, so it is not rewritten
+    shape_key_positions[30:] += SHAPE_KEY_DELTA_THRESHOLD * 0.1
+    assert (
+        DNACalibrator.get_changed_shape_key_deltas(
+            shape_key_positions, basis_positions, dna_vertex_indices, dna_deltas, 0.01
+        )
+        is None
+    )
+
+    shape_key_positions[150] += 0.01
+    changed_deltas = DNACalibrator.get_changed_shape_key_deltas(
+        shape_key_positions, basis_positions, dna_vertex_indices, dna_deltas, 0.01
+    )
+    assert changed_deltas is not None
+    assert 50 in changed_deltas[0].tolist()
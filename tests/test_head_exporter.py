@@ -65,3 +65,205 @@ def test_mesh_geometry(
         tolerance=TOLERANCE[attribute],
         output_method="export",
     )
+
+
+def test_incremental_export(exported_head_dna_json_data, temp_folder, dna_folder_name: str):
+    from meta_human_dna.constants import EXPORT_FINGERPRINTS_FOLDER
+    from meta_human_dna.dna_io import DNAExporter
+    from meta_human_dna.utilities import get_active_head
+    from utilities.dna_data import get_dna_json_data
+
+    head = get_active_head()
+    assert head and head.rig_instance
+
+    export_folder = temp_folder / "export" / dna_folder_name
+    head.rig_instance.output_incremental = True
+    mesh = head.rig_instance.head_mesh.data
+    position = mesh.vertices[0].co.copy()
+    try:
+        # the first incremental export has no previous fingerprints, so it writes everything and saves them
+        exporter = DNAExporter(file_name="head.dna", instance=head.rig_instance, linear_modifier=head.linear_modifier)
+        exporter.run()
+        assert not exporter._fingerprints.is_incremental
+        assert exporter._fingerprints.file_path.parent == EXPORT_FINGERPRINTS_FOLDER
+        assert not list(export_folder.glob("*.json"))
+
+        # nothing changed since the previous export, so the bones and every mesh are reused from it
+        exporter = DNAExporter(file_name="head.dna", instance=head.rig_instance, linear_modifier=head.linear_modifier)
+        exporter.run()
+        assert exporter._fingerprints.is_incremental
+        assert exporter._fingerprints.changed_count == 0
+        assert get_dna_json_data(export_folder / "head.dna", export_folder / "head_incremental.json") == (
+            exported_head_dna_json_data
+        )
+
+        # only the mesh that changed is rewritten, the layout and bones are reused from the previous export
+        mesh.vertices[0].co.x += 0.01
+        exporter = DNAExporter(file_name="head.dna", instance=head.rig_instance, linear_modifier=head.linear_modifier)
+        exporter.run()
+        fingerprints = exporter._fingerprints
+        assert fingerprints.is_incremental
+        assert (fingerprints.changed_count, fingerprints.unchanged_count) == (1, 2)
+        assert fingerprints.current["joints"] == fingerprints.previous["joints"]
+        assert fingerprints.current["meshes"] != fingerprints.previous["meshes"]
+    finally:
+        head.rig_instance.output_incremental = False
+        mesh.vertices[0].co = position
+        DNAExporter(file_name="head.dna", instance=head.rig_instance, linear_modifier=head.linear_modifier).run()
+
+
+def test_incremental_json_export(exported_head_dna_json_data):
+    from meta_human_dna.dna_io import DNAExporter
+    from meta_human_dna.utilities import get_active_head
+
+    head = get_active_head()
+    assert head and head.rig_instance
+
+    output_format = head.rig_instance.output_format
+    head.rig_instance.output_format = "json"
+    head.rig_instance.output_incremental = True
+    try:
+        for _ in range(2):
+            exporter = DNAExporter(
+                file_name="head_json.dna", instance=head.rig_instance, linear_modifier=head.linear_modifier
+            )
+            valid, title, message, _fix = exporter.run()
+            assert valid, f"{title}: {message}"
+
+        # the second export reads the previous JSON export back in to reuse its unchanged data
+        assert exporter._fingerprints.is_incremental
+        assert exporter._fingerprints.changed_count == 0
+    finally:
+        head.rig_instance.output_format = output_format
+        head.rig_instance.output_incremental = False
+
+
+def test_bone_transforms(load_head_dna):
+    import math
+
+    from mathutils import Matrix
+
+    from meta_human_dna.constants import EXTRA_BONES, SCALE_FACTOR
+    from meta_human_dna.dna_io import BoneTransformsCache, DNAExporter
+    from meta_human_dna.utilities import get_active_head
+
+    head = get_active_head()
+    assert head and head.head_rig_object
+    armature_object = head.head_rig_object
+
+    indices, bone_names, hierarchy, is_leaf, translations, rotations = DNAExporter.get_bone_transforms(armature_object)
+
+    # the transforms as they were calculated one bone at a time before they were vectorized
+    ignored_bone_names = [name for name, _ in EXTRA_BONES]
+    bones = [bone for bone in armature_object.data.bones if bone.name not in ignored_bone_names]
+    global_matrix = Matrix.Rotation(math.radians(-90), 4, "X")
+    assert indices == list(range(len(bones)))
+    assert bone_names == [bone.name for bone in bones]
+    for index, bone in enumerate(bones):
+        if index == 0:
+            matrix = global_matrix @ bone.matrix_local
+        else:
+            matrix = bone.parent.matrix_local.inverted_safe() @ bone.matrix_local
+        translation, rotation, _ = matrix.decompose()
+
+        parent_index = index
+        if index and bone.parent.name not in ignored_bone_names:
+            parent_index = bone_names.index(bone.parent.name)
+        assert hierarchy[index] == parent_index
+        assert is_leaf[index] == (not bone.children)
+        assert (Vector(translations[index]) - translation * SCALE_FACTOR).length < 1e-4
+        euler_rotation = Euler([math.radians(angle) for angle in rotations[index]], "XYZ")
+        assert euler_rotation.to_quaternion().rotation_difference(rotation).angle < 1e-4
+
+    # with a cache, the transforms are memoized until the armature changes
+    cache = BoneTransformsCache()
+    assert DNAExporter.get_bone_transforms(armature_object, cache=cache)[4] == translations
+    assert cache._transforms
+    assert DNAExporter.get_bone_transforms(armature_object, cache=cache)[4] == translations
+
+
+def test_vertex_colors_round_trip(exported_head_dna_json_data, temp_folder, dna_folder_name: str):
+    from types import SimpleNamespace
+
+    import bpy
+    import numpy as np
+
+    from meta_human_dna.constants import VERTEX_COLOR_ATTRIBUTE_NAME
+    from meta_human_dna.dna_io import DNAImporter
+    from meta_human_dna.utilities import get_active_head
+
+    head = get_active_head()
+    assert head and head.rig_instance
+    source_mesh = head.rig_instance.head_mesh.data
+    source_color_attribute = source_mesh.color_attributes.active_color
+    assert source_color_attribute
+    source_colors = np.empty(len(source_color_attribute.data) * 4, dtype=np.float32)
+    source_color_attribute.data.foreach_get("color_srgb", source_colors)
+
+    # import the exported head mesh along with the vertex colors that were exported next to it
+    importer = DNAImporter(
+        instance=head.rig_instance,
+        import_properties=SimpleNamespace(),
+        linear_modifier=head.linear_modifier,
+        dna_file_path=temp_folder / "export" / dna_folder_name / "head.dna",
+    )
+    mesh_data = importer.decode_mesh(0, import_vertex_groups=False)
+    mesh = bpy.data.meshes.new("vertex_colors_round_trip")
+    try:
+        importer.set_mesh_vertex_positions(mesh_data, mesh)
+        importer.set_mesh_face_layout(mesh_data, mesh)
+        importer.set_vertex_colors(mesh_data, mesh)
+        assert not importer._default_vertex_color_layout
+
+        color_attribute = mesh.color_attributes.get(VERTEX_COLOR_ATTRIBUTE_NAME)
+        assert color_attribute
+        colors = np.empty(len(color_attribute.data) * 4, dtype=np.float32)
+        color_attribute.data.foreach_get("color_srgb", colors)
+    finally:
+        bpy.data.meshes.remove(mesh)
+
+    # the faces and their loops are exported in the same order, so each loop keeps its color
+    assert colors.shape == source_colors.shape
+    assert np.allclose(colors, source_colors, atol=1 / 255)
+
+
+def test_seam_vertex_normals(load_head_dna):
+    import math
+
+    import numpy as np
+
+    from mathutils import Matrix
+
+    from meta_human_dna.constants import SCALE_FACTOR
+    from meta_human_dna.dna_io import DNAExporter
+    from meta_human_dna.ui.callbacks import get_active_rig_instance
+
+    instance = get_active_rig_instance()
+    assert instance and instance.head_mesh
+    mesh = instance.head_mesh.data
+    mesh_data = DNAExporter.get_split_mesh_export_data(instance.head_mesh)
+    assert len(mesh_data.vertex_indices) > len(mesh.vertices), "The head mesh was not split along its UV seams"
+
+    # the vertices split along a UV seam should keep the smooth normal of the original vertex
+    normals = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertex_normals.foreach_get("vector", normals)
+    rotation_matrix = np.array(Matrix.Rotation(math.radians(-90), 3, "X"), dtype=np.float32)
+    expected = (normals.reshape(-1, 3)[mesh_data.vertex_indices] @ rotation_matrix.T) * SCALE_FACTOR
+    assert np.allclose(mesh_data.normals, expected, atol=1e-5), "The split vertex normals do not match the mesh"
+
+
+def test_copy_image_file_replaces_hard_link(temp_folder):
+    from meta_human_dna.dna_io import DNAExporter
+
+    source_path = temp_folder / "hard_link_source.png"
+    target_path = temp_folder / "hard_link_target.png"
+    source_path.write_bytes(b"source")
+    target_path.unlink(missing_ok=True)
+    target_path.hardlink_to(source_path)
+
+    # the hard link left by an earlier export should be replaced with a copy, so writing the exported image
+    # doesn't change the source texture
+    DNAExporter.copy_image_file(source_path, target_path)
+    assert not target_path.samefile(source_path), "The exported image is still a hard link to the source"
+    target_path.write_bytes(b"exported")
+    assert source_path.read_bytes() == b"source", "Writing the exported image changed the source texture"
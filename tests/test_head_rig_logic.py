@@ -6,15 +6,17 @@ from pathlib import Path
 from pprint import pformat
 
 import bpy
+import numpy as np
 import pytest
 
 from mathutils import Vector
 
 from constants import TEST_FBX_POSES_FOLDER, TEST_JSON_POSES_FOLDER
-from meta_human_dna.constants import CUSTOM_BONE_SHAPE_NAME, CUSTOM_BONE_SHAPE_SCALE, POSES_FOLDER
+from meta_human_dna.constants import CUSTOM_BONE_SHAPE_NAME, CUSTOM_BONE_SHAPE_SCALE, POSES_FOLDER, SCALE_FACTOR
 from meta_human_dna.ui.callbacks import (
     get_active_rig_instance,
 )
+from meta_human_dna.utilities import get_sparse_blend_shapes
 from utilities.bones import get_bone_differences, show_differences
 
 
@@ -154,3 +156,110 @@ def test_active_face_material(load_head_dna, enum_index, active_face_material_na
     assert instance.active_face_material == enum_index, (
         f'The active face material should be "{enum_index}" ' f'but is "{instance.active_face_material}"'
     )
+
+
+def test_head_sparse_blend_shapes(load_head_dna):
+    instance = get_active_rig_instance()
+    assert instance, "No active rig logic found"
+    instance.head_initialize()
+
+    mesh_index = 0
+    reader = instance.head_dna_reader
+    mesh_object = instance.head_mesh_index_lookup[mesh_index]
+    blend_shapes = get_sparse_blend_shapes(reader=reader, mesh_index=mesh_index, linear_modifier=1 / SCALE_FACTOR)
+    assert blend_shapes, f'The mesh "{mesh_object.name}" has no blend shapes'
+
+    # the basis should match the imported vertex positions
+    positions = np.empty(len(mesh_object.data.vertices) * 3, dtype=np.float32)  # type: ignore[attr-defined]
+    mesh_object.data.vertices.foreach_get("co", positions)  # type: ignore[attr-defined]
+    assert np.allclose(blend_shapes.basis.ravel(), positions, atol=1e-5), "The basis does not match the mesh"
+
+    # a fully weighted channel should offset its target vertices by exactly the DNA deltas
+    target_index = 0
+    channel_weights = np.zeros(reader.getBlendShapeChannelCount(), dtype=np.float32)
+    channel_weights[reader.getBlendShapeChannelIndex(mesh_index, target_index)] = 1.0
+    offsets = blend_shapes.evaluate(channel_weights).reshape(-1, 3) - blend_shapes.basis
+
+    vertex_indices = list(reader.getBlendShapeTargetVertexIndices(mesh_index, target_index))
+    expected = (
+        np.column_stack(
+            (
+                reader.getBlendShapeTargetDeltaXs(mesh_index, target_index),
+                [-value for value in reader.getBlendShapeTargetDeltaZs(mesh_index, target_index)],
+                reader.getBlendShapeTargetDeltaYs(mesh_index, target_index),
+            )
+        )
+        / SCALE_FACTOR
+    )
+    assert np.allclose(offsets[vertex_indices], expected, atol=1e-5), "The evaluated deltas do not match the DNA"
+
+
+def test_head_sparse_blend_shapes_keep_rest_shape(load_head_dna):
+    from meta_human_dna.constants import SPARSE_BLEND_SHAPES_SHAPE_KEY_NAME
+
+    instance = get_active_rig_instance()
+    assert instance, "No active rig logic found"
+    instance.head_initialize()
+
+    sparse_blend_shapes = instance.head_sparse_blend_shapes
+    if not sparse_blend_shapes:
+        pytest.skip("All the head meshes have shape keys")
+
+    mesh_index, blend_shapes = next(iter(sparse_blend_shapes.items()))
+    mesh_object = instance.head_mesh_index_lookup[mesh_index]
+    rest_positions = np.empty(len(mesh_object.data.vertices) * 3, dtype=np.float32)  # type: ignore[attr-defined]
+    mesh_object.data.vertices.foreach_get("co", rest_positions)  # type: ignore[attr-defined]
+
+    try:
+        instance.update_head_sparse_blend_shapes()
+
+        # the evaluated positions should be written to their own shape key, not to the mesh vertices
+        key_block = mesh_object.data.shape_keys.key_blocks.get(SPARSE_BLEND_SHAPES_SHAPE_KEY_NAME)  # type: ignore[attr-defined]
+        assert key_block, "The sparse blend shapes shape key was not created"
+        assert key_block.value == 1.0, "The sparse blend shapes shape key should be fully applied"
+        positions = np.empty_like(rest_positions)
+        key_block.data.foreach_get("co", positions)
+        channel_weights = np.asarray(instance.head_instance.getBlendShapeOutputs(), dtype=np.float32)
+        expected = blend_shapes.evaluate(channel_weights, basis=rest_positions.reshape(-1, 3))
+        assert np.allclose(positions, expected, atol=1e-6), "The shape key does not hold the evaluated positions"
+
+        mesh_object.data.vertices.foreach_get("co", positions)  # type: ignore[attr-defined]
+        assert np.array_equal(positions, rest_positions), "The sparse evaluation changed the rest shape"
+    finally:
+        instance.reset_head_sparse_blend_shapes()
+
+    assert not mesh_object.data.shape_keys, "The sparse blend shapes shape key was not removed"  # type: ignore[attr-defined]
+    mesh_object.data.vertices.foreach_get("co", positions)  # type: ignore[attr-defined]
+    assert np.array_equal(positions, rest_positions), "Resetting the sparse evaluation changed the rest shape"
+
+
+def test_materialize_head_shape_key(load_head_dna):
+    instance = get_active_rig_instance()
+    assert instance, "No active rig logic found"
+    instance.head_initialize()
+
+    mesh_index = 0
+    reader = instance.head_dna_reader
+    mesh_object = instance.head_mesh_index_lookup[mesh_index]
+    had_shape_keys = bool(mesh_object.data.shape_keys)  # type: ignore[attr-defined]
+    channel_index = reader.getBlendShapeChannelIndex(mesh_index, 0)
+    name = f"{reader.getMeshName(mesh_index)}__{reader.getBlendShapeChannelName(channel_index)}"
+
+    # remove the shape key if it was imported, so it has to be materialized from the DNA
+    if had_shape_keys:
+        key_block = mesh_object.data.shape_keys.key_blocks.get(name)  # type: ignore[attr-defined]
+        if key_block:
+            mesh_object.shape_key_remove(key_block)
+
+    try:
+        key_block = instance.materialize_head_shape_key(name)
+        assert key_block, f'The shape key "{name}" was not materialized'
+        assert key_block.name == name, f'The shape key should be named "{name}" but is "{key_block.name}"'
+        assert key_block in instance.head_shape_key_blocks.get(channel_index, []), (
+            f'The shape key "{name}" is not cached in the head shape key blocks'
+        )
+    finally:
+        if not had_shape_keys:
+            mesh_object.shape_key_clear()
+        instance.data.clear()
+        instance.initialize()